@@ -17,57 +17,74 @@ PERSONA_WEIGHTS = {
     }
 }
 
-def run_agent_0_persona(state: GraphState) -> GraphState:
-    """
-    Agent 0: Assesses VC investor's investment persona via CLI input.
-    
-    docstring: Asks the user 5 questions to determine their investment persona.
-    """
-    
-    questions = [
-        "1. Do you pursue high returns even with high risk? (1-5)",
-        "2. How much experience do you have investing in early-stage (Seed/Series A) startups? (1-5)",
-        "3. How important is a stable revenue model and cash flow? (1-5)",
-        "4. How much do you consider ESG (Environmental, Social, Governance) factors in investment decisions? (1-5)",
-        "5. Do you prefer rapid growth or stable growth? (1: Stable, 5: Rapid)"
-    ]
-    
-    print("\n" + "="*70)
-    print("🏦 VC INVESTMENT PERSONA ASSESSMENT (AGENT 0)")
-    print("="*70)
+QUESTIONS = [
+    "1. Do you pursue high returns even with high risk? (1-5)",
+    "2. How much experience do you have investing in early-stage (Seed/Series A) startups? (1-5)",
+    "3. How important is a stable revenue model and cash flow? (1-5)",
+    "4. How much do you consider ESG (Environmental, Social, Governance) factors in investment decisions? (1-5)",
+    "5. Do you prefer rapid growth or stable growth? (1: Stable, 5: Rapid)"
+]
+
+
+def _ask_persona_answers() -> list:
+    """CLI로 5개 질문에 대한 답변(1-5) 입력받기"""
     print("\nPlease answer the following questions (Scale 1-5):\n")
     
-    answers = {}
-    for question in questions:
+    answers = []
+    for question in QUESTIONS:
         print(question)
         while True:
             try:
                 answer = int(input("Answer: "))
                 if 1 <= answer <= 5:
-                    answers[question] = answer
+                    answers.append(answer)
                     break
                 else:
                     print("Please enter a number between 1-5.")
             except ValueError:
                 print("Please enter a number.")
-    
+    return answers
+
+
+def classify_persona(answers: list) -> str:
+    """5개 답변(1-5)으로 페르소나 결정"""
+    if len(answers) != len(QUESTIONS) or not all(isinstance(a, int) and 1 <= a <= 5 for a in answers):
+        raise ValueError(f"persona answers must be {len(QUESTIONS)} integers between 1-5, got {answers!r}")
+
     # 페르소나 결정 로직
-    risk_score = answers[questions[0]]
-    experience_score = answers[questions[1]]
-    stability_score = answers[questions[2]]
-    esg_score = answers[questions[3]]
-    growth_score = answers[questions[4]]
+    risk_score, experience_score, stability_score, esg_score, growth_score = answers
     
     aggressive_score = (risk_score + experience_score + growth_score) / 3
     conservative_score = (stability_score + esg_score + (6 - growth_score)) / 3
     
-    if aggressive_score > conservative_score:
-        persona = "aggressive"
-        weights = PERSONA_WEIGHTS["aggressive"]
+    return "aggressive" if aggressive_score > conservative_score else "conservative"
+
+
+def run_agent_0_persona(state: GraphState) -> GraphState:
+    """
+    Agent 0: Assesses VC investor's investment persona via CLI input.
+    
+    docstring: Asks the user 5 questions to determine their investment persona.
+               Headless runs can preset `investor_persona` or supply
+               `persona_answers` in the initial state instead.
+    """
+    print("\n" + "="*70)
+    print("🏦 VC INVESTMENT PERSONA ASSESSMENT (AGENT 0)")
+    print("="*70)
+
+    preset = state.get("investor_persona")
+    if preset:
+        if preset not in PERSONA_WEIGHTS:
+            raise ValueError(f"Unknown persona: {preset!r} (expected one of {list(PERSONA_WEIGHTS)})")
+        persona = preset
+    elif state.get("persona_answers"):
+        persona = classify_persona(list(state["persona_answers"]))
+    else:
+        persona = classify_persona(_ask_persona_answers())
+    
+    if persona == "aggressive":
         rationale = f"[INVESTOR PERSONA ANALYSIS: AGGRESSIVE INVESTOR]\n"
     else:
-        persona = "conservative"
-        weights = PERSONA_WEIGHTS["conservative"]
         rationale = f"[INVESTOR PERSONA ANALYSIS: CONSERVATIVE INVESTOR]\n"
     
     # (간결성을 위해 상세 근거 문구는 생략)
@@ -4,15 +4,30 @@
 import json
 import re
 import os
+import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 
 # 공유 자원 및 상태 import
 from graph_state import GraphState
-from config import llm_mini, simple_web_search  # web_search 대신
+from config import get_llm_mini, get_llm_mini_json, get_rag_embeddings, simple_web_search, LLM_MINI_MODEL  # web_search 대신
 from RWA_Investment_Agent2.agent0_persona import PERSONA_WEIGHTS # Agent 0의 가중치 사용
+from score_store import get_score_store, score_records
+from startup_sources import iter_startups, iter_batches
+from prefilter import prefilter_startups, audit_recall
+from control_flow import MAX_DECISIONS
+from metrics import bind_context
 
 # --- Agent 1 Constants ---
+AGENT1_MAX_WORKERS = int(os.getenv("AGENT1_MAX_WORKERS", 4))  # 동시 평가 스타트업 수
+AGENT1_BATCH_SIZE = int(os.getenv("AGENT1_BATCH_SIZE", 64))   # 한 번에 읽어 평가하는 스타트업 수
+AGENT1_TOP_K = int(os.getenv("AGENT1_TOP_K", MAX_DECISIONS))  # evaluation_results에 남길 상위 개수 (루프가 소비 가능한 최대치)
+AGENT1_PREFILTER_TOP_N = int(os.getenv("AGENT1_PREFILTER_TOP_N", 0))  # 임베딩 사전 필터 후 평가할 개수 (0이면 비활성화)
+AGENT1_PREFILTER_AUDIT_SAMPLE = int(os.getenv("AGENT1_PREFILTER_AUDIT_SAMPLE", 0))  # recall 측정용으로 전체 경로 평가할 탈락 표본 수
+AGENT1_SINGLE_CALL = os.getenv("AGENT1_SINGLE_CALL", "").lower() in ("1", "true", "yes")  # 정보 추출+점수를 LLM 1회 호출로
+
 EVALUATION_CRITERIA = {
     "seed_early": {"name": "Seed/Early Stage", "description": "초기 단계 혁신성 및 잠재력"},
     "regional_esg": {"name": "Regional/ESG", "description": "지역 영향력 및 ESG 관련성"},
@@ -40,6 +55,45 @@ Example:
 eval_prompt = ChatPromptTemplate.from_template(EVAL_TEMPLATE_STRING)
 criteria_json_str = json.dumps(EVALUATION_CRITERIA, indent=2, ensure_ascii=False)
 
+EXTRACTION_SYSTEM_PROMPT = """
+You are a data extraction expert. Extract website (https://...), region (USA, Asia...),
+and funding_stage (Seed, Series A...) from the search results.
+If info is unavailable, infer reasonably. Return JSON only.
+{ "website": "...", "region": "...", "funding_stage": "..." }
+        """
+
+# 단일 호출 모드: 정보 추출 + 4개 기준 점수를 하나의 JSON 스키마로 (JSON 모드 LLM)
+SINGLE_CALL_TEMPLATE_STRING = """
+You are a VC analyst and data extraction expert. From the company info and search results:
+1. Extract website (https://...), region (USA, Asia...) and funding_stage (Seed, Series A...).
+   If info is unavailable, infer reasonably.
+2. Evaluate the startup (0-100) based on criteria.
+Criteria: {criteria_json}
+
+Company: {company}
+Info: {strength}
+Search Results:
+{context}
+
+Respond with *only* this JSON object:
+{{
+    "website": "...", "region": "...", "funding_stage": "...",
+    "scores": {{
+        "seed_early": {{"score": 0, "rationale": "..."}},
+        "regional_esg": {{"score": 0, "rationale": "..."}},
+        "growth_partnership": {{"score": 0, "rationale": "..."}},
+        "regulation_monetization": {{"score": 0, "rationale": "..."}}
+    }}
+}}
+"""
+single_call_prompt = ChatPromptTemplate.from_template(SINGLE_CALL_TEMPLATE_STRING)
+
+# 평가 버전: 프롬프트/기준/모델/호출 모드가 바뀌면 저장된 원점수를 모두 무효화
+_EVAL_PROMPTS = [SINGLE_CALL_TEMPLATE_STRING] if AGENT1_SINGLE_CALL else [EVAL_TEMPLATE_STRING, EXTRACTION_SYSTEM_PROMPT]
+EVAL_VERSION = hashlib.sha256(
+    "\x00".join(_EVAL_PROMPTS + [criteria_json_str, LLM_MINI_MODEL]).encode("utf-8")
+).hexdigest()[:16]
+
 
 def _agent1_extract_additional_info(startup_name: str, search_results: list) -> dict:
     """Helper function for Agent 1 to extract structured info from search."""
@@ -53,17 +107,12 @@ def _agent1_extract_additional_info(startup_name: str, search_results: list) ->
     ])
 
     extraction_prompt = ChatPromptTemplate.from_messages([
-        SystemMessage(content="""
-You are a data extraction expert. Extract website (https://...), region (USA, Asia...),
-and funding_stage (Seed, Series A...) from the search results.
-If info is unavailable, infer reasonably. Return JSON only.
-{ "website": "...", "region": "...", "funding_stage": "..." }
-        """),
+        SystemMessage(content=EXTRACTION_SYSTEM_PROMPT),
         HumanMessage(content=f"Company: {startup_name}\nSearch Results:\n{search_context}\n\nExtract info.")
     ])
 
     try:
-        response = llm_mini.invoke(extraction_prompt.format_messages())
+        response = get_llm_mini().invoke(extraction_prompt.format_messages())
         content = response.content.strip()
         if content.startswith("```"):
             content = re.sub(r"```(json)?", "", content).strip()
@@ -72,102 +121,214 @@ If info is unavailable, infer reasonably. Return JSON only.
         print(f"      정보 추출 실패: {str(e)}")
         return {"website": "Unknown", "region": "Unknown", "funding_stage": "Unknown"}
 
-# run_agent_1_search 함수에서 검색 부분만 수정
-def run_agent_1_search(state: GraphState) -> GraphState:
-    """Agent 1: Searches and ranks startups based on persona."""
-    print("\n" + "="*70)
-    print("🔍 STARTUP SEARCH & EVALUATION (AGENT 1)")
-    print("="*70 + "\n")
-
-    persona = state["investor_persona"]
-    weights = PERSONA_WEIGHTS[persona]
+def _agent1_evaluate_single_call(startup: dict, search_results: list):
+    """Helper: extracts info and scores one startup in a single JSON-mode LLM call. Returns None on failure."""
+    startup_name = startup['name']
+    search_context = "\n".join([
+        (res.get('content', '') if isinstance(res, dict) else str(res))
+        for res in search_results
+    ]) or "Search unavailable."
 
+    content = ""
     try:
-        with open('startups.json', 'r', encoding='utf-8') as f:
-            startup_list = json.load(f)
-    except FileNotFoundError:
-        raise FileNotFoundError("startups.json 파일이 없습니다. 프로젝트 루트에 생성해주세요.")
+        messages = single_call_prompt.format_messages(
+            criteria_json=criteria_json_str,
+            company=startup_name,
+            strength=startup['strength'],
+            context=search_context,
+        )
+        content = get_llm_mini_json().invoke(messages).content.strip()
+        data = json.loads(content)
+
+        scores_data = data["scores"]
+        for criterion in EVALUATION_CRITERIA:
+            float(scores_data[criterion]["score"])  # 누락/비정상 점수는 평가 실패로 처리
+
+        print(f"    ✓ [{startup_name}] 평가 완료 (단일 호출)")
+        return {
+            "name": startup_name,
+            "sector": startup['sector'],
+            "strength": startup['strength'],
+            **{key: data.get(key) or "Unknown" for key in ("website", "region", "funding_stage")},
+            "scores": scores_data,
+        }
 
-    print(f"✅ 페르소나: {persona.upper()}. {len(startup_list)}개 스타트업 평가 시작.")
+    except Exception as e:
+        print(f"    ⚠️ [{startup_name}] 평가 실패: {str(e)} | Raw: {content[:100]}...")
+        return None
 
-    evaluation_results = []
 
-    for idx, startup in enumerate(startup_list, 1):
-        startup_name = startup['name']
-        print(f"📊 [{idx}/{len(startup_list)}] 평가 중: {startup_name}")
+def _agent1_evaluate_startup(idx: int, total: int, startup: dict):
+    """Helper: searches, extracts and scores one startup (raw, persona-independent). Returns None on failure."""
+    startup_name = startup['name']
+    print(f"📊 [{f'{idx}/{total}' if total else idx}] 평가 중: {startup_name}")
 
-        search_context = "Search unavailable."
-        additional_info = {"website": "Unknown", "region": "Unknown", "funding_stage": "Unknown"}
-        search_results_list = []
+    search_context = "Search unavailable."
+    additional_info = {"website": "Unknown", "region": "Unknown", "funding_stage": "Unknown"}
+    search_results_list = []
 
-        search_query = f"{startup_name} blockchain tokenization official website funding"
+    search_query = f"{startup_name} blockchain tokenization official website funding"
 
-        try:
-            # simple_web_search 사용
-            search_results = simple_web_search(search_query, max_results=5)
-            
-            if isinstance(search_results, list) and search_results:
-                search_results_list = search_results
-                search_context = "\n".join([
-                    (res.get('content', '') if isinstance(res, dict) else str(res))[:200]
-                    for res in search_results
-                ])
-            else:
-                search_context = "Limited search results."
+    try:
+        # simple_web_search 사용
+        search_results = simple_web_search(search_query, max_results=5)
+        
+        if isinstance(search_results, list) and search_results:
+            search_results_list = search_results
+            search_context = "\n".join([
+                (res.get('content', '') if isinstance(res, dict) else str(res))[:200]
+                for res in search_results
+            ])
+        else:
+            search_context = "Limited search results."
+
+        if AGENT1_SINGLE_CALL:
+            return _agent1_evaluate_single_call(startup, search_results_list)
+
+        additional_info = _agent1_extract_additional_info(startup_name, search_results_list)
 
-            additional_info = _agent1_extract_additional_info(startup_name, search_results_list)
+    except Exception as e:
+        print(f"    ⚠️ [{startup_name}] 검색 또는 처리 실패: {type(e).__name__}: {str(e)}")
+        if AGENT1_SINGLE_CALL:
+            return _agent1_evaluate_single_call(startup, search_results_list)
 
-        except Exception as e:
-            print(f"    ⚠️ 검색 또는 처리 실패: {type(e).__name__}: {str(e)}")
+    combined_context = f"Info: {startup['strength']}\nSearch: {search_context}"
+
+    content = ""
+    try:
+        messages = eval_prompt.format_messages(
+            criteria_json=criteria_json_str,
+            context=combined_context
+        )
 
-        combined_context = f"Info: {startup['strength']}\nSearch: {search_context}"
+        response = get_llm_mini().invoke(messages)
+        content = response.content.strip()
 
-        content = ""
-        try:
-            messages = eval_prompt.format_messages(
-                criteria_json=criteria_json_str,
-                context=combined_context
-            )
+        if content.startswith("```"):
+            content = re.sub(r"```(json)?", "", content).strip()
+
+        scores_data = json.loads(content)
+        for criterion in EVALUATION_CRITERIA:
+            float(scores_data[criterion]["score"])  # 누락/비정상 점수는 평가 실패로 처리
 
-            response = llm_mini.invoke(messages)
-            content = response.content.strip()
+        print(f"    ✓ [{startup_name}] 평가 완료")
+        return {
+            "name": startup_name,
+            "sector": startup['sector'],
+            "strength": startup['strength'],
+            **additional_info,
+            "scores": scores_data,
+        }
+
+    except Exception as e:
+        print(f"    ⚠️ [{startup_name}] 평가 실패: {str(e)} | Raw: {content[:100]}...")
+        return None
 
-            if content.startswith("```"):
-                content = re.sub(r"```(json)?", "", content).strip()
 
-            scores_data = json.loads(content)
+def run_agent_1_search(state: GraphState) -> GraphState:
+    """Agent 1: Searches and ranks startups based on persona."""
+    print("\n" + "="*70)
+    print("🔍 STARTUP SEARCH & EVALUATION (AGENT 1)")
+    print("="*70 + "\n")
 
-            total_score = sum(
-                scores_data[criterion]["score"] * weights[criterion]
-                for criterion in weights.keys()
+    persona = state["investor_persona"]
+    weights = state.get("persona_weights") or PERSONA_WEIGHTS[persona]
+
+    startups_path = state.get("startups_path") or 'startups.json'
+    startups = iter_startups(startups_path)  # JSONL/CSV는 한 줄씩 지연 로딩
+
+    # 원점수는 페르소나와 무관 → 지문(내용+평가 버전)이 같은 저장 점수 재사용, 신규/변경 스타트업만 검색+LLM 평가
+    store = get_score_store()
+    if store is not None:
+        store.purge(expired_only=True)
+
+    # (선택) 로컬 임베딩 유사도로 상위 N개만 검색+LLM 평가 경로로 보냄
+    prefilter_report = None
+    audit_sample = []
+    if AGENT1_PREFILTER_TOP_N > 0:
+        embeddings = get_rag_embeddings()
+        if embeddings is None:
+            print("⚠️ 임베딩을 사용할 수 없어 사전 필터를 건너뜁니다.")
+        else:
+            selected, audit_sample, prefilter_report = prefilter_startups(
+                startups, EVALUATION_CRITERIA, weights, embeddings, AGENT1_PREFILTER_TOP_N,
+                batch_size=AGENT1_BATCH_SIZE, audit_sample=AGENT1_PREFILTER_AUDIT_SAMPLE,
             )
+            startups = iter(selected)
+            print(f"🧭 사전 필터: {prefilter_report['seen']}개 중 상위 {prefilter_report['selected']}개 선별 "
+                  f"(N={AGENT1_PREFILTER_TOP_N}), 감사 표본 {len(audit_sample)}개")
 
-            domain_fit = (scores_data["seed_early"]["score"] + scores_data["growth_partnership"]["score"]) / 200
-            credibility_score = (scores_data["regulation_monetization"]["score"] + scores_data["regional_esg"]["score"]) / 200
-
-            evaluation_results.append({
-                "name": startup_name,
-                "sector": startup['sector'],
-                "strength": startup['strength'],
-                **additional_info,
-                "scores": scores_data,
-                "total_score": round(total_score, 2),
-                "domain_fit": round(domain_fit, 2),
-                "credibility_score": round(credibility_score, 2),
-                "final_score": round(total_score / 100, 2),
-            })
-            print(f"    ✓ 총점: {total_score:.2f}/100")
+    print(f"✅ 페르소나: {persona.upper()}. {startups_path} 평가 시작 "
+          f"(배치 {AGENT1_BATCH_SIZE}개, 동시 {AGENT1_MAX_WORKERS}개, 상위 {AGENT1_TOP_K}개 유지).")
 
+    def _evaluate(item):
+        idx, startup = item
+        try:
+            raw = _agent1_evaluate_startup(idx, None, startup)
+            if raw is not None and store is not None:
+                store.put(startup, raw, EVAL_VERSION)
+            return raw
         except Exception as e:
-            print(f"    ⚠️ 평가 실패: {str(e)} | Raw: {content[:100]}...")
+            # 스타트업 단위 오류 격리 (다른 스타트업 평가에 영향 없음)
+            print(f"    ⚠️ [{startup.get('name', '?')}] 평가 실패: {type(e).__name__}: {str(e)}")
+            return None
+
+    # 고정 크기 최소 힙 (total_score, -입력순서, 레코드): 동점이면 나중에 들어온 항목부터 밀려남
+    top_k = []
+    seen = reused = evaluated = 0
+    selected_scores = []  # 사전 필터 감사용: 선별된 스타트업의 전체 경로 점수
+
+    def _full_path(batch, offset):
+        """저장된 원점수 재사용, 없으면 검색+LLM 평가 (배치 순서대로 원점수 또는 None)"""
+        nonlocal reused, evaluated
+        raw_results = [store.get(startup, EVAL_VERSION) if store else None for startup in batch]
+        pending = [(offset + i, startup) for i, (startup, raw) in enumerate(zip(batch, raw_results), 1) if raw is None]
+        reused += len(batch) - len(pending)
+        evaluated += len(pending)
+        for (idx, _), raw in zip(pending, executor.map(bind_context(_evaluate), pending)):
+            raw_results[idx - offset - 1] = raw
+        return raw_results
+
+    with ThreadPoolExecutor(max_workers=max(1, AGENT1_MAX_WORKERS)) as executor:
+        for batch in iter_batches(startups, AGENT1_BATCH_SIZE):
+            raw_results = _full_path(batch, seen)
+
+            # 배치 단위 행렬곱으로 가중 점수 계산 후 힙에 반영
+            scored = [(seen + i, raw) for i, raw in enumerate(raw_results, 1) if raw is not None]
+            for (seq, _), record in zip(scored, score_records([raw for _, raw in scored], weights)):
+                if audit_sample:
+                    selected_scores.append(record["total_score"])
+                entry = (record["total_score"], -seq, record)
+                if len(top_k) < AGENT1_TOP_K:
+                    heapq.heappush(top_k, entry)
+                else:
+                    heapq.heappushpop(top_k, entry)
+            seen += len(batch)
+
+        if audit_sample:
+            # 탈락 표본도 전체 경로로 평가해 recall 측정 (랭킹에는 넣지 않음)
+            audited = [raw for raw in _full_path(audit_sample, seen) if raw is not None]
+            sample_scores = [record["total_score"] for record in score_records(audited, weights)]
+            recall, recall_k = audit_recall(selected_scores, sample_scores, AGENT1_TOP_K)
+            prefilter_report.update({
+                "audit_evaluated": len(audited),
+                "recall_at_k": round(recall, 3) if recall is not None else None,
+                "recall_k": recall_k,
+            })
+            if recall is not None:
+                print(f"🧭 사전 필터 recall@{recall_k}: {recall:.0%} "
+                      f"(선별 {len(selected_scores)}개 + 탈락 표본 {len(audited)}개의 전체 경로 점수 기준)")
+            else:
+                print("🧭 사전 필터 recall 측정 불가 (탈락 표본 평가 실패)")
+
+    evaluation_results = [record for _, _, record in sorted(top_k, key=lambda e: (-e[0], -e[1]))]
 
     if not evaluation_results:
         raise Exception("성공적으로 평가된 스타트업이 없습니다.")
 
-    evaluation_results.sort(key=lambda x: x["total_score"], reverse=True)
-
+    print(f"\n✅ {seen}개 스타트업 처리: {evaluated}개 신규/변경 평가, 저장된 점수 {reused}개 재사용.")
     print("\n" + "="*70)
-    print("📋 전체 랭킹 (AGENT 1)")
+    print(f"📋 상위 {len(evaluation_results)}개 랭킹 (AGENT 1)")
     for i, res in enumerate(evaluation_results):
         print(f"  {i+1:2d}. {res['name']:20s} {res['total_score']:6.2f} pts")
     print("="*70 + "\n")
@@ -182,4 +343,5 @@ def run_agent_1_search(state: GraphState) -> GraphState:
         "evaluation_results": evaluation_results,
         "current_startup_index": current_index,
         "current_startup_data": current_startup,
-    }
\ No newline at end of file
+        "prefilter_report": prefilter_report,
+    }
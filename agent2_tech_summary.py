@@ -9,8 +9,9 @@ from datetime import datetime
 from urllib.parse import urlparse
 from langgraph.graph import StateGraph, START, END
 
-# config에서 llm, llm_mini, tavily_client, llm_json import
-from config import llm, llm_mini, tavily_client, llm_json
+# config에서 llm 접근자 import (최초 사용 시 생성)
+from config import get_llm, get_llm_mini, get_llm_json
+from metrics import instrument_node
 
 # --- Agent 2의 독립적인 상태 정의 ---
 class Agent2Company(TypedDict, total=False): name: str; website: str; segment: str; region: str; funding_stage: str
@@ -23,6 +24,7 @@ class Agent2State(TypedDict, total=False):
     normalized_signals: List[Dict[str, Any]]; scores: Agent2Scores; final_score: float
     evidence: List[Agent2Evidence]; decision_notes: Dict[str, Any]; final_narrative: str
     output_payload: Agent2OutputPayload; logs: NotRequired[List[str]]
+    research_results: NotRequired[List[Dict[str, Any]]]  # 메인 그래프의 공유 리서치 번들 ('tech' 주제)
 
 # --- Agent 2 유틸리티 함수 ---
 # (유틸리티 함수는 이전과 동일 - 생략)
@@ -72,19 +74,25 @@ def agent2_collect_signals(state: Agent2State) -> Agent2State:
     ]
     out: List[Dict[str, Any]] = []
     
-    for q in queries:
-        try:
-            # simple_web_search 사용
-            results = simple_web_search(q, max_results=5)
-            for item in results:
-                out.append({
-                    "source": _agent2_source_type(item.get("url", ""), company.get("website", "")),
-                    "url": item.get("url", ""),
-                    "date": _agent2_today_iso(),
-                    "snippet": item.get("content", "")[:600],
-                })
-        except Exception as e:
-            _agent2_log(state, f"검색 오류: {e}")
+    def _add(results):
+        for item in results:
+            out.append({
+                "source": _agent2_source_type(item.get("url", ""), company.get("website", "")),
+                "url": item.get("url", ""),
+                "date": _agent2_today_iso(),
+                "snippet": item.get("content", "")[:600],
+            })
+
+    if state.get("research_results") is not None:
+        # 공유 리서치 번들 사용 (추가 검색 없음)
+        _add(state["research_results"])
+    else:
+        for q in queries:
+            try:
+                # simple_web_search 사용
+                _add(simple_web_search(q, max_results=5))
+            except Exception as e:
+                _agent2_log(state, f"검색 오류: {e}")
     
     dedup = list({(s["source"], s["url"]): s for s in out}.values())
     state["raw_signals"] = dedup
@@ -118,7 +126,7 @@ def agent2_score_by_rules(state: Agent2State) -> Agent2State:
     brief = "\n".join([f"- [{s.get('source')}] {s.get('snippet')}" for s in signals][:8])
     prompt = f"Adjust RWA tech scores [0,1] with small corrections. Return JSON only.\nSignals:\n{brief}\nBase:\n{json.dumps(base_scores)}"
     try:
-        resp = llm_json.invoke(prompt); delta = json.loads(resp.content)
+        resp = get_llm_json().invoke(prompt); delta = json.loads(resp.content)
         fused = {k: _agent2_clamp(base_scores[k] + max(-0.05, min(0.05, float(delta.get(k, v)) - base_scores[k]))) for k, v in base_scores.items()}
         state["scores"] = fused; _agent2_log(state, "규칙 기반 점수 + LLM 보정 완료.")
     except Exception as e:
@@ -138,7 +146,7 @@ def agent2_build_evidence(state: Agent2State) -> Agent2State:
     bullets = "\n".join([f"- ({s.get('source')}) {s.get('snippet')} | {s.get('url')}" for s in top])
     prompt = f"Summarize 1–2 short evidence items per score dimension (domain_fit, tech_maturity, credibility, compliance_risk, ecosystem) from signals. Return JSON arrays, each item has 'snippet','url','source'.\nSignals:\n{bullets}"
     try:
-        resp = llm_json.invoke(prompt); bundle = json.loads(resp.content)
+        resp = get_llm_json().invoke(prompt); bundle = json.loads(resp.content)
         ev: List[Agent2Evidence] = []
         for k, items in bundle.items():
             if not isinstance(items, list): continue
@@ -158,7 +166,7 @@ def agent2_decision_notes(state: Agent2State) -> Agent2State:
     risks = [item for item in [ "Regulatory risk." if s["compliance_risk"] >= 0.25 else None, "Needs more credibility proof." if s["credibility"] < 0.65 else None ] if item]
     prompt = f"Write one positioning sentence. Be neutral.\nscores={json.dumps(s)}\nstrengths={strengths}\nrisks={risks}"
     try:
-        sent = llm_mini.invoke(prompt).content.strip()
+        sent = get_llm_mini().invoke(prompt).content.strip()
     except Exception as e: _agent2_log(state, f"결정 노트 생성 실패: {e}"); sent = "Potential observed, monitoring required."
     state["decision_notes"] = {"strengths": strengths[:3], "risks": risks[:3], "positioning": sent}; _agent2_log(state, "결정 노트 생성 완료.");
     return state
@@ -171,7 +179,7 @@ def agent2_generate_final_narrative(state: Agent2State) -> Agent2State:
     prompt = f"""Write a 350–500 word markdown DD report with exact headers: Overview, Technology & Architecture, Governance & Compliance, Credibility & Ecosystem, Risks & Watchpoints, Bottom Line.
 Context: Company: {c.get('name','')}, Segment: {c.get('segment','')}, Scores: {json.dumps(s)}, Final: {final_score:.3f}, Pos: {pos}, Evidence:\n{evidence_block}"""
     try:
-        text = llm.invoke(prompt).content.strip()
+        text = get_llm().invoke(prompt).content.strip()
     except Exception as e: _agent2_log(state, f"최종 내러티브 생성 실패: {e}"); text = "## Overview\nAnalysis failed."
     state["final_narrative"] = text; _agent2_log(state, "최종 내러티브 생성 완료.");
     return state
@@ -202,16 +210,19 @@ def build_agent2_graph():
     """
     graph = StateGraph(Agent2State)
 
-    graph.add_node("0_ingest_input", agent2_ingest_input)
-    graph.add_node("1_collect_signals", agent2_collect_signals)
-    graph.add_node("2_normalize_enrich", agent2_normalize_enrich)
+    def add_node(name, fn):
+        graph.add_node(name, instrument_node(f"agent_2/{name}", fn))  # 노드별 계측 (metrics.py)
+
+    add_node("0_ingest_input", agent2_ingest_input)
+    add_node("1_collect_signals", agent2_collect_signals)
+    add_node("2_normalize_enrich", agent2_normalize_enrich)
     # 더미 노드 제거 - 조건부 분기는 add_conditional_edges에서만 사용
-    graph.add_node("4_score_by_rules", agent2_score_by_rules)
-    graph.add_node("5_calculate_final", agent2_calculate_final)
-    graph.add_node("6_build_evidence", agent2_build_evidence)
-    graph.add_node("7_decision_notes", agent2_decision_notes)
-    graph.add_node("7b_generate_final_narrative", agent2_generate_final_narrative)
-    graph.add_node("8_emit_json", agent2_emit_json)
+    add_node("4_score_by_rules", agent2_score_by_rules)
+    add_node("5_calculate_final", agent2_calculate_final)
+    add_node("6_build_evidence", agent2_build_evidence)
+    add_node("7_decision_notes", agent2_decision_notes)
+    add_node("7b_generate_final_narrative", agent2_generate_final_narrative)
+    add_node("8_emit_json", agent2_emit_json)
 
     graph.add_edge(START, "0_ingest_input")
     graph.add_edge("0_ingest_input", "1_collect_signals")
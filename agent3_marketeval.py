@@ -8,44 +8,103 @@ from langchain.schema.document import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import Chroma
 
+import os
+import hashlib
+import threading
+
 # 공유 자원 및 상태 import
 from graph_state import GraphState
-from config import llm_mini, simple_web_search, rag_embeddings  # 수정
+from config import get_llm_mini, simple_web_search, get_rag_embeddings, CACHE_DIR  # 수정
+from research import research_results
 
-def run_agent_3_market_rag(state: GraphState) -> GraphState:
-    """Agent 3: Performs market assessment using RAG."""
-    
-    # Chroma 텔레메트리 완전 비활성화
-    import chromadb.config
-    chromadb.config.Settings(anonymized_telemetry=False)
+# --- 영구 시장 문서 인덱스 (스타트업/실행 간 재사용) ---
+MARKET_INDEX_DIR = os.getenv("MARKET_INDEX_DIR", os.path.join(CACHE_DIR, "market_index"))
+MARKET_COLLECTION = "rwa_market_docs_v2"  # v2: 청크 메타데이터에 chunk_id 포함 (검색 범위 제한용)
+
+_market_index = None
+_market_index_lock = threading.Lock()
+
+
+def _get_market_index():
+    """영구 Chroma 컬렉션 (최초 호출 시 생성/로드)"""
+    global _market_index
+    with _market_index_lock:
+        if _market_index is None:
+            # Chroma 텔레메트리 완전 비활성화
+            import chromadb.config
+            _market_index = Chroma(
+                collection_name=MARKET_COLLECTION,
+                embedding_function=get_rag_embeddings(),
+                persist_directory=MARKET_INDEX_DIR,
+                client_settings=chromadb.config.Settings(
+                    anonymized_telemetry=False, is_persistent=True, persist_directory=MARKET_INDEX_DIR
+                ),
+            )
+        return _market_index
+
+
+def _chunk_id(startup_name: str, text: str) -> str:
+    """청크 ID = (스타트업, 청크 내용) 해시 → 이미 임베딩된 청크는 다시 임베딩하지 않음"""
+    return hashlib.sha256(f"{startup_name}\x00{text}".encode("utf-8")).hexdigest()
+
+
+def _index_market_documents(vectorstore, startup_name: str, segment: str, splits: list) -> tuple:
+    """인덱스에 없는 청크만 추가하고 (추가된 건수, 이번 호출의 청크 ID 목록) 반환"""
+    docs_by_id = {}
+    for doc in splits:
+        chunk_id = _chunk_id(startup_name, doc.page_content)
+        doc.metadata.update({"startup": startup_name, "sector": segment, "chunk_id": chunk_id})
+        docs_by_id.setdefault(chunk_id, doc)
+
+    with _market_index_lock:
+        existing = set(vectorstore.get(ids=list(docs_by_id), include=[])["ids"])
+        new_ids = [doc_id for doc_id in docs_by_id if doc_id not in existing]
+        if new_ids:
+            vectorstore.add_documents([docs_by_id[i] for i in new_ids], ids=new_ids)
+    return len(new_ids), list(docs_by_id)
+
+
+def run_agent_3_market_rag(state: GraphState) -> dict:
+    """
+    Agent 3: Performs market assessment using RAG.
     
+    docstring: Runs as a parallel branch, so it returns only its own output key.
+    """
     startup_name = state["current_startup_data"]["name"]
     segment = state["current_startup_data"]["sector"]
     print(f"--- (3) EXECUTING AGENT 3: MARKET RAG for {startup_name} ---")
 
-    # 1. 웹 검색 (RAG 문서 수집)
-    search_query = f"{startup_name} {segment} market size TAM SAM SOM CAGR"
-    search_results = simple_web_search(search_query, max_results=5)  # 수정
+    # 1. 웹 검색 (RAG 문서 수집) - 공유 리서치 번들 우선, 없으면 직접 검색
+    search_results = research_results(state, "market")
+    if search_results is None:
+        search_query = f"{startup_name} {segment} market size TAM SAM SOM CAGR"
+        search_results = simple_web_search(search_query, max_results=5)  # 수정
     
     documents = [Document(page_content=res.get("content", ""), metadata={"source": res.get("url", "")}) 
                  for res in search_results if res.get("content")]
     
     if not documents:
         print("--- (3) RAG: 웹 검색 결과가 없습니다. ---")
-        return {**state, "market_assessment_output": {"error": "No market data found."}}
+        return {"market_assessment_output": {"error": "No market data found."}}
 
 
     # 2. Split
     text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
     splits = text_splitter.split_documents(documents)
 
-    # 3. Embed & Store (all-mpnet-base-v2 사용)
+    # 3. Embed & Store (all-mpnet-base-v2 사용, 새 청크만 임베딩)
     try:
-        vectorstore = Chroma.from_documents(documents=splits, embedding=rag_embeddings)
-        retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
+        vectorstore = _get_market_index()
+        added, chunk_ids = _index_market_documents(vectorstore, startup_name, segment, splits)
+        print(f"--- (3) RAG 인덱스: 신규 청크 {added}개 / 전체 {len(splits)}개 ---")
+        # 이번 호출의 검색 결과 청크에서만 검색 (이전 실행에서 쌓인 같은 스타트업 청크는 제외)
+        retriever = vectorstore.as_retriever(search_kwargs={
+            "k": min(3, len(chunk_ids)),
+            "filter": {"chunk_id": {"$in": chunk_ids}},
+        })
     except Exception as e:
         print(f"--- (3) RAG 벡터스토어 생성 실패: {e} ---")
-        return {**state, "market_assessment_output": {"error": f"Vectorstore creation failed: {e}"}}
+        return {"market_assessment_output": {"error": f"Vectorstore creation failed: {e}"}}
 
     # 4. RAG Chain
     rag_prompt = ChatPromptTemplate.from_template("""
@@ -61,7 +120,7 @@ Analyze:
     rag_chain = (
         {"context": retriever | (lambda docs: "\n\n".join(d.page_content for d in docs)), 
          "startup_name": (lambda x: startup_name)}
-        | rag_prompt | llm_mini | JsonOutputParser()
+        | rag_prompt | get_llm_mini() | JsonOutputParser()
     )
     
     try:
@@ -70,5 +129,4 @@ Analyze:
         print(f"--- (3) RAG Chain Error: {e} ---")
         output = {"error": str(e)}
         
-    vectorstore.delete_collection() # 임시 벡터스토어 정리
-    return {**state, "market_assessment_output": output}
\ No newline at end of file
+    return {"market_assessment_output": output}
\ No newline at end of file
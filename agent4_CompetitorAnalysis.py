@@ -6,16 +6,24 @@ from langchain_core.output_parsers.json import JsonOutputParser
 
 # 공유 자원 및 상태 import
 from graph_state import GraphState
-from config import llm, simple_web_search  # 수정
+from config import get_llm, simple_web_search  # 수정
+from research import research_results
 
-def run_agent_4_competitor_analysis(state: GraphState) -> GraphState:
-    """Agent 4: Performs competitor analysis using web search."""
+def run_agent_4_competitor_analysis(state: GraphState) -> dict:
+    """
+    Agent 4: Performs competitor analysis using web search.
+    
+    docstring: Runs as a parallel branch, so it returns only its own output key.
+    """
     startup_name = state["current_startup_data"]["name"]
     segment = state["current_startup_data"]["sector"]
     print(f"--- (4) EXECUTING AGENT 4: COMPETITOR ANALYSIS for {startup_name} ---")
 
-    search_query = f"main competitors for {startup_name} in {segment}"
-    search_results = simple_web_search(search_query, max_results=5)  # 수정
+    # 공유 리서치 번들 우선, 없으면 직접 검색
+    search_results = research_results(state, "competitors")
+    if search_results is None:
+        search_query = f"main competitors for {startup_name} in {segment}"
+        search_results = simple_web_search(search_query, max_results=5)  # 수정
     context = "\n".join([res.get("content", "") for res in search_results])
 
     prompt = ChatPromptTemplate.from_template("""
@@ -31,11 +39,11 @@ Context: {context}
 }}
     """)
     
-    chain = prompt | llm | JsonOutputParser()
+    chain = prompt | get_llm() | JsonOutputParser()
     try:
         output = chain.invoke({"startup_name": startup_name, "context": context})
     except Exception as e:
         print(f"--- (4) Competitor Analysis Error: {e} ---")
         output = {"error": str(e)}
 
-    return {**state, "competitor_analysis_output": output}
\ No newline at end of file
+    return {"competitor_analysis_output": output}
\ No newline at end of file
@@ -6,7 +6,7 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers.json import JsonOutputParser
 
 from graph_state import GraphState
-from config import llm, VC_CHECKLIST
+from config import get_llm, VC_CHECKLIST
 
 
 # === Helper Functions (함수 정의를 맨 위로 이동) ===
@@ -94,7 +94,7 @@ def run_agent_5_decision(state: GraphState) -> GraphState:
             """
         )
         
-        chain = prompt | llm | JsonOutputParser()
+        chain = prompt | get_llm() | JsonOutputParser()
         
         response_json = chain.invoke({"context": full_context, "checklist": checklist_prompt})
         scores = response_json.get("scores", [0]*20)
@@ -1,48 +1,67 @@
 # FILE: agent6.py
 # (Agent 6: Final Report Generator) - VC급 보고서 생성
 
+import os
 import json
+import hashlib
 from datetime import datetime
+from itertools import chain
+from string import Template
+from typing import Iterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from graph_state import GraphState
-from config import llm_json, VC_CHECKLIST
+from config import get_llm_json, VC_CHECKLIST, LLM_MODEL
+from disk_cache import DiskCache, CACHE_DIR
+from metrics import bind_context
+from research import research_results
+from state_snapshot import save_state_snapshot, snapshot_path
+from report_writer import (REPORT_FORMATS, Section, format_path, iter_json_block,
+                           render_markdown, write_report)
+
+# 성능 설정
+AGENT6_SINGLE_CALL = os.getenv("AGENT6_SINGLE_CALL", "").lower() in ("1", "true", "yes")  # 재무+팀 추출을 LLM 1회 호출로
+AGENT6_MEMO_DISABLED = os.getenv("AGENT6_MEMO_DISABLED", "").lower() in ("1", "true", "yes")
+AGENT6_MEMO_TTL = float(os.getenv("AGENT6_MEMO_TTL", 7 * 24 * 3600))  # 스타트업별 추출값 재사용 기간 (초)
+AGENT6_REPORT_FORMATS = [f.strip() for f in os.getenv("AGENT6_REPORT_FORMATS", "md").split(",") if f.strip()]  # md, json, html
+
+
+def _check_report_formats(formats) -> None:
+    """알 수 없는 보고서 형식이면 파일을 쓰기 전에 오류"""
+    unknown = [fmt for fmt in formats if fmt not in REPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown report format(s): {unknown} (expected any of {REPORT_FORMATS})")
+
+
+_check_report_formats(AGENT6_REPORT_FORMATS)  # 설정 오류는 실행 시작 시점에 드러나도록
 
 
 # ============================================================================
 # PART 1: 데이터 추출 함수들
 # ============================================================================
 
-def _extract_financial_data(state: GraphState) -> dict:
-    """
-    Agent 1-4에서 수집한 데이터를 기반으로 재무 정보 추출/추정
-    """
-    startup = state['current_startup_data']
-    tech_data = state.get('tech_summary_output', {})
-    market_data = state.get('market_assessment_output', {})
-    
-    # 검색 결과에서 재무 정보 추출 시도
-    evidence = tech_data.get('evidence', [])
-    evidence_text = "\n".join([
-        f"- {ev.get('snippet', '')}" for ev in evidence[:5]
-    ])
-    
-    # LLM에게 재무 정보 추정 요청
-    prompt = f"""
-Based on the following information about {startup['name']}, estimate financial metrics.
-If specific data is unavailable, provide reasonable estimates based on industry standards for {startup.get('funding_stage', 'Series A')} stage companies in the {startup.get('sector', 'blockchain')} sector.
+def _research_evidence_lines(state: GraphState, topic: str, limit: int = 5) -> list:
+    """공유 리서치 번들의 주제별 문서를 근거 목록 형식으로 (번들이 없으면 빈 목록)"""
+    docs = research_results(state, topic) or []
+    return [f"- {doc['content'][:400]} ({doc['url']})" for doc in docs[:limit] if doc.get('content')]
+
+
+FINANCIAL_PROMPT_TEMPLATE = """
+Based on the following information about {name}, estimate financial metrics.
+If specific data is unavailable, provide reasonable estimates based on industry standards for {funding_stage} stage companies in the {sector_hint} sector.
 
 **Company Info:**
-- Name: {startup['name']}
-- Sector: {startup.get('sector', 'N/A')}
-- Funding Stage: {startup.get('funding_stage', 'Series A')}
-- Region: {startup.get('region', 'USA')}
-- Strength: {startup.get('strength', 'N/A')}
+- Name: {name}
+- Sector: {sector}
+- Funding Stage: {funding_stage}
+- Region: {region}
+- Strength: {strength}
 
 **Market Context:**
-- TAM/SAM/SOM: {market_data.get('tam_sam_som', 'Unknown')}
-- CAGR: {market_data.get('cagr', 'Unknown')}
+- TAM/SAM/SOM: {tam_sam_som}
+- CAGR: {cagr}
 
 **Evidence from Research:**
-{evidence_text if evidence_text.strip() else 'Limited public information available'}
+{evidence}
 
 **Task:** Provide estimates for:
 1. total_funding_raised: Total funding to date (in millions USD)
@@ -67,45 +86,14 @@ Example:
     "revenue_status": "Pre-revenue, piloting with 3 institutional clients"
 }}
 """
-    
-    try:
-        response = llm_json.invoke(prompt)
-        financial_data = json.loads(response.content)
-        print(f"    💰 재무 데이터 추출 완료")
-    except Exception as e:
-        print(f"    ⚠️ 재무 데이터 추출 실패: {e}")
-        # Fallback: 기본값
-        financial_data = {
-            "total_funding_raised": 20.0,
-            "last_round_size": 10.0,
-            "lead_investors": ["Undisclosed institutional investors"],
-            "estimated_valuation": 80.0,
-            "estimated_burn_rate": 600,
-            "estimated_runway": 16,
-            "revenue_model": "Platform fees and tokenization services",
-            "revenue_status": "Early revenue stage"
-        }
-    
-    return financial_data
-
 
-def _extract_team_data(state: GraphState) -> dict:
-    """팀 정보 추출"""
-    startup = state['current_startup_data']
-    tech_data = state.get('tech_summary_output', {})
-    evidence = tech_data.get('evidence', [])
-    
-    evidence_text = "\n".join([
-        f"- {ev.get('snippet', '')}" for ev in evidence[:5]
-    ])
-    
-    prompt = f"""
-Based on available information about {startup['name']}, extract or estimate team information.
+TEAM_PROMPT_TEMPLATE = """
+Based on available information about {name}, extract or estimate team information.
 
-**Company:** {startup['name']}
-**Sector:** {startup.get('sector', 'N/A')}
+**Company:** {name}
+**Sector:** {sector}
 **Evidence:**
-{evidence_text if evidence_text.strip() else 'Limited information'}
+{evidence}
 
 **Task:** Extract or reasonably estimate:
 1. ceo_name: CEO name (or "Not publicly disclosed")
@@ -128,24 +116,189 @@ Example:
     "advisory_board": ["Former CFTC Commissioner", "Stanford Blockchain Professor"]
 }}
 """
-    
+
+# 단일 호출 모드: 두 작업을 한 요청으로 묻고 {"financial": ..., "team": ...}로 받음
+MERGED_PROMPT_TEMPLATE = """
+You are preparing two sections of a VC investment report. Complete BOTH tasks below and return ONE JSON object with exactly two keys:
+"financial" (the JSON object requested in Task 1) and "team" (the JSON object requested in Task 2).
+
+### Task 1: Financial metrics
+{financial}
+
+### Task 2: Team information
+{team}
+"""
+
+_PROMPTS = [MERGED_PROMPT_TEMPLATE, FINANCIAL_PROMPT_TEMPLATE, TEAM_PROMPT_TEMPLATE] if AGENT6_SINGLE_CALL \
+    else [FINANCIAL_PROMPT_TEMPLATE, TEAM_PROMPT_TEMPLATE]
+# 추출 버전 (프롬프트/모델이 바뀌면 저장된 추출값 무효화)
+EXTRACTION_VERSION = hashlib.sha256("\x00".join(_PROMPTS + [LLM_MODEL]).encode("utf-8")).hexdigest()[:12]
+
+# 추출 실패 시 기본값
+_FINANCIAL_FALLBACK = {
+    "total_funding_raised": 20.0,
+    "last_round_size": 10.0,
+    "lead_investors": ["Undisclosed institutional investors"],
+    "estimated_valuation": 80.0,
+    "estimated_burn_rate": 600,
+    "estimated_runway": 16,
+    "revenue_model": "Platform fees and tokenization services",
+    "revenue_status": "Early revenue stage"
+}
+_TEAM_FALLBACK = {
+    "ceo_name": "Experienced fintech executive",
+    "ceo_background": "10+ years in financial services and blockchain",
+    "cto_name": "Senior blockchain architect",
+    "cto_background": "Former engineer at major tech company",
+    "team_size": 25,
+    "key_hires": ["Head of Compliance", "VP Engineering", "Head of Business Development"],
+    "advisory_board": ["Industry veterans", "Regulatory experts"]
+}
+
+
+def _evidence_text(state: GraphState, topic: str) -> str:
+    """Agent 2 증거 상위 5개 + 공유 리서치 번들의 주제별 문서"""
+    evidence = (state.get('tech_summary_output') or {}).get('evidence', [])
+    return "\n".join([
+        f"- {ev.get('snippet', '')}" for ev in evidence[:5]
+    ] + _research_evidence_lines(state, topic))
+
+
+def _financial_prompt(state: GraphState) -> str:
+    startup = state['current_startup_data']
+    market_data = state.get('market_assessment_output') or {}
+    evidence_text = _evidence_text(state, "financial")
+    return FINANCIAL_PROMPT_TEMPLATE.format(
+        name=startup['name'],
+        sector=startup.get('sector', 'N/A'),
+        sector_hint=startup.get('sector', 'blockchain'),
+        funding_stage=startup.get('funding_stage', 'Series A'),
+        region=startup.get('region', 'USA'),
+        strength=startup.get('strength', 'N/A'),
+        tam_sam_som=market_data.get('tam_sam_som', 'Unknown'),
+        cagr=market_data.get('cagr', 'Unknown'),
+        evidence=evidence_text if evidence_text.strip() else 'Limited public information available',
+    )
+
+
+def _team_prompt(state: GraphState) -> str:
+    startup = state['current_startup_data']
+    evidence_text = _evidence_text(state, "team")
+    return TEAM_PROMPT_TEMPLATE.format(
+        name=startup['name'],
+        sector=startup.get('sector', 'N/A'),
+        evidence=evidence_text if evidence_text.strip() else 'Limited information',
+    )
+
+
+def _extract_financial_data(state: GraphState) -> Optional[dict]:
+    """
+    Agent 1-4에서 수집한 데이터를 기반으로 재무 정보 추출/추정 (실패 시 None)
+    """
     try:
-        response = llm_json.invoke(prompt)
+        response = get_llm_json().invoke(_financial_prompt(state))
+        financial_data = json.loads(response.content)
+        print(f"    💰 재무 데이터 추출 완료")
+        return financial_data
+    except Exception as e:
+        print(f"    ⚠️ 재무 데이터 추출 실패: {e}")
+        return None
+
+
+def _extract_team_data(state: GraphState) -> Optional[dict]:
+    """팀 정보 추출 (실패 시 None)"""
+    try:
+        response = get_llm_json().invoke(_team_prompt(state))
         team_data = json.loads(response.content)
         print(f"    👥 팀 데이터 추출 완료")
+        return team_data
     except Exception as e:
         print(f"    ⚠️ 팀 데이터 추출 실패: {e}")
-        team_data = {
-            "ceo_name": "Experienced fintech executive",
-            "ceo_background": "10+ years in financial services and blockchain",
-            "cto_name": "Senior blockchain architect",
-            "cto_background": "Former engineer at major tech company",
-            "team_size": 25,
-            "key_hires": ["Head of Compliance", "VP Engineering", "Head of Business Development"],
-            "advisory_board": ["Industry veterans", "Regulatory experts"]
-        }
-    
-    return team_data
+        return None
+
+
+def _extract_merged(state: GraphState) -> Tuple[Optional[dict], Optional[dict]]:
+    """재무+팀 정보를 LLM 1회 호출로 추출 (응답에 빠진 항목은 None)"""
+    prompt = MERGED_PROMPT_TEMPLATE.format(financial=_financial_prompt(state), team=_team_prompt(state))
+    try:
+        data = json.loads(get_llm_json().invoke(prompt).content)
+    except Exception as e:
+        print(f"    ⚠️ 재무/팀 통합 추출 실패: {e}")
+        return None, None
+    financial, team = data.get("financial"), data.get("team")
+    financial = financial if isinstance(financial, dict) and financial else None
+    team = team if isinstance(team, dict) and team else None
+    print("    💰👥 재무/팀 데이터 통합 추출 완료")
+    return financial, team
+
+
+_extraction_memo: Optional[DiskCache] = None
+
+
+def _get_extraction_memo() -> Optional[DiskCache]:
+    """스타트업별 추출값 디스크 메모 (AGENT6_MEMO_DISABLED=1이면 None)"""
+    global _extraction_memo
+    if AGENT6_MEMO_DISABLED:
+        return None
+    if _extraction_memo is None:
+        _extraction_memo = DiskCache(os.path.join(CACHE_DIR, "report_extractions.sqlite"),
+                                     max_entries=5000, default_ttl=AGENT6_MEMO_TTL or None)
+    return _extraction_memo
+
+
+def _memo_key(startup: dict) -> str:
+    """스타트업 식별 필드 + 추출 버전 해시"""
+    fields = "\x00".join(str(startup.get(k, "")) for k in ("name", "sector", "strength"))
+    return hashlib.sha256(f"{fields}\x00{EXTRACTION_VERSION}".encode("utf-8")).hexdigest()
+
+
+def extract_report_data(state: GraphState) -> dict:
+    """
+    성공 보고서에 필요한 LLM 추출값 (재무/팀).
+
+    docstring: Reuses `report_extractions` already in the state, then the
+               per-startup disk memo, so report retries and re-renders never
+               repeat the LLM calls. Otherwise both extractions run
+               concurrently (or as one merged call with AGENT6_SINGLE_CALL=1);
+               results with a fallback value are not memoized.
+    """
+    startup = state.get('current_startup_data') or {}
+    startup_name = startup.get('name')
+    existing = state.get('report_extractions')
+    if existing and existing.get('startup') == startup_name:
+        return existing
+
+    memo = _get_extraction_memo()
+    key = _memo_key(startup)
+    if memo is not None:
+        cached = memo.get(key)
+        if cached is not None:
+            print(f"    💾 재무/팀 추출값 재사용 ({startup_name})")
+            return cached
+
+    financial = team = None
+    if AGENT6_SINGLE_CALL:
+        financial, team = _extract_merged(state)
+    if financial is None or team is None:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fin_future = pool.submit(bind_context(_extract_financial_data), state) if financial is None else None
+            team_future = pool.submit(bind_context(_extract_team_data), state) if team is None else None
+            financial = fin_future.result() if fin_future else financial
+            team = team_future.result() if team_future else team
+
+    extractions = {
+        "startup": startup_name,
+        "financial": financial if financial is not None else dict(_FINANCIAL_FALLBACK),
+        "team": team if team is not None else dict(_TEAM_FALLBACK),
+    }
+    if memo is not None and financial is not None and team is not None:
+        memo.set(key, extractions)
+    return extractions
+
+
+def _report_extraction(state: GraphState, kind: str) -> dict:
+    """보고서 추출값 조회 ('financial' / 'team', 없으면 추출)"""
+    return extract_report_data(state)[kind]
 
 
 # ============================================================================
@@ -157,6 +310,11 @@ def _get_timestamp():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def _report_timestamp(state: GraphState) -> str:
+    """보고서 생성 시각 (스냅샷 재렌더링 시 원래 생성 시각 유지)"""
+    return state.get("report_generated_at") or _get_timestamp()
+
+
 def _format_checklist_scores(scores):
     """체크리스트 점수를 막대그래프로 표시"""
     if not scores:
@@ -258,7 +416,7 @@ def _format_competitor_analysis(comp_data):
 def _format_financial_analysis(state: GraphState) -> str:
     """재무 분석 섹션 포맷팅"""
     startup = state['current_startup_data']
-    fin_data = _extract_financial_data(state)
+    fin_data = _report_extraction(state, "financial")
     
     # 비교군 밸류에이션 (경쟁사 데이터 활용)
     comp_data = state.get('competitor_analysis_output', {})
@@ -313,7 +471,7 @@ def _format_financial_analysis(state: GraphState) -> str:
 
 def _format_team_analysis(state: GraphState) -> str:
     """팀 분석 섹션 포맷팅"""
-    team_data = _extract_team_data(state)
+    team_data = _report_extraction(state, "team")
     
     advisory = team_data.get('advisory_board', ['Not disclosed'])
     advisory_str = ", ".join(advisory) if isinstance(advisory, list) else str(advisory)
@@ -358,7 +516,7 @@ Current team size: ~{team_data.get('team_size', 20)} employees
 def _format_investment_terms(state: GraphState) -> str:
     """투자 조건 제안 (데이터 기반 추정)"""
     startup = state['current_startup_data']
-    fin_data = _extract_financial_data(state)
+    fin_data = _report_extraction(state, "financial")
     decision_data = state.get('investment_decision_output', {})
     
     current_val = fin_data.get('estimated_valuation', 80)
@@ -626,119 +784,16 @@ def _calculate_risk_rating(state):
 
 
 # ============================================================================
-# PART 3: 실패 보고서 생성 함수들 (기존 함수들)
+# PART 3: 보고서 섹션 템플릿 (미리 컴파일, report_writer.py로 스트리밍 기록)
 # ============================================================================
+# 각 섹션 문자열은 다음 섹션 앞의 구분선('---')까지 포함하므로 Markdown 출력은 섹션을 그대로 이어 쓴 것
 
-def _format_evaluated_startups_table(startups, decisions):
-    """평가된 스타트업 테이블"""
-    if not startups:
-        return "평가 데이터 없음"
-    
-    table = "| Rank | 스타트업 | 섹터 | 점수 | 결정 |\n"
-    table += "|------|---------|------|------|------|\n"
-    
-    for idx, (startup, decision) in enumerate(zip(startups, decisions), 1):
-        decision_emoji = "✅" if decision == "투자 적절" else ("⏸️" if decision == "보류" else "❌")
-        sector = startup.get('sector', 'N/A')[:40] + "..." if len(startup.get('sector', '')) > 40 else startup.get('sector', 'N/A')
-        table += f"| {idx} | {startup.get('name', 'N/A')} | {sector} | {startup.get('total_score', 0):.1f} | {decision_emoji} {decision} |\n"
-    
-    return table
-
-
-def _format_detailed_evaluations(startups, decisions, state):
-    """상세 평가 내용"""
-    result = ""
-    
-    # 평가된 스타트업만 (decision_log 길이만큼)
-    for idx, (startup, decision) in enumerate(zip(startups[:len(decisions)], decisions), 1):
-        result += f"""
-### {idx}. {startup.get('name', 'Unknown')}
+_SECTION = Template("\n$body\n\n---\n")
+_HEADED_SECTION = Template("\n## $heading\n$body\n\n---\n")
+_SECTION_BREAK = "\n\n---\n"
 
-**기본 정보**
-- 섹터: {startup.get('sector', 'N/A')}
-- 웹사이트: {startup.get('website', 'N/A')}
-- 지역: {startup.get('region', 'N/A')}
-- 펀딩 단계: {startup.get('funding_stage', 'N/A')}
-
-**평가 점수**
-- Agent 1 총점: {startup.get('total_score', 0):.2f}/100
-- Domain Fit: {startup.get('domain_fit', 0):.2f}
-- Credibility: {startup.get('credibility_score', 0):.2f}
-
-**최종 결정**: {decision}
-
-**주요 강점**
-{startup.get('strength', 'N/A')}
-
----
-"""
-    
-    return result
-
-
-def _format_persona_weights(persona):
-    """페르소나별 가중치 표시"""
-    from RWA_Investment_Agent2.agent0_persona import PERSONA_WEIGHTS
-    
-    weights = PERSONA_WEIGHTS.get(persona, {})
-    
-    return f"""
-| 평가 항목 | 가중치 |
-|----------|--------|
-| Seed/Early Stage | {weights.get('seed_early', 0)*100:.0f}% |
-| Regional/ESG | {weights.get('regional_esg', 0)*100:.0f}% |
-| Growth + Partnership | {weights.get('growth_partnership', 0)*100:.0f}% |
-| Regulation/Monetization | {weights.get('regulation_monetization', 0)*100:.0f}% |
-"""
-
-
-def _generate_key_findings(startups, decisions):
-    """주요 발견사항 생성"""
-    if not startups:
-        return "- 평가 데이터 부족"
-    
-    avg_score = sum(s.get('total_score', 0) for s in startups[:len(decisions)]) / max(len(decisions), 1)
-    
-    return f"""
-- **평균 점수**: {avg_score:.2f}/100
-- **최고 점수**: {max((s.get('total_score', 0) for s in startups[:len(decisions)]), default=0):.2f}/100
-- **최저 점수**: {min((s.get('total_score', 0) for s in startups[:len(decisions)]), default=0):.2f}/100
-- **공통 약점**: 충분한 공개 정보 부족, 기술 성숙도 검증 필요
-- **전반적 평가**: {state.get('investor_persona', 'conservative')} 투자자 기준으로 모든 후보가 리스크가 높게 평가됨
-"""
-
-
-def _format_full_ranking(all_startups):
-    """전체 랭킹 표"""
-    if not all_startups:
-        return "랭킹 데이터 없음"
-    
-    table = "| Rank | 스타트업 | 총점 | Domain Fit | Credibility |\n"
-    table += "|------|---------|------|------------|-------------|\n"
-    
-    for idx, startup in enumerate(all_startups, 1):
-        table += f"| {idx} | {startup.get('name', 'N/A')} | {startup.get('total_score', 0):.1f} | {startup.get('domain_fit', 0):.2f} | {startup.get('credibility_score', 0):.2f} |\n"
-    
-    return table
-
-
-def _get_termination_reason(decisions, total_startups):
-    """종료 사유"""
-    if len(decisions) >= 5:
-        return f"5회 연속 투자 부적합 판정 ({', '.join(decisions)})"
-    elif len(decisions) >= total_startups:
-        return f"전체 {total_startups}개 스타트업 평가 완료"
-    else:
-        return "알 수 없는 사유"
-
-
-def _generate_rejection_report(state: GraphState) -> str:
-    """실패 보고서 생성 (5회 누적 또는 리스트 소진)"""
-    decision_log = state["decision_log"]
-    evaluated_startups = state.get("evaluation_results", [])[:len(decision_log)]
-    
-    return f"""
-# 📋 AI 스타트업 투자 평가 보고서 (분석 종료)
+_SUCCESS_SUMMARY = Template("""
+# 🎯 AI 스타트업 투자 평가 보고서: $startup_name
 
 ---
 
@@ -746,189 +801,44 @@ def _generate_rejection_report(state: GraphState) -> str:
 
 | 항목 | 내용 |
 |------|------|
-| **최종 투자 의견** | ❌ **투자 부적합 (루프 종료)** |
-| **투자자 페르소나** | {state['investor_persona'].upper()} |
-| **평가 대상 수** | {len(decision_log)}개 스타트업 |
-| **평가 기간** | {_get_timestamp()} |
-
-### 🔍 종합 평가 요약
-총 **{len(decision_log)}개**의 스타트업을 검토하였으나, 현재 투자자 페르소나({state['investor_persona']})에 부합하는 '투자 적절' 대상을 찾지 못했습니다.
-
----
-
-## 1️⃣ 평가된 스타트업 목록
-
-{_format_evaluated_startups_table(evaluated_startups, decision_log)}
-
----
-
-## 2️⃣ 스타트업별 상세 평가
-
-{_format_detailed_evaluations(evaluated_startups, decision_log, state)}
-
----
-
-## 3️⃣ 투자자 페르소나 분석
-
-### {state['investor_persona'].upper()} Investor Profile
-
-{state.get('persona_rationale', 'N/A')}
-
-### 페르소나별 평가 기준
-{_format_persona_weights(state['investor_persona'])}
-
----
-
-## 4️⃣ 종합 분석 및 권고사항
-
-### 📊 평가 결과 통계
-- **부정적 결정**: {decision_log.count('부정적')}건
-- **보류 결정**: {decision_log.count('보류')}건
-- **투자 적절**: {decision_log.count('투자 적절')}건
-
-### 💡 주요 발견사항
-{_generate_key_findings(evaluated_startups, decision_log)}
-
-### 📋 Next Steps & Recommendations
-
-1. **포트폴리오 확장 고려**
-   - 현재 후보군에서 적합한 투자 대상이 발견되지 않음
-   - 추가적인 Deal Sourcing 필요
-   - 다른 섹터나 지역으로 범위 확대 검토
-
-2. **평가 기준 재검토**
-   - 현재 페르소나({state['investor_persona']}) 기준이 너무 엄격할 가능성
-   - '보류' 판정 받은 스타트업에 대한 재평가 고려
-   - 특정 기준의 가중치 조정 검토
-
-3. **직접 소싱 전략**
-   - 액셀러레이터/인큐베이터 파트너십 강화
-   - VC 네트워크를 통한 Co-investment 기회 탐색
-   - 컨퍼런스 및 데모데이 참석을 통한 직접 발굴
-   - Warm introduction을 통한 고품질 딜 확보
-
-4. **심층 분석 권장 대상**
-   - 보류 판정 받은 스타트업 재검토
-   - 1:1 미팅을 통한 추가 정보 수집
-   - 업계 전문가 자문 활용
-
----
-
-## 📎 부록: 전체 랭킹 데이터
-
-### 초기 평가 전체 랭킹 (Agent 1)
-{_format_full_ranking(state.get('evaluation_results', []))}
-
----
-
-**보고서 생성일**: {_get_timestamp()}  
-**분석 시스템**: RWA Multi-Agent Investment Analysis v2.0  
-**평가 완료 사유**: {_get_termination_reason(decision_log, len(state.get('evaluation_results', [])))}
-"""
-
-
-# ============================================================================
-# PART 4: 메인 함수
-# ============================================================================
-
-def run_agent_6_report_generator(state: GraphState) -> GraphState:
-    """
-    Agent 6: Generates comprehensive VC-grade investment report.
-    
-    docstring: Creates either a detailed success report or a comprehensive 
-               analysis report based on evaluation outcomes.
-    """
-    print("--- (6) EXECUTING AGENT 6: FINAL REPORT GENERATION ---")
-    
-    decision_log = state["decision_log"]
-    final_decision_output = state.get("investment_decision_output", {})
-    final_decision = final_decision_output.get("decision", "N/A")
-    
-    report_content = ""
-
-    # ========================================================================
-    # Case 1: "투자 적절" - 상세 성공 보고서
-    # ========================================================================
-    if final_decision == "투자 적절":
-        startup_name = state["current_startup_data"]["name"]
-        total_score = final_decision_output.get("total_score", "N/A")
-        
-        risk_rating, risk_description = _calculate_risk_rating(state)
-        
-        report_content = f"""
-# 🎯 AI 스타트업 투자 평가 보고서: {startup_name}
-
----
-
-## 📊 Executive Summary
-
-| 항목 | 내용 |
-|------|------|
-| **스타트업 이름** | {startup_name} |
-| **섹터** | {state['current_startup_data'].get('sector', 'N/A')} |
-| **최종 투자 의견** | ✅ **{final_decision}** |
-| **종합 점수** | **{total_score}/20** ({total_score/20*100:.0f}%) |
-| **투자자 페르소나** | {state['investor_persona'].upper()} |
-| **웹사이트** | {state['current_startup_data'].get('website', 'N/A')} |
-| **지역** | {state['current_startup_data'].get('region', 'N/A')} |
-| **펀딩 단계** | {state['current_startup_data'].get('funding_stage', 'N/A')} |
-| **리스크 등급** | {risk_rating} |
+| **스타트업 이름** | $startup_name |
+| **섹터** | $sector |
+| **최종 투자 의견** | ✅ **$decision** |
+| **종합 점수** | **$total_score/20** ($score_pct%) |
+| **투자자 페르소나** | $persona_upper |
+| **웹사이트** | $website |
+| **지역** | $region |
+| **펀딩 단계** | $funding_stage |
+| **리스크 등급** | $risk_rating |
 
 ### 🔑 Investment Thesis
-{_generate_investment_thesis(state)}
+$thesis
 
 ### ⚡ Key Highlights
-{_generate_key_highlights(state)}
+$highlights
 
 ### 📝 Executive Summary
-{final_decision_output.get('reasoning', 'N/A')}
+$reasoning
 
 ---
+""")
 
+_SUCCESS_CHECKLIST = Template("""
 ## 1️⃣ 20-Point VC Checklist 상세 분석
-{_format_checklist_scores(final_decision_output.get('checklist_scores', []))}
-{_format_detailed_checklist(final_decision_output.get('checklist_scores', []))}
-
----
-
-## 2️⃣ 기술 성숙도 분석 (Agent 2)
-{_format_tech_summary(state.get('tech_summary_output', {}))}
-
----
-
-## 3️⃣ 시장성 분석 (Agent 3 - RAG)
-{_format_market_analysis(state.get('market_assessment_output', {}))}
-
----
-
-## 4️⃣ 경쟁 환경 분석 (Agent 4)
-{_format_competitor_analysis(state.get('competitor_analysis_output', {}))}
-
----
-
-{_format_financial_analysis(state)}
-
----
-
-{_format_team_analysis(state)}
-
----
-
-{_format_investment_terms(state)}
-
----
-
-{_format_risk_mitigation(state)}
+$scores
+$detailed
 
 ---
+""")
 
+_SUCCESS_RECOMMENDATION = Template("""
 ## 📋 최종 투자 권고 (Final Investment Recommendation)
 
 ### Investment Decision: **PROCEED** ✅
 
-**Rationale**: {final_decision_output.get('reasoning', 'N/A')}
+**Rationale**: $reasoning
 
-**Risk Assessment**: {risk_description}
+**Risk Assessment**: $risk_description
 
 ### Recommended Next Steps (30-60 days)
 
@@ -1008,7 +918,7 @@ def run_agent_6_report_generator(state: GraphState) -> GraphState:
 ### Deal Risks to Monitor
 
 **High Priority**:
-{_extract_risks(state)}
+$risks
 
 **Mitigation Required**:
 - Secure regulatory approvals within 90 days
@@ -1019,7 +929,7 @@ def run_agent_6_report_generator(state: GraphState) -> GraphState:
 
 | Metric | Current | 12-Month Target | Stretch Goal |
 |--------|---------|-----------------|--------------|
-| **ARR** | Early stage | $5M | $8M |
+| **ARR** | Early stage | $$5M | $$8M |
 | **Customers** | Pilots | 10+ institutions | 15+ |
 | **Team Size** | ~25 | 50+ | 75+ |
 | **Licenses** | 1 jurisdiction | 3 jurisdictions | 5 jurisdictions |
@@ -1027,7 +937,9 @@ def run_agent_6_report_generator(state: GraphState) -> GraphState:
 | **Burn Multiple** | N/A | < 2x | < 1.5x |
 
 ---
+""")
 
+_SUCCESS_IC_CHECKLIST = """
 ## 5️⃣ 투자 위원회 체크리스트
 
 ### Investment Committee Approval Checklist
@@ -1046,52 +958,430 @@ def run_agent_6_report_generator(state: GraphState) -> GraphState:
 **IC Recommendation**: **APPROVE** with standard terms
 
 ---
+"""
+
+_APPENDIX_HEAD = "\n## 📎 부록: 전체 평가 데이터\n"
+_APPENDIX_ITEM = Template("\n### $title\n")
+_APPENDIX_ITEMS = [
+    ("agent1", "Agent 1 (초기 평가)", "current_startup_data"),
+    ("agent2", "Agent 2 (기술 분석)", "tech_summary_output"),
+    ("agent3", "Agent 3 (시장 분석)", "market_assessment_output"),
+    ("agent4", "Agent 4 (경쟁 분석)", "competitor_analysis_output"),
+]
+
+_SUCCESS_FOOTER = Template("""
+**보고서 생성일**: $generated_at  
+**분석 시스템**: RWA Multi-Agent Investment Analysis v2.0  
+**분석가**: AI Investment Committee  
+**승인 상태**: Pending Partner Review  
+**다음 단계**: Investment Committee Presentation
+""")
+
+_REJECTION_SUMMARY = Template("""
+# 📋 AI 스타트업 투자 평가 보고서 (분석 종료)
+
+---
+
+## 📊 Executive Summary
+
+| 항목 | 내용 |
+|------|------|
+| **최종 투자 의견** | ❌ **투자 부적합 (루프 종료)** |
+| **투자자 페르소나** | $persona_upper |
+| **평가 대상 수** | $count개 스타트업 |
+| **평가 기간** | $generated_at |
+
+### 🔍 종합 평가 요약
+총 **$count개**의 스타트업을 검토하였으나, 현재 투자자 페르소나($persona)에 부합하는 '투자 적절' 대상을 찾지 못했습니다.
+
+---
+""")
 
-## 📎 부록: 전체 평가 데이터
+_EVALUATED_TABLE_HEAD = "| Rank | 스타트업 | 섹터 | 점수 | 결정 |\n|------|---------|------|------|------|\n"
+_EVALUATED_TABLE_ROW = Template("| $rank | $name | $sector | $score | $emoji $decision |\n")
 
-### Agent 1 (초기 평가)
-```json
-{json.dumps(state['current_startup_data'], indent=2, ensure_ascii=False)}
-```
+_DETAILED_EVALUATION = Template("""
+### $rank. $name
 
-### Agent 2 (기술 분석)
-```json
-{json.dumps(state.get('tech_summary_output', {}), indent=2, ensure_ascii=False)}
-```
+**기본 정보**
+- 섹터: $sector
+- 웹사이트: $website
+- 지역: $region
+- 펀딩 단계: $funding_stage
+
+**평가 점수**
+- Agent 1 총점: $total_score/100
+- Domain Fit: $domain_fit
+- Credibility: $credibility
+
+**최종 결정**: $decision
 
-### Agent 3 (시장 분석)
-```json
-{json.dumps(state.get('market_assessment_output', {}), indent=2, ensure_ascii=False)}
-```
+**주요 강점**
+$strength
+
+---
+""")
+
+_REJECTION_PERSONA = Template("""
+## 3️⃣ 투자자 페르소나 분석
+
+### $persona_upper Investor Profile
+
+$rationale
+
+### 페르소나별 평가 기준
+$weights
+
+---
+""")
+
+_REJECTION_FINDINGS = Template("""
+## 4️⃣ 종합 분석 및 권고사항
+
+### 📊 평가 결과 통계
+- **부정적 결정**: $negative건
+- **보류 결정**: $hold건
+- **투자 적절**: $approved건
+
+### 💡 주요 발견사항
+$findings
+
+### 📋 Next Steps & Recommendations
+
+1. **포트폴리오 확장 고려**
+   - 현재 후보군에서 적합한 투자 대상이 발견되지 않음
+   - 추가적인 Deal Sourcing 필요
+   - 다른 섹터나 지역으로 범위 확대 검토
+
+2. **평가 기준 재검토**
+   - 현재 페르소나($persona) 기준이 너무 엄격할 가능성
+   - '보류' 판정 받은 스타트업에 대한 재평가 고려
+   - 특정 기준의 가중치 조정 검토
+
+3. **직접 소싱 전략**
+   - 액셀러레이터/인큐베이터 파트너십 강화
+   - VC 네트워크를 통한 Co-investment 기회 탐색
+   - 컨퍼런스 및 데모데이 참석을 통한 직접 발굴
+   - Warm introduction을 통한 고품질 딜 확보
 
-### Agent 4 (경쟁 분석)
-```json
-{json.dumps(state.get('competitor_analysis_output', {}), indent=2, ensure_ascii=False)}
-```
+4. **심층 분석 권장 대상**
+   - 보류 판정 받은 스타트업 재검토
+   - 1:1 미팅을 통한 추가 정보 수집
+   - 업계 전문가 자문 활용
 
 ---
+""")
 
-**보고서 생성일**: {_get_timestamp()}  
+_RANKING_TABLE_HEAD = "| Rank | 스타트업 | 총점 | Domain Fit | Credibility |\n|------|---------|------|------------|-------------|\n"
+_RANKING_TABLE_ROW = Template("| $rank | $name | $score | $domain_fit | $credibility |\n")
+
+_REJECTION_FOOTER = Template("""
+**보고서 생성일**: $generated_at  
 **분석 시스템**: RWA Multi-Agent Investment Analysis v2.0  
-**분석가**: AI Investment Committee  
-**승인 상태**: Pending Partner Review  
-**다음 단계**: Investment Committee Presentation
+**평가 완료 사유**: $reason
+""")
+
+
+# ============================================================================
+# PART 4: 실패 보고서 생성 함수들
+# ============================================================================
+
+def _decision_emoji(decision: str) -> str:
+    return "✅" if decision == "투자 적절" else ("⏸️" if decision == "보류" else "❌")
+
+
+def _iter_evaluated_startups_table(startups, decisions) -> Iterator[str]:
+    """평가된 스타트업 테이블 (행 단위 생성)"""
+    if not startups:
+        yield "평가 데이터 없음"
+        return
+    yield _EVALUATED_TABLE_HEAD
+    for idx, (startup, decision) in enumerate(zip(startups, decisions), 1):
+        sector = startup.get('sector', 'N/A')[:40] + "..." if len(startup.get('sector', '')) > 40 else startup.get('sector', 'N/A')
+        yield _EVALUATED_TABLE_ROW.substitute(
+            rank=idx, name=startup.get('name', 'N/A'), sector=sector,
+            score=f"{startup.get('total_score', 0):.1f}", emoji=_decision_emoji(decision), decision=decision,
+        )
+
+
+def _iter_detailed_evaluations(startups, decisions) -> Iterator[str]:
+    """상세 평가 내용 (평가된 스타트업만, 스타트업 단위 생성)"""
+    for idx, (startup, decision) in enumerate(zip(startups[:len(decisions)], decisions), 1):
+        yield _DETAILED_EVALUATION.substitute(
+            rank=idx,
+            name=startup.get('name', 'Unknown'),
+            sector=startup.get('sector', 'N/A'),
+            website=startup.get('website', 'N/A'),
+            region=startup.get('region', 'N/A'),
+            funding_stage=startup.get('funding_stage', 'N/A'),
+            total_score=f"{startup.get('total_score', 0):.2f}",
+            domain_fit=f"{startup.get('domain_fit', 0):.2f}",
+            credibility=f"{startup.get('credibility_score', 0):.2f}",
+            decision=decision,
+            strength=startup.get('strength', 'N/A'),
+        )
+
+
+def _format_persona_weights(persona):
+    """페르소나별 가중치 표시"""
+    from RWA_Investment_Agent2.agent0_persona import PERSONA_WEIGHTS
+    
+    weights = PERSONA_WEIGHTS.get(persona, {})
+    
+    return f"""
+| 평가 항목 | 가중치 |
+|----------|--------|
+| Seed/Early Stage | {weights.get('seed_early', 0)*100:.0f}% |
+| Regional/ESG | {weights.get('regional_esg', 0)*100:.0f}% |
+| Growth + Partnership | {weights.get('growth_partnership', 0)*100:.0f}% |
+| Regulation/Monetization | {weights.get('regulation_monetization', 0)*100:.0f}% |
 """
+
+
+def _generate_key_findings(startups, decisions, persona):
+    """주요 발견사항 생성"""
+    if not startups:
+        return "- 평가 데이터 부족"
     
-    # ========================================================================
-    # Case 2: 실패/보류 - 종합 분석 보고서
-    # ========================================================================
+    avg_score = sum(s.get('total_score', 0) for s in startups[:len(decisions)]) / max(len(decisions), 1)
+    
+    return f"""
+- **평균 점수**: {avg_score:.2f}/100
+- **최고 점수**: {max((s.get('total_score', 0) for s in startups[:len(decisions)]), default=0):.2f}/100
+- **최저 점수**: {min((s.get('total_score', 0) for s in startups[:len(decisions)]), default=0):.2f}/100
+- **공통 약점**: 충분한 공개 정보 부족, 기술 성숙도 검증 필요
+- **전반적 평가**: {persona or 'conservative'} 투자자 기준으로 모든 후보가 리스크가 높게 평가됨
+"""
+
+
+def _iter_full_ranking(all_startups) -> Iterator[str]:
+    """전체 랭킹 표 (행 단위 생성)"""
+    if not all_startups:
+        yield "랭킹 데이터 없음"
+        return
+    yield _RANKING_TABLE_HEAD
+    for idx, startup in enumerate(all_startups, 1):
+        yield _RANKING_TABLE_ROW.substitute(
+            rank=idx, name=startup.get('name', 'N/A'), score=f"{startup.get('total_score', 0):.1f}",
+            domain_fit=f"{startup.get('domain_fit', 0):.2f}", credibility=f"{startup.get('credibility_score', 0):.2f}",
+        )
+
+
+def _ranking_rows(all_startups):
+    """JSON 출력용 랭킹 행 (순위, 이름, 점수)"""
+    return lambda: ({"rank": idx, "name": s.get('name'), "total_score": s.get('total_score'),
+                     "domain_fit": s.get('domain_fit'), "credibility_score": s.get('credibility_score')}
+                    for idx, s in enumerate(all_startups, 1))
+
+
+def _get_termination_reason(decisions, total_startups):
+    """종료 사유"""
+    if len(decisions) >= 5:
+        return f"5회 연속 투자 부적합 판정 ({', '.join(decisions)})"
+    elif len(decisions) >= total_startups:
+        return f"전체 {total_startups}개 스타트업 평가 완료"
     else:
-        report_content = _generate_rejection_report(state)
+        return "알 수 없는 사유"
+
+
+def _iter_rejection_sections(state: GraphState) -> Iterator[Section]:
+    """실패 보고서 섹션 (5회 누적 또는 리스트 소진)"""
+    decision_log = state["decision_log"]
+    all_startups = state.get("evaluation_results", [])
+    evaluated_startups = all_startups[:len(decision_log)]
+    persona = state['investor_persona']
+
+    yield Section("summary", "Executive Summary", _REJECTION_SUMMARY.substitute(
+        persona_upper=persona.upper(), persona=persona, count=len(decision_log),
+        generated_at=_report_timestamp(state),
+    ), data={"persona": persona, "decision_log": decision_log})
+    yield Section("evaluated", "평가된 스타트업 목록", chain(
+        ["\n## 1️⃣ 평가된 스타트업 목록\n\n"],
+        _iter_evaluated_startups_table(evaluated_startups, decision_log),
+        [_SECTION_BREAK],
+    ), data=lambda: ({"rank": idx, "name": s.get('name'), "sector": s.get('sector'),
+                      "total_score": s.get('total_score'), "decision": d}
+                     for idx, (s, d) in enumerate(zip(evaluated_startups, decision_log), 1)))
+    yield Section("details", "스타트업별 상세 평가", chain(
+        ["\n## 2️⃣ 스타트업별 상세 평가\n\n"],
+        _iter_detailed_evaluations(evaluated_startups, decision_log),
+        [_SECTION_BREAK],
+    ))
+    yield Section("persona", "투자자 페르소나 분석", _REJECTION_PERSONA.substitute(
+        persona_upper=persona.upper(), rationale=state.get('persona_rationale', 'N/A'),
+        weights=_format_persona_weights(persona),
+    ))
+    yield Section("findings", "종합 분석 및 권고사항", _REJECTION_FINDINGS.substitute(
+        negative=decision_log.count('부정적'), hold=decision_log.count('보류'),
+        approved=decision_log.count('투자 적절'),
+        findings=_generate_key_findings(evaluated_startups, decision_log, persona), persona=persona,
+    ))
+    yield Section("ranking", "부록: 전체 랭킹 데이터", chain(
+        ["\n## 📎 부록: 전체 랭킹 데이터\n\n### 초기 평가 전체 랭킹 (Agent 1)\n"],
+        _iter_full_ranking(all_startups),
+        [_SECTION_BREAK],
+    ), data=_ranking_rows(all_startups))
+    yield Section("footer", "보고서 정보", _REJECTION_FOOTER.substitute(
+        generated_at=_report_timestamp(state),
+        reason=_get_termination_reason(decision_log, len(all_startups)),
+    ))
+
+
+# ============================================================================
+# PART 5: 메인 함수
+# ============================================================================
+
+def _iter_success_sections(state: GraphState) -> Iterator[Section]:
+    """상세 성공 보고서 섹션 ("투자 적절")"""
+    startup = state["current_startup_data"]
+    final_decision_output = state.get("investment_decision_output", {})
+    total_score = final_decision_output.get("total_score", "N/A")
+    risk_rating, risk_description = _calculate_risk_rating(state)
+    checklist_scores = final_decision_output.get('checklist_scores', [])
+
+    yield Section("summary", "Executive Summary", _SUCCESS_SUMMARY.substitute(
+        startup_name=startup["name"],
+        sector=startup.get('sector', 'N/A'),
+        decision=final_decision_output.get("decision", "N/A"),
+        total_score=total_score,
+        score_pct=f"{total_score/20*100:.0f}",
+        persona_upper=state['investor_persona'].upper(),
+        website=startup.get('website', 'N/A'),
+        region=startup.get('region', 'N/A'),
+        funding_stage=startup.get('funding_stage', 'N/A'),
+        risk_rating=risk_rating,
+        thesis=_generate_investment_thesis(state),
+        highlights=_generate_key_highlights(state),
+        reasoning=final_decision_output.get('reasoning', 'N/A'),
+    ), data={"startup": startup["name"], "decision": final_decision_output.get("decision"),
+             "total_score": total_score, "risk_rating": risk_rating})
+    yield Section("checklist", "20-Point VC Checklist", _SUCCESS_CHECKLIST.substitute(
+        scores=_format_checklist_scores(checklist_scores),
+        detailed=_format_detailed_checklist(checklist_scores),
+    ), data={"checklist_scores": checklist_scores})
+    yield Section("tech", "기술 성숙도 분석", _HEADED_SECTION.substitute(
+        heading="2️⃣ 기술 성숙도 분석 (Agent 2)", body=_format_tech_summary(state.get('tech_summary_output', {}))))
+    yield Section("market", "시장성 분석", _HEADED_SECTION.substitute(
+        heading="3️⃣ 시장성 분석 (Agent 3 - RAG)", body=_format_market_analysis(state.get('market_assessment_output', {}))))
+    yield Section("competitors", "경쟁 환경 분석", _HEADED_SECTION.substitute(
+        heading="4️⃣ 경쟁 환경 분석 (Agent 4)",
+        body=_format_competitor_analysis(state.get('competitor_analysis_output', {}))))
+    yield Section("financial", "재무 분석", _SECTION.substitute(body=_format_financial_analysis(state)),
+                  data=_report_extraction(state, "financial"))
+    yield Section("team", "팀 분석", _SECTION.substitute(body=_format_team_analysis(state)),
+                  data=_report_extraction(state, "team"))
+    yield Section("terms", "투자 조건 제안", _SECTION.substitute(body=_format_investment_terms(state)))
+    yield Section("risks", "리스크 분석 및 완화 전략", _SECTION.substitute(body=_format_risk_mitigation(state)))
+    yield Section("recommendation", "최종 투자 권고", _SUCCESS_RECOMMENDATION.substitute(
+        reasoning=final_decision_output.get('reasoning', 'N/A'),
+        risk_description=risk_description,
+        risks=_extract_risks(state),
+    ))
+    yield Section("ic_checklist", "투자 위원회 체크리스트", _SUCCESS_IC_CHECKLIST)
+
+    def appendix_chunks():
+        yield _APPENDIX_HEAD
+        for _, title, key in _APPENDIX_ITEMS:
+            yield _APPENDIX_ITEM.substitute(title=title)
+            yield from iter_json_block(state.get(key, {}))  # json.dumps 문자열 없이 조각 단위로 기록
+            yield "\n"
+        yield "\n---\n"
+
+    yield Section("appendix", "부록: 전체 평가 데이터", appendix_chunks(),
+                  data={name: state.get(key, {}) for name, _, key in _APPENDIX_ITEMS})
+    yield Section("footer", "보고서 정보", _SUCCESS_FOOTER.substitute(generated_at=_report_timestamp(state)))
+
+
+def iter_report_sections(state: GraphState) -> Iterator[Section]:
+    """
+    Yields the final report section by section.
+    
+    docstring: Creates either a detailed success report or a comprehensive 
+               analysis report based on evaluation outcomes. Sections are
+               produced lazily so report_writer can stream them to disk.
+               Makes no LLM calls when `report_extractions` is in the
+               state, so a saved snapshot can be re-rendered offline
+               (render_report.py).
+    """
+    final_decision = (state.get("investment_decision_output") or {}).get("decision", "N/A")
+    if final_decision == "투자 적절":
+        return _iter_success_sections(state)
+    return _iter_rejection_sections(state)
+
+
+def report_title(state: GraphState) -> str:
+    if (state.get("investment_decision_output") or {}).get("decision") == "투자 적절":
+        return f"AI 스타트업 투자 평가 보고서: {state['current_startup_data']['name']}"
+    return "AI 스타트업 투자 평가 보고서 (분석 종료)"
+
+
+def report_meta(state: GraphState) -> dict:
+    decision = state.get("investment_decision_output") or {}
+    return {
+        "generated_at": _report_timestamp(state),
+        "persona": state.get("investor_persona"),
+        "decision": decision.get("decision"),
+        "startup": (state.get("current_startup_data") or {}).get("name"),
+        "decision_log": state.get("decision_log", []),
+    }
+
+
+def render_report(state: GraphState) -> str:
+    """최종 Markdown 보고서를 문자열로 (미리보기/테스트용, 파일 기록은 write_report_files)"""
+    return render_markdown(iter_report_sections(state))
+
+
+def write_report_files(state: GraphState, report_path: str, formats=None) -> list:
+    """
+    Streams the report to one file per format and returns the written paths.
+    
+    docstring: 'md' goes to `report_path` itself, other formats replace its
+               extension (Final_Investment_Report.html / .json).
+    """
+    formats = formats or REPORT_FORMATS
+    _check_report_formats(formats)
+    paths = []
+    for fmt in formats:
+        path = report_path if fmt == "md" else format_path(report_path, fmt)
+        paths.append(write_report(path, iter_report_sections(state), fmt,
+                                  title=report_title(state), meta=report_meta(state)))
+    return paths
+
+
+def run_agent_6_report_generator(state: GraphState) -> GraphState:
+    """
+    Agent 6: Generates comprehensive VC-grade investment report.
+    
+    docstring: Runs the LLM extractions the success report needs, streams
+               the report to disk in every format in REPORT_FORMATS, and
+               saves the final state (with the extractions) next to it as
+               <report>.state.json for re-rendering. `final_report` holds
+               the path of the first written report, not its content.
+    """
+    print("--- (6) EXECUTING AGENT 6: FINAL REPORT GENERATION ---")
+
+    final_decision = (state.get("investment_decision_output") or {}).get("decision", "N/A")
+    state = {
+        **state,
+        "report_generated_at": _get_timestamp(),
+        "report_extractions": extract_report_data(state) if final_decision == "투자 적절" else None,
+    }
     
     # ========================================================================
-    # 최종 보고서 파일 저장
+    # 최종 보고서 파일 (형식별 스트리밍 기록) + 상태 스냅샷 저장
     # ========================================================================
+    report_path = state.get("report_path") or "Final_Investment_Report.md"
+    written = []
     try:
-        with open("Final_Investment_Report.md", "w", encoding="utf-8") as f:
-            f.write(report_content)
-        print("--- (6) Final_Investment_Report.md 파일이 생성되었습니다. ---")
+        written = write_report_files(state, report_path, AGENT6_REPORT_FORMATS)
+        print(f"--- (6) {', '.join(written)} 파일이 생성되었습니다. ---")
     except Exception as e:
         print(f"--- (6) 보고서 파일 저장 실패: {e} ---")
+    try:
+        saved = save_state_snapshot(state, snapshot_path(report_path))
+        if saved:
+            print(f"--- (6) 상태 스냅샷 저장: {saved} (python render_report.py {saved}) ---")
+    except Exception as e:
+        print(f"--- (6) 상태 스냅샷 저장 실패: {e} ---")
 
-    return {**state, "final_report": report_content}
\ No newline at end of file
+    return {**state, "final_report": written[0] if written else None}
@@ -0,0 +1,105 @@
+# FILE: batch_runner.py
+# (헤드리스 배치 실행기: JSONL 작업 목록 → 워커 풀 → 결과 JSONL)
+
+"""
+Headless batch mode.
+
+Each non-empty input line is one JSON job, e.g.
+    {"job_id": "lp-001", "persona": "conservative"}
+    {"job_id": "lp-002", "persona_answers": [5, 4, 2, 1, 5], "startups_path": "deals_q3.json"}
+Optional fields: weights, report_path, recursion_limit. Lines starting with '#' are skipped.
+
+Usage: python batch_runner.py [requests.jsonl] [--output batch_results.jsonl] [--workers 4]
+
+All jobs run in one process with one compiled graph, so they share the
+search, LLM and embedding caches; each job still gets its own search memo,
+counters and speculative prefetcher (jobs.run_job), so its record's
+`search` stats cover that job only. One result record is written per job
+as soon as it finishes (completion order; `input_line` links it back).
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _iter_jobs(path: str):
+    """(줄 번호, 작업 dict 또는 파싱 오류 메시지) 를 한 줄씩 생성"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError("job must be a JSON object")
+                yield line_no, job
+            except ValueError as e:
+                yield line_no, f"invalid job line: {e}"
+
+
+def run_batch(input_path: str, output_path: str, workers: int) -> dict:
+    from main import build_main_graph
+    from jobs import run_job
+    from metrics import run_metrics, RUN_METRICS_PATH
+    from cassette import save_cassette
+
+    app = build_main_graph()
+    run_metrics.reset()
+    write_lock = threading.Lock()
+    pending = threading.BoundedSemaphore(workers * 2) # 대기 작업 수 제한 (대용량 입력에서도 메모리 일정)
+    summary = {"ok": 0, "error": 0, "search": {"queries": 0, "memo_hits": 0, "coalesced": 0}}
+    started = time.perf_counter()
+
+    with open(output_path, "w", encoding="utf-8") as out:
+        def _write(record: dict) -> None:
+            with write_lock:
+                summary["ok" if record.get("status") == "ok" else "error"] += 1
+                for k, v in (record.get("search") or {}).items():
+                    summary["search"][k] += v  # 작업별 검색 통계 합계
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+
+        def _run(line_no: int, job: dict) -> None:
+            try:
+                record = run_job(app, {"job_id": f"line-{line_no}", **job})
+                _write({"input_line": line_no, **record})
+            finally:
+                pending.release()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as executor:
+            for line_no, job in _iter_jobs(input_path):
+                if isinstance(job, str):
+                    _write({"input_line": line_no, "job_id": f"line-{line_no}", "status": "error", "error": job})
+                    continue
+                pending.acquire()
+                executor.submit(_run, line_no, job)
+
+    summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    summary["metrics_path"] = run_metrics.write_json(RUN_METRICS_PATH)  # 배치 전체 노드별 지표
+    save_cassette()  # RWA_CASSETTE_MODE=record일 때만 저장
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run evaluation jobs from a JSONL file")
+    parser.add_argument("input", nargs="?", default="requests.jsonl", help="job file (one JSON job per line)")
+    parser.add_argument("--output", default="batch_results.jsonl", help="result file (one JSON record per job)")
+    parser.add_argument("--workers", type=int, default=4, help="number of jobs run concurrently")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(args.input, args.output, max(1, args.workers))
+    print(f"✅ Batch complete: {summary['ok']} ok, {summary['error']} failed "
+          f"in {summary['elapsed_seconds']:.1f}s → {args.output} (metrics: {summary['metrics_path']})")
+    search = summary["search"]
+    print(f"🔎 검색 통계 (작업 합계): 요청 {search['queries']}건, "
+          f"메모 {search['memo_hits']} / 병합 {search['coalesced']}")
+    return 0 if summary["error"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
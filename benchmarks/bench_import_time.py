@@ -0,0 +1,78 @@
+# FILE: benchmarks/bench_import_time.py
+# (config 임포트 시간 벤치마크: 지연 초기화 vs 기존 즉시 초기화)
+
+"""
+Measures how long `import config` takes in a fresh interpreter.
+
+docstring: "lazy" is the current behaviour (resources are built on first
+           use). "eager" calls config.warm_up() right after the import, which
+           builds the same LLM clients, Tavily client and embedding model the
+           old config.py created at import time, so it stands in for the
+           "before" number. Each mode runs in its own subprocess so module
+           caches do not leak between samples.
+
+Usage: python benchmarks/bench_import_time.py [--repeat 5] [--output result.json]
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+import config
+t1 = time.perf_counter()
+if {eager}:
+    config.warm_up()
+t2 = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": t1 - t0,
+    "total_seconds": t2 - t0,
+    "torch_loaded": "torch" in sys.modules,
+    "langchain_openai_loaded": "langchain_openai" in sys.modules,
+}}))
+"""
+
+
+def _sample(eager: bool) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(eager=eager)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="config import-time benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args()
+
+    results = {}
+    for mode, eager in (("lazy", False), ("eager", True)):
+        samples = [_sample(eager) for _ in range(args.repeat)]
+        results[mode] = {
+            "median_total_seconds": round(statistics.median(s["total_seconds"] for s in samples), 4),
+            "median_import_seconds": round(statistics.median(s["import_seconds"] for s in samples), 4),
+            "torch_loaded": samples[-1]["torch_loaded"],
+            "langchain_openai_loaded": samples[-1]["langchain_openai_loaded"],
+        }
+
+    print(f"{'mode':8s} {'import(s)':>10s} {'ready(s)':>10s} {'torch':>6s} {'openai':>7s}")
+    for mode, r in results.items():
+        print(f"{mode:8s} {r['median_import_seconds']:10.3f} {r['median_total_seconds']:10.3f} "
+              f"{str(r['torch_loaded']):>6s} {str(r['langchain_openai_loaded']):>7s}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# FILE: benchmarks/fake_openai.py
+# (오프라인 벤치마크용 OpenAI 호환 로컬 서버: 에이전트별 프롬프트를 인식해 결정적 응답 반환)
+
+"""
+Minimal OpenAI-compatible chat completions server.
+
+Recognises the prompts of Agents 1-6 and answers with deterministic,
+schema-valid content derived from a hash of the prompt, after a
+configurable latency. Point ChatOpenAI at it with
+OPENAI_BASE_URL=http://127.0.0.1:<port>/v1 (see offline_bench.py).
+
+Usage: python benchmarks/fake_openai.py [--port 8799] [--latency 0.05]
+"""
+
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _rng(prompt: str):
+    """프롬프트 해시 기반 결정적 정수 생성기"""
+    digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+    i = 0
+    while True:
+        yield digest[i % len(digest)] + (i // len(digest))
+        i += 1
+
+
+def _criteria_scores(rng) -> dict:
+    return {c: {"score": 40 + next(rng) % 60, "rationale": "offline"} for c in
+            ("seed_early", "regional_esg", "growth_partnership", "regulation_monetization")}
+
+
+def respond(prompt: str) -> str:
+    """프롬프트 종류별 응답 (모르는 프롬프트는 짧은 텍스트)"""
+    rng = _rng(prompt)
+    if "senior VC partner" in prompt:                              # Agent 5 (컨텍스트에 다른 에이전트 출력 포함 → 먼저 확인)
+        passed = 8 + next(rng) % 10
+        return json.dumps({"scores": [1] * passed + [0] * (20 - passed), "reasoning": "Offline evaluation."})
+    if "two sections of a VC investment report" in prompt:       # Agent 6 재무+팀 통합 추출
+        return json.dumps({"financial": json.loads(respond("estimate financial metrics")),
+                           "team": json.loads(respond("team information"))})
+    if "VC analyst and data extraction expert" in prompt:          # Agent 1 단일 호출 모드
+        return json.dumps({"website": "https://offline.example", "region": "Asia",
+                           "funding_stage": "Series A", "scores": _criteria_scores(rng)})
+    if "data extraction expert" in prompt:                         # Agent 1 정보 추출
+        return json.dumps({"website": "https://offline.example", "region": "Asia", "funding_stage": "Seed"})
+    if "You are a VC analyst" in prompt:                           # Agent 1 점수
+        return json.dumps(_criteria_scores(rng))
+    if "Adjust RWA tech scores" in prompt:                         # Agent 2 점수 보정
+        return json.dumps({})
+    if "Summarize 1" in prompt and "evidence items" in prompt:     # Agent 2 증거
+        return json.dumps({dim: [{"snippet": f"offline evidence for {dim}", "url": "https://offline.example",
+                                  "source": "other"}]
+                           for dim in ("domain_fit", "tech_maturity", "credibility", "compliance_risk", "ecosystem")})
+    if "positioning sentence" in prompt:                           # Agent 2 결정 노트
+        return "Offline positioning: balanced potential with moderate regulatory exposure."
+    if "markdown DD report" in prompt:                             # Agent 2 내러티브
+        return "\n\n".join(f"## {h}\nOffline narrative section." for h in
+                           ("Overview", "Technology & Architecture", "Governance & Compliance",
+                            "Credibility & Ecosystem", "Risks & Watchpoints", "Bottom Line"))
+    if "analyze the market for" in prompt:                         # Agent 3
+        return json.dumps({"tam_sam_som": "TAM $10B / SAM $2B / SOM $200M", "cagr": "25%",
+                           "target_audience": "Institutional investors"})
+    if "strategy consultant" in prompt:                            # Agent 4
+        return json.dumps({"competitors": [{"name": "Competitor A", "swot": "Strength: scale, Weakness: cost"},
+                                           {"name": "Competitor B", "swot": "Strength: brand, Weakness: speed"}]})
+    if "estimate financial metrics" in prompt:                     # Agent 6 재무
+        return json.dumps({"total_funding_raised": 20.0, "last_round_size": 10.0, "lead_investors": ["Offline Ventures"],
+                           "estimated_valuation": 80.0, "estimated_burn_rate": 600, "estimated_runway": 16,
+                           "revenue_model": "Platform fees", "revenue_status": "Early revenue"})
+    if "team information" in prompt:                               # Agent 6 팀
+        return json.dumps({"ceo_name": "Offline CEO", "ceo_background": "Fintech", "cto_name": "Offline CTO",
+                           "cto_background": "Blockchain", "team_size": 30, "key_hires": ["Head of Compliance"],
+                           "advisory_board": ["Not publicly disclosed"]})
+    return "OK"
+
+
+class FakeOpenAIServer:
+    """Runs the fake API on a background thread (port 0 = pick a free port)."""
+
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+                content = respond(prompt)
+                if server.latency > 0:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.requests += 1
+                prompt_tokens, completion_tokens = max(1, len(prompt) // 4), max(1, len(content) // 4)
+                payload = json.dumps({
+                    "id": f"chatcmpl-offline-{server.requests}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "gpt-4o-mini"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                                 "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                              "total_tokens": prompt_tokens + completion_tokens},
+                }).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible server for offline runs")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every completion")
+    args = parser.parse_args(argv)
+
+    server = FakeOpenAIServer(args.latency, port=args.port).start()
+    print(f"🧪 Fake OpenAI server on {server.base_url} (latency {args.latency}s)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+# FILE: benchmarks/offline_bench.py
+# (오프라인 종단간 벤치마크: 로컬 OpenAI 대체 서버 + 합성 검색/임베딩으로 build_main_graph() 실행)
+
+"""
+Deterministic offline benchmark of the whole pipeline.
+
+docstring: Starts benchmarks/fake_openai.py's server in this process and
+           runs one headless job per startup-list size in its own
+           subprocess with RWA_OFFLINE=1 (synthetic search results,
+           deterministic embeddings, no LangSmith) and a cold cache
+           directory. For each size it records per-node latency (from
+           metrics.py), Agent 1 throughput, LLM/search call counts and
+           peak RSS. Results are saved as benchmarks/results/<commit>.json
+           so two commits can be compared with --compare.
+
+Usage: python benchmarks/offline_bench.py [--sizes 10,100,1000] [--llm-latency 0.02]
+       python benchmarks/offline_bench.py --compare benchmarks/results/<base>.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+SECTORS = ["Real Estate Tokenization", "Private Credit", "Treasury Tokenization",
+           "Carbon Credits", "Trade Finance", "Art & Collectibles"]
+STRENGTHS = ["regulated custody and KYC/AML onboarding", "institutional partnerships with banks",
+             "on-chain settlement with ESG reporting", "early-stage team with strong tech",
+             "licensed broker-dealer with recurring fees"]
+
+
+def generate_startups(path: str, size: int) -> None:
+    """결정적 합성 스타트업 목록 (JSONL)"""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(size):
+            f.write(json.dumps({
+                "name": f"BenchCo{i:05d}",
+                "sector": SECTORS[i % len(SECTORS)],
+                "strength": f"{STRENGTHS[(i * 7) % len(STRENGTHS)]} (variant {i % 13})",
+            }) + "\n")
+
+
+def _peak_rss_mb() -> float:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)  # macOS: bytes, Linux: KB
+
+
+def _child(args) -> None:
+    """하위 프로세스: 그래프 1회 실행 후 결과 JSON 기록"""
+    started = time.perf_counter()
+    from main import build_main_graph
+    from jobs import run_job
+    from metrics import run_metrics
+    import_seconds = time.perf_counter() - started
+
+    app = build_main_graph()
+    run_metrics.reset()
+    record = run_job(app, {
+        "job_id": f"bench-{args.size}",
+        "persona": args.persona,
+        "startups_path": args.startups,
+        "report_path": os.path.join(os.path.dirname(args.result), "report.md"),
+    })
+    snap = run_metrics.snapshot()
+    agent1_seconds = snap["nodes"].get("agent_1_search", {}).get("wall_seconds", 0.0)
+
+    result = {
+        "size": args.size,
+        "status": record["status"],
+        "error": record.get("error"),
+        "decision": record.get("decision"),
+        "startups_analysed": len(record.get("decision_log") or []),
+        "import_seconds": round(import_seconds, 3),
+        "elapsed_seconds": record["elapsed_seconds"],
+        "agent1_startups_per_second": round(args.size / agent1_seconds, 2) if agent1_seconds else None,
+        "llm_calls": snap["totals"]["llm_calls"],
+        "search_calls": snap["totals"]["search_calls"],
+        "peak_rss_mb": _peak_rss_mb(),
+        "nodes": {name: {"calls": row["calls"], "wall_seconds": round(row["wall_seconds"], 4),
+                         "llm_calls": row["llm_calls"]}
+                  for name, row in snap["nodes"].items()},
+    }
+    with open(args.result, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+
+def _run_size(size: int, args, base_url: str) -> dict:
+    workdir = tempfile.mkdtemp(prefix=f"rwa_bench_{size}_")
+    startups = os.path.join(workdir, "startups.jsonl")
+    result_path = os.path.join(workdir, "result.json")
+    generate_startups(startups, size)
+
+    env = {
+        **os.environ,
+        "RWA_OFFLINE": "1",
+        "OFFLINE_SEARCH_LATENCY": str(args.search_latency),
+        "OPENAI_API_KEY": "sk-offline",
+        "OPENAI_BASE_URL": base_url,
+        "OPENAI_API_BASE": base_url,
+        "LANGCHAIN_TRACING_V2": "false",
+        "LANGSMITH_TRACING": "false",
+        "RWA_CACHE_DIR": os.path.join(workdir, "cache"),  # 매 실행 콜드 캐시
+        "RUN_METRICS_PATH": os.path.join(workdir, "run_metrics.json"),
+        "SEARCH_RATE_PER_SEC": "0",
+        # 패키지 접두사(RWA_Investment_Agent2.) import와 최상위 import 모두 해석되도록
+        "PYTHONPATH": os.pathsep.join([ROOT, os.path.dirname(ROOT), os.environ.get("PYTHONPATH", "")]),
+    }
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", "--size", str(size),
+           "--startups", startups, "--result", result_path, "--persona", args.persona]
+    proc = subprocess.run(cmd, cwd=workdir, env=env,
+                          stdout=None if args.verbose else subprocess.DEVNULL,
+                          stderr=None if args.verbose else subprocess.PIPE, text=True)
+    if proc.returncode != 0 or not os.path.exists(result_path):
+        return {"size": size, "status": "error", "error": (proc.stderr or "")[-2000:]}
+    with open(result_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _git_revision() -> dict:
+    def git(*cmd):
+        return subprocess.run(["git", *cmd], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown",
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+# 비교 지표: (키, 낮을수록 좋음 여부)
+_COMPARE_METRICS = [("elapsed_seconds", True), ("peak_rss_mb", True), ("llm_calls", True),
+                    ("search_calls", True), ("agent1_startups_per_second", False)]
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> int:
+    """기준 결과 대비 변화율 출력, threshold 이상 악화된 지표 수 반환"""
+    base_by_size = {r["size"]: r for r in baseline["runs"]}
+    regressions = 0
+    print(f"\n📊 {baseline['revision']['commit']} → {current['revision']['commit']}")
+    print(f"{'size':>6s} {'metric':28s} {'base':>10s} {'current':>10s} {'change':>8s}")
+    for run in current["runs"]:
+        base = base_by_size.get(run["size"])
+        if base is None or run.get("status") != "ok" or base.get("status") != "ok":
+            continue
+        for key, lower_is_better in _COMPARE_METRICS:
+            b, c = base.get(key), run.get(key)
+            if not b or c is None:
+                continue
+            change = (c - b) / b
+            worse = change > threshold if lower_is_better else change < -threshold
+            regressions += worse
+            print(f"{run['size']:6d} {key:28s} {b:10.2f} {c:10.2f} {change:+7.1%}{' ⚠️' if worse else ''}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark")
+    parser.add_argument("--sizes", default="10,100,1000", help="comma-separated startup list sizes")
+    parser.add_argument("--llm-latency", type=float, default=0.02, help="fake OpenAI latency per call (s)")
+    parser.add_argument("--search-latency", type=float, default=0.0, help="offline search latency per call (s)")
+    parser.add_argument("--persona", default="conservative", choices=["aggressive", "conservative"])
+    parser.add_argument("--output-dir", default=RESULTS_DIR)
+    parser.add_argument("--compare", help="baseline result JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change reported as regression")
+    parser.add_argument("--verbose", action="store_true", help="show pipeline output of each run")
+    # 내부용 (하위 프로세스)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--startups", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args)
+        return 0
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from fake_openai import FakeOpenAIServer
+
+    server = FakeOpenAIServer(args.llm_latency).start()
+    runs = []
+    try:
+        for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+            print(f"🏃 size={size} ...", flush=True)
+            runs.append(_run_size(size, args, server.base_url))
+    finally:
+        server.stop()
+
+    result = {
+        "revision": _git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {"llm_latency": args.llm_latency, "search_latency": args.search_latency,
+                   "persona": args.persona, "python": sys.version.split()[0]},
+        "runs": runs,
+    }
+
+    print(f"\n{'size':>6s} {'status':>6s} {'total(s)':>9s} {'agent1/s':>9s} {'llm':>5s} {'search':>6s} {'rss(MB)':>8s}")
+    for r in runs:
+        if r["status"] != "ok":
+            print(f"{r['size']:6d} {'error':>6s}  {str(r.get('error'))[-200:]}")
+            continue
+        print(f"{r['size']:6d} {'ok':>6s} {r['elapsed_seconds']:9.2f} {r['agent1_startups_per_second'] or 0:9.1f} "
+              f"{r['llm_calls']:5d} {r['search_calls']:6d} {r['peak_rss_mb']:8.1f}")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    name = result["revision"]["commit"] + ("-dirty" if result["revision"]["dirty"] else "")
+    path = os.path.join(args.output_dir, f"{name}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(result, json.load(f), args.threshold)
+        return 1 if regressions else 0
+    return 0 if all(r["status"] == "ok" for r in runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+# FILE: cassette.py
+# (실행 녹화/재생: 한 실행의 모든 웹 검색과 LLM 응답을 압축 번들에 저장하고 네트워크 없이 재생)
+
+"""
+Record/replay cassettes for external calls.
+
+RWA_CASSETTE_MODE=record captures every provider search (below the run memo
+and single-flight layers in config) and every LLM request/response of
+Agents 1-6, with the latency observed at record time, into one gzip JSON
+bundle (RWA_CASSETTE_PATH). RWA_CASSETTE_MODE=replay serves them back with
+zero network: at full speed, or with the recorded latencies when
+RWA_CASSETTE_REALTIME=1. Identical requests are replayed in recorded
+order (the last answer repeats once a key is exhausted).
+
+Local work (sentence-transformers embeddings, report rendering) is not
+recorded; it runs normally, which is what makes replaying a changed
+agent6_ReportGen through a recorded run meaningful.
+"""
+
+import os
+import gzip
+import json
+import time
+import atexit
+import hashlib
+import threading
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+RWA_CASSETTE_MODE = os.getenv("RWA_CASSETTE_MODE", "").lower()  # '' | record | replay
+RWA_CASSETTE_PATH = os.getenv("RWA_CASSETTE_PATH", "run_cassette.json.gz")
+RWA_CASSETTE_REALTIME = os.getenv("RWA_CASSETTE_REALTIME", "").lower() in {"1", "true", "yes"}
+
+CASSETTE_FORMAT_VERSION = 1
+
+
+class CassetteMiss(LookupError):
+    """Replay found no recorded answer for a request (the run diverged from the recording)."""
+
+
+def llm_key(prompt: str, llm_string: str) -> str:
+    """LLM 요청 키 (LLMResponseCache와 동일: 모델 설정 + 직렬화된 메시지)"""
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    In-memory recording of one run's external calls.
+
+    docstring: Entries are grouped per kind ('llm' / 'search') and key, each
+               a list of {"response", "latency"} in call order. Replay keeps
+               a cursor per key so repeated identical requests get the
+               answers they got at record time.
+    """
+
+    def __init__(self, mode: str, path: str, realtime: bool = False):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode!r} (expected 'record' or 'replay')")
+        self.mode = mode
+        self.path = path
+        self.realtime = realtime
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, List[dict]]] = {"llm": {}, "search": {}}
+        self._cursors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._pending: Dict[str, deque] = defaultdict(deque)  # 녹화 중인 LLM 호출 시작 시각 (키별 FIFO)
+        self.meta: dict = {}
+        self.stats = {"recorded": 0, "replayed": 0, "misses": 0}
+        if mode == "replay":
+            self.load()
+
+    # --- 파일 입출력 ---
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Cassette not found: {self.path} (record one with RWA_CASSETTE_MODE=record)")
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            bundle = json.load(f)
+        if bundle.get("format") != CASSETTE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported cassette format: {bundle.get('format')!r}")
+        self.meta = bundle.get("meta", {})
+        self._entries = {"llm": bundle.get("llm", {}), "search": bundle.get("search", {})}
+
+    def save(self) -> Optional[str]:
+        """녹화 내용을 gzip JSON으로 저장 (임시 파일 → rename으로 원자적 교체). 재생 모드에서는 무시"""
+        if self.mode != "record":
+            return None
+        with self._lock:
+            bundle = {
+                "format": CASSETTE_FORMAT_VERSION,
+                "meta": {**self.meta, "saved_at": datetime.now().isoformat(timespec="seconds"),
+                         "llm_calls": sum(len(v) for v in self._entries["llm"].values()),
+                         "search_calls": sum(len(v) for v in self._entries["search"].values())},
+                "llm": self._entries["llm"],
+                "search": self._entries["search"],
+            }
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(bundle, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        return self.path
+
+    # --- 녹화/재생 ---
+    def record(self, kind: str, key: str, response, latency: float) -> None:
+        with self._lock:
+            self._entries[kind].setdefault(key, []).append({"response": response, "latency": round(latency, 4)})
+            self.stats["recorded"] += 1
+
+    def replay(self, kind: str, key: str) -> Tuple[object, float]:
+        """(기록된 응답, 재생 지연) 반환. 기록이 없으면 CassetteMiss"""
+        with self._lock:
+            entries = self._entries[kind].get(key)
+            if not entries:
+                self.stats["misses"] += 1
+                raise CassetteMiss(f"no recorded {kind} response for key {key[:12]}… in {self.path}")
+            cursor = self._cursors[(kind, key)]
+            self._cursors[(kind, key)] = cursor + 1
+            entry = entries[min(cursor, len(entries) - 1)]
+            self.stats["replayed"] += 1
+        return entry["response"], (entry["latency"] if self.realtime else 0.0)
+
+    def start_llm(self, key: str) -> None:
+        with self._lock:
+            self._pending[key].append(time.perf_counter())
+
+    def finish_llm(self, key: str) -> float:
+        with self._lock:
+            pending = self._pending.get(key)
+            started = pending.popleft() if pending else time.perf_counter()
+        return time.perf_counter() - started
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """RWA_CASSETTE_MODE에 따른 프로세스 공유 카세트 (모드 미설정 시 None)"""
+    global _cassette
+    if not RWA_CASSETTE_MODE:
+        return None
+    with _cassette_lock:
+        if _cassette is None:
+            _cassette = Cassette(RWA_CASSETTE_MODE, RWA_CASSETTE_PATH, RWA_CASSETTE_REALTIME)
+            if _cassette.mode == "record":
+                _cassette.meta["created_at"] = datetime.now().isoformat(timespec="seconds")
+                atexit.register(_cassette.save)  # 명시적 save_cassette() 없이 종료해도 저장
+                print(f"📼 카세트 녹화: {RWA_CASSETTE_PATH}")
+            else:
+                print(f"📼 카세트 재생: {RWA_CASSETTE_PATH} "
+                      f"({'기록된 지연 재현' if RWA_CASSETTE_REALTIME else '최대 속도'}, 네트워크 미사용)")
+        return _cassette
+
+
+def save_cassette() -> Optional[str]:
+    """녹화 중이면 현재까지의 내용을 저장하고 경로 반환"""
+    return _cassette.save() if _cassette is not None else None
+
+
+def cassette_llm_cache(cassette: Cassette, inner=None):
+    """ChatOpenAI의 cache 훅에 연결할 카세트 (inner: 녹화 시 함께 쓰는 LLM 응답 디스크 캐시)"""
+    from langchain_core.caches import BaseCache
+    from langchain_core.load import dumps, loads
+
+    class CassetteLLMCache(BaseCache):
+        """
+        LangChain cache that records or replays every chat call.
+
+        docstring: record: lookups go to `inner` (a hit is recorded with
+                   zero latency); on a miss the time until LangChain's
+                   `update` is the recorded latency. replay: lookups are
+                   served from the cassette only and a missing request
+                   raises CassetteMiss instead of reaching the network.
+        """
+
+        def lookup(self, prompt, llm_string):
+            key = llm_key(prompt, llm_string)
+            if cassette.mode == "replay":
+                response, latency = cassette.replay("llm", key)
+                if latency:
+                    time.sleep(latency)
+                return [loads(g) for g in response]
+            cached = inner.lookup(prompt, llm_string) if inner is not None else None
+            if cached is not None:
+                cassette.record("llm", key, [dumps(g) for g in cached], 0.0)
+                return cached
+            cassette.start_llm(key)
+            return None
+
+        def update(self, prompt, llm_string, return_val):
+            if cassette.mode != "record":
+                return
+            key = llm_key(prompt, llm_string)
+            cassette.record("llm", key, [dumps(g) for g in return_val], cassette.finish_llm(key))
+            if inner is not None:
+                inner.update(prompt, llm_string, return_val)
+
+        def clear(self, **kwargs):
+            if inner is not None:
+                inner.clear(**kwargs)
+
+    return CassetteLLMCache()
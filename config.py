@@ -11,112 +11,522 @@ warnings.filterwarnings("ignore", category=RuntimeWarning)
 warnings.filterwarnings("ignore")  # 모든 경고 무시
 
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain_community.tools.tavily_search import TavilySearchResults
-from tavily import TavilyClient
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_teddynote import logging
-from duckduckgo_search import DDGS  # 기존 패키지 그대로 사용
+import re
 import time
+import asyncio
+import hashlib
+import functools
+import threading
+import contextlib
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from disk_cache import DiskCache, CACHE_DIR
+from rate_limiter import TokenBucket
+from singleflight import SingleFlight
+from search_providers import AllProvidersFailed, CircuitBreaker, ProviderPool, SearchProvider
+from metrics import bind_context, llm_metrics_handler, run_metrics
+from cassette import CassetteMiss, cassette_llm_cache, get_cassette
 
+# .env는 가벼우므로 즉시 로드 (아래 환경 변수 기반 설정값이 의존)
 load_dotenv()
-logging.langsmith("RWA-Multi-Agent-Modular")
 
-if not os.getenv("OPENAI_API_KEY"):
-    raise ValueError("OPENAI_API_KEY not found in .env file")
+# 오프라인 모드 (벤치마크용): 검색/임베딩/LangSmith 대신 결정적 로컬 대체물 사용
+# (LLM은 OPENAI_BASE_URL로 로컬 OpenAI 호환 서버를 지정, benchmarks/offline_bench.py 참고)
+RWA_OFFLINE = os.getenv("RWA_OFFLINE", "").lower() in {"1", "true", "yes"}
+OFFLINE_SEARCH_LATENCY = float(os.getenv("OFFLINE_SEARCH_LATENCY", 0))
+
+# === 무거운 자원은 최초 사용 시 생성 (LangChain/OpenAI/torch import 지연) ===
+_resources: dict = {}
+_resource_lock = threading.RLock()
+
+
+def _lazy_resource(factory):
+    """Decorator: turns a factory into a thread-safe accessor that builds its value once."""
+    name = factory.__name__
+
+    @functools.wraps(factory)
+    def accessor():
+        if name in _resources:
+            return _resources[name]
+        with _resource_lock:
+            if name not in _resources:
+                _resources[name] = factory()
+            return _resources[name]
+    return accessor
+
+
+def _peek_resource(accessor):
+    """이미 생성된 자원만 반환 (없으면 None, 생성하지 않음)"""
+    return _resources.get(accessor.__name__)
+
+
+@_lazy_resource
+def _bootstrap_llm_env() -> bool:
+    """LangSmith 추적 설정 + OpenAI 키 확인 (LLM 최초 사용 시 1회)"""
+    cassette = get_cassette()
+    replaying = cassette is not None and cassette.mode == "replay"
+    if not RWA_OFFLINE and not replaying:
+        from langchain_teddynote import logging
+        logging.langsmith("RWA-Multi-Agent-Modular")
+
+    if replaying:
+        os.environ.setdefault("OPENAI_API_KEY", "sk-cassette-replay")  # 재생 시 OpenAI 호출 없음
+    if not os.getenv("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY not found in .env file")
+
+    print("✅ .env loaded and API keys verified.")
+    return True
+
+
+# LLM 응답 디스크 캐시 (temperature=0 호출 재실행 시 재사용)
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", 30 * 24 * 3600))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 20000))
+LLM_CACHE_DISABLED = os.getenv("LLM_CACHE_DISABLED", "").lower() in {"1", "true", "yes"}
+
+
+@_lazy_resource
+def get_llm_response_cache():
+    from llm_cache import LLMResponseCache
+    return LLMResponseCache(
+        os.path.join(CACHE_DIR, "llm_cache.sqlite"),
+        max_entries=LLM_CACHE_MAX_ENTRIES,
+        ttl=LLM_CACHE_TTL,
+    )
+
+
+def _llm_cache():
+    inner = False if LLM_CACHE_DISABLED else get_llm_response_cache()
+    cassette = get_cassette()
+    if cassette is None:
+        return inner
+    return cassette_llm_cache(cassette, inner or None)  # 녹화/재생 (cassette.py)
 
-print("✅ .env loaded and API keys verified.")
 
 # LLM 초기화
-llm = ChatOpenAI(model="gpt-4o", temperature=0, max_tokens=4096)
-llm_mini = ChatOpenAI(model="gpt-4o-mini", temperature=0, max_tokens=2048)
+LLM_MODEL = "gpt-4o"
+LLM_MINI_MODEL = "gpt-4o-mini"
+
+
+@_lazy_resource
+def get_llm():
+    _bootstrap_llm_env()
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model=LLM_MODEL, temperature=0, max_tokens=4096, cache=_llm_cache(),
+                      callbacks=[llm_metrics_handler()])
+
+
+@_lazy_resource
+def get_llm_mini():
+    _bootstrap_llm_env()
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(model=LLM_MINI_MODEL, temperature=0, max_tokens=2048, cache=_llm_cache(),
+                      callbacks=[llm_metrics_handler()])
+
+
+# JSON 모드 LLM
+@_lazy_resource
+def get_llm_json():
+    return get_llm().bind(response_format={"type": "json_object"})
+
+
+@_lazy_resource
+def get_llm_mini_json():
+    return get_llm_mini().bind(response_format={"type": "json_object"})
+
+
+def get_llm_cache_stats() -> dict:
+    """LLM 응답 캐시 hit/miss 통계 (캐시 미사용 시 0)"""
+    cache = _peek_resource(get_llm_response_cache)
+    if cache is None:
+        return {"hits": 0, "misses": 0, "hit_rate": 0.0, "evictions": 0, "entries": 0}
+    return cache.stats()
+
+
+def purge_llm_cache() -> None:
+    """LLM 응답 캐시 비우기"""
+    get_llm_response_cache().clear()
+
 
 # Tavily (fallback)
-try:
-    if os.getenv("TAVILY_API_KEY"):
-        tavily_client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
-        web_search = TavilySearchResults(max_results=5)
-        print("✅ Tavily initialized (fallback mode).")
-    else:
-        tavily_client = None
-        web_search = None
-except Exception as e:
-    tavily_client = None
-    web_search = None
-
-# DuckDuckGo 검색 함수 (개선)
-def simple_web_search(query: str, max_results: int = 5) -> list:
-    """DuckDuckGo를 사용한 웹 검색"""
-    results = []
-    
+@_lazy_resource
+def get_tavily_client():
+    try:
+        if os.getenv("TAVILY_API_KEY"):
+            from tavily import TavilyClient
+            client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+            print("✅ Tavily initialized (fallback mode).")
+            return client
+    except Exception as e:
+        pass
+    return None
+
+
+@_lazy_resource
+def get_web_search():
     try:
-        ddgs = DDGS()
-        search_results = list(ddgs.text(
+        if os.getenv("TAVILY_API_KEY"):
+            from langchain_community.tools.tavily_search import TavilySearchResults
+            return TavilySearchResults(max_results=5)
+    except Exception as e:
+        pass
+    return None
+
+# 검색 결과 디스크 캐시 (재실행 시 동일 쿼리 재검색 방지)
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", 7 * 24 * 3600))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", 5000))
+SEARCH_CACHE_DISABLED = os.getenv("SEARCH_CACHE_DISABLED", "").lower() in {"1", "true", "yes"}
+
+search_cache = DiskCache(
+    os.path.join(CACHE_DIR, "search_cache.sqlite"),
+    max_entries=SEARCH_CACHE_MAX_ENTRIES,
+    default_ttl=SEARCH_CACHE_TTL,
+)
+
+
+def normalize_query(query: str) -> str:
+    """쿼리 정규화 (대소문자/공백 차이를 동일 쿼리로 취급)"""
+    return re.sub(r"\s+", " ", (query or "").strip().lower())
+
+
+def _search_cache_key(query: str, max_results: int) -> str:
+    return f"{normalize_query(query)}|{max_results}"
+
+
+def purge_search_cache(expired_only: bool = False) -> int:
+    """검색 캐시 비우기 (삭제 건수 반환)"""
+    return search_cache.purge(expired_only=expired_only)
+
+
+# 검색 레이트 리미터 (고정 sleep 대신 공급자 쿼터 기준으로 처리량 제어)
+SEARCH_RATE_PER_SEC = float(os.getenv("SEARCH_RATE_PER_SEC", 2.0))
+SEARCH_RATE_BURST = float(os.getenv("SEARCH_RATE_BURST", 4))
+SEARCH_MAX_CONCURRENCY = int(os.getenv("SEARCH_MAX_CONCURRENCY", 4))
+
+search_rate_limiter = TokenBucket(SEARCH_RATE_PER_SEC, SEARCH_RATE_BURST)
+_search_slots = threading.BoundedSemaphore(SEARCH_MAX_CONCURRENCY)
+
+
+def _fetch_duckduckgo(query: str, max_results: int) -> list:
+    """DuckDuckGo 검색 (동기, 실패 시 예외 발생)"""
+    from duckduckgo_search import DDGS  # 기존 패키지 그대로 사용
+    with _search_slots:
+        search_results = list(DDGS().text(
             query, 
             max_results=max_results,
             region='wt-wt',
             safesearch='moderate'
         ))
-        
-        for result in search_results:
-            results.append({
-                'title': result.get('title', ''),
-                'url': result.get('href', result.get('link', '')),
-                'content': result.get('body', result.get('snippet', '')),
-                'snippet': result.get('body', result.get('snippet', ''))
-            })
-        
+    return [{
+        'title': result.get('title', ''),
+        'url': result.get('href', result.get('link', '')),
+        'content': result.get('body', result.get('snippet', '')),
+        'snippet': result.get('body', result.get('snippet', ''))
+    } for result in search_results]
+
+
+def _fetch_tavily(query: str, max_results: int) -> list:
+    """Tavily 검색 (동기, 실패 시 예외 발생)"""
+    tavily_client = get_tavily_client()
+    if tavily_client is None:
+        raise RuntimeError("Tavily client unavailable")
+    with _search_slots:
+        tavily_results = tavily_client.search(query=query, max_results=max_results)
+    return [{
+        'title': item.get('title', ''),
+        'url': item.get('url', ''),
+        'content': item.get('content', item.get('snippet', '')),
+        'snippet': item.get('content', item.get('snippet', ''))
+    } for item in tavily_results.get("results", [])]
+
+
+def _fetch_offline(query: str, max_results: int) -> list:
+    """오프라인 검색 대체물: 쿼리 해시로 결정되는 합성 결과 (OFFLINE_SEARCH_LATENCY초 지연)"""
+    if OFFLINE_SEARCH_LATENCY > 0:
+        time.sleep(OFFLINE_SEARCH_LATENCY)
+    digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    company = query.split()[0] if query else "company"
+    topics = ["KYC AML licensing partnership", "tokenization platform architecture",
+              "market size CAGR institutional demand", "funding round investors", "founders leadership team"]
+    return [{
+        'title': f"{company} - result {i + 1}",
+        'url': f"https://offline.example/{digest[:12]}/{i}",
+        'content': f"{query}. {company} {topics[(int(digest[i], 16) + i) % len(topics)]} (offline result {digest[i * 4:i * 4 + 8]}).",
+        'snippet': f"{company} {topics[(int(digest[i], 16) + i) % len(topics)]}",
+    } for i in range(max_results)]
+
+
+# 검색 공급자 (DuckDuckGo 우선, Tavily 백업) - 서킷 브레이커로 장애 공급자 건너뜀
+SEARCH_HEDGE = os.getenv("SEARCH_HEDGE", "").lower() in {"1", "true", "yes"}
+SEARCH_HEDGE_PERCENTILE = float(os.getenv("SEARCH_HEDGE_PERCENTILE", 0.9))
+SEARCH_BREAKER_FAILURES = int(os.getenv("SEARCH_BREAKER_FAILURES", 3))
+SEARCH_BREAKER_RESET = float(os.getenv("SEARCH_BREAKER_RESET", 60))
+
+search_provider_pool = ProviderPool(
+    [
+        SearchProvider("offline", _fetch_offline, CircuitBreaker(SEARCH_BREAKER_FAILURES, SEARCH_BREAKER_RESET)),
+    ] if RWA_OFFLINE else [
+        SearchProvider("duckduckgo", _fetch_duckduckgo,
+                       CircuitBreaker(SEARCH_BREAKER_FAILURES, SEARCH_BREAKER_RESET)),
+        SearchProvider("tavily", _fetch_tavily if os.getenv("TAVILY_API_KEY") else None,
+                       CircuitBreaker(SEARCH_BREAKER_FAILURES, SEARCH_BREAKER_RESET)),
+    ],
+    hedge=SEARCH_HEDGE,
+    hedge_percentile=SEARCH_HEDGE_PERCENTILE,
+)
+
+
+def _dummy_results(query: str) -> list:
+    """검색 실패 시 더미 데이터"""
+    company_name = query.split()[0] if query else 'company'
+    return [{
+        'title': f"{company_name} - RWA Platform",
+        'url': f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
+        'content': f"{company_name} operates in the Real-World Asset tokenization sector with focus on compliance and institutional adoption. Key areas include regulatory frameworks, technical architecture, and market partnerships.",
+        'snippet': "Emerging RWA platform with compliance focus."
+    }]
+
+
+def _run_coro(coro):
+    """동기 코드에서 코루틴 실행 (이미 이벤트 루프가 도는 스레드라면 별도 스레드에서 실행)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(bind_context(asyncio.run), coro).result()  # 노드별 계측 컨텍스트 유지
+
+
+# 실행(run) 단위 검색 메모 + 동일 쿼리 병합 (에이전트 간 중복 검색 제거)
+# 병합(진행 중인 동일 쿼리 공유)은 프로세스 공통, 메모/카운터는 작업별 SearchRun에 보관
+_search_flight = SingleFlight()
+
+
+class SearchRun:
+    """One job's search memo and de-duplication counters."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.memo: dict = {}
+        self.stats = {"queries": 0, "memo_hits": 0, "coalesced": 0}
+
+
+_current_search_run: contextvars.ContextVar = contextvars.ContextVar("rwa_search_run", default=None)
+_unscoped_search_run = SearchRun()  # 범위 밖 호출(에이전트 단독 실행 등)용
+
+
+def _search_run() -> SearchRun:
+    return _current_search_run.get() or _unscoped_search_run
+
+
+@contextlib.contextmanager
+def search_run_scope():
+    """
+    작업 1건 동안 사용할 검색 메모/카운터 범위.
+
+    docstring: Searches made inside the block (including node threads and
+               worker pools that copy the context) use a fresh SearchRun;
+               it is dropped on exit, so concurrent jobs in one process
+               never share memoized results or counters and the disk
+               cache TTL still applies to the next job.
+    """
+    run = SearchRun()
+    token = _current_search_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_search_run.reset(token)
+
+
+def get_search_cache_stats() -> dict:
+    """프로세스 공통 검색 통계 (디스크 캐시 + 공급자)"""
+    return {"cache": search_cache.stats(), "providers": search_provider_pool.stats()}
+
+
+def get_search_run_stats(run=None) -> dict:
+    """현재(또는 지정한) 실행의 검색 통계 (중복 제거 건수 + 디스크 캐시 통계)"""
+    run = run or _search_run()
+    with run.lock:
+        stats = dict(run.stats)
+    stats["deduplicated"] = stats["memo_hits"] + stats["coalesced"]
+    stats["network_calls"] = stats["queries"] - stats["deduplicated"]
+    stats.update(get_search_cache_stats())
+    return stats
+
+
+def _copy_results(results: list) -> list:
+    return [dict(r) for r in results]
+
+
+async def _asearch_providers(query: str, max_results: int, use_cache: bool) -> list:
+    """카세트 녹화/재생 분기 (RWA_CASSETTE_MODE 미설정 시 바로 _asearch_live)"""
+    cassette = get_cassette()
+    if cassette is None:
+        return await _asearch_live(query, max_results, use_cache)
+
+    key = _search_cache_key(query, max_results)
+    if cassette.mode == "replay":
+        try:
+            results, latency = cassette.replay("search", key)
+        except CassetteMiss as e:
+            print(f"    ⚠️ 카세트에 없는 검색: {query!r} ({e})")
+            return _dummy_results(query)
+        if latency:
+            await asyncio.sleep(latency)
+        run_metrics.record_search("cassette")
+        print(f"    ✓ {len(results)}개 검색 결과 (카세트)")
+        return results
+
+    started = time.perf_counter()
+    results = await _asearch_live(query, max_results, use_cache)
+    cassette.record("search", key, results, time.perf_counter() - started)
+    return results
+
+
+async def _asearch_live(query: str, max_results: int, use_cache: bool) -> list:
+    """디스크 캐시 조회 후 공급자 검색 (DuckDuckGo → Tavily, 서킷 브레이커/헤지 적용)"""
+    use_cache = use_cache and not SEARCH_CACHE_DISABLED
+    cache_key = _search_cache_key(query, max_results)
+    if use_cache:
+        cached = search_cache.get(cache_key)
+        if cached is not None:
+            print(f"    ✓ {len(cached)}개 검색 결과 (캐시)")
+            run_metrics.record_search("cache")
+            return cached
+
+    run_metrics.record_search("network")
+    results = []
+    await search_rate_limiter.acquire_async()
+    
+    try:
+        results, provider = await search_provider_pool.asearch(query, max_results)
         if results:
-            print(f"    ✓ {len(results)}개 검색 결과 수집")
-        
-        time.sleep(0.5)
-        
-    except Exception as e:
+            suffix = "" if provider == "duckduckgo" else f" ({provider.capitalize()})"
+            print(f"    ✓ {len(results)}개 검색 결과 수집{suffix}")
+    except AllProvidersFailed as e:
         print(f"    ⚠️ 검색 실패: {e}")
-        
-        # Fallback: Tavily
-        if tavily_client:
-            try:
-                tavily_results = tavily_client.search(query=query, max_results=max_results)
-                for item in tavily_results.get("results", []):
-                    results.append({
-                        'title': item.get('title', ''),
-                        'url': item.get('url', ''),
-                        'content': item.get('content', item.get('snippet', '')),
-                        'snippet': item.get('content', item.get('snippet', ''))
-                    })
-                print(f"    ✓ {len(results)}개 검색 결과 수집 (Tavily)")
-            except:
-                pass
+    
+    # 실제 검색 결과만 캐시에 저장 (더미 데이터는 저장하지 않음)
+    if results and use_cache:
+        search_cache.set(cache_key, results)
     
     # 더미 데이터
     if not results:
-        company_name = query.split()[0] if query else 'company'
-        results = [{
-            'title': f"{company_name} - RWA Platform",
-            'url': f"https://duckduckgo.com/?q={query.replace(' ', '+')}",
-            'content': f"{company_name} operates in the Real-World Asset tokenization sector with focus on compliance and institutional adoption. Key areas include regulatory frameworks, technical architecture, and market partnerships.",
-            'snippet': "Emerging RWA platform with compliance focus."
-        }]
+        results = _dummy_results(query)
     
     return results
 
-print("✅ Web search initialized.")
 
-# RAG 임베딩
-try:
-    rag_embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/all-mpnet-base-v2",
-        model_kwargs={'device': 'cpu'}
+# DuckDuckGo 검색 함수 (비동기, Tavily 폴백)
+async def asimple_web_search(query: str, max_results: int = 5, use_cache: bool = True) -> list:
+    """
+    비동기 웹 검색.
+
+    docstring: Lookup order is run memo -> in-flight coalescing -> disk cache
+               -> rate-limited provider call. use_cache=False skips the memo
+               and the disk cache but still coalesces identical queries.
+    """
+    key = _search_cache_key(query, max_results)
+    run = _search_run()
+    with run.lock:
+        run.stats["queries"] += 1
+        memo = run.memo.get(key) if use_cache else None
+        if memo is not None:
+            run.stats["memo_hits"] += 1
+    if memo is not None:
+        run_metrics.record_search("memo")
+        return _copy_results(memo)
+
+    results, shared = await _search_flight.ado(
+        (key, use_cache), lambda: _asearch_providers(query, max_results, use_cache)
     )
-    print("✅ RAG Embeddings loaded.")
-except Exception as e:
-    print(f"❌ Embeddings error: {e}")
-    rag_embeddings = None
+    with run.lock:
+        if shared:
+            run.stats["coalesced"] += 1
+        if use_cache:
+            run.memo[key] = results
+    if shared:
+        run_metrics.record_search("coalesced")
+    return _copy_results(results)
 
-# JSON 모드 LLM
-llm_json = llm.bind(response_format={"type": "json_object"})
-llm_mini_json = llm_mini.bind(response_format={"type": "json_object"})
+
+async def asearch_many(queries: list, max_results: int = 5, use_cache: bool = True) -> list:
+    """여러 쿼리를 동시에 검색 (결과 순서 = 쿼리 순서)"""
+    return list(await asyncio.gather(*[
+        asimple_web_search(q, max_results=max_results, use_cache=use_cache) for q in queries
+    ]))
+
+
+def search_many(queries: list, max_results: int = 5, use_cache: bool = True) -> list:
+    """asearch_many의 동기 진입점"""
+    return _run_coro(asearch_many(queries, max_results=max_results, use_cache=use_cache))
+
+
+def simple_web_search(query: str, max_results: int = 5, use_cache: bool = True) -> list:
+    """asimple_web_search의 동기 래퍼"""
+    return _run_coro(asimple_web_search(query, max_results=max_results, use_cache=use_cache))
+
+# RAG 임베딩 (텍스트 해시 기반 캐시 래핑 → 동일 스니펫 재임베딩 방지)
+RAG_EMBEDDING_MODEL = "sentence-transformers/all-mpnet-base-v2"
+EMBEDDING_CACHE_DISABLED = os.getenv("EMBEDDING_CACHE_DISABLED", "").lower() in {"1", "true", "yes"}
+
+
+@_lazy_resource
+def get_rag_embeddings():
+    """all-mpnet-base-v2 임베딩 (torch/transformers는 이 시점에 처음 로드됨)"""
+    if RWA_OFFLINE:
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+        print("✅ RAG Embeddings loaded (offline, deterministic).")
+        return DeterministicFakeEmbedding(size=768)
+    try:
+        from langchain_huggingface import HuggingFaceEmbeddings
+        rag_embeddings = HuggingFaceEmbeddings(
+            model_name=RAG_EMBEDDING_MODEL,
+            model_kwargs={'device': 'cpu'}
+        )
+        if not EMBEDDING_CACHE_DISABLED:
+            from embedding_cache import CachedEmbeddings
+            rag_embeddings = CachedEmbeddings(
+                rag_embeddings, RAG_EMBEDDING_MODEL, os.path.join(CACHE_DIR, "embeddings")
+            )
+        print("✅ RAG Embeddings loaded.")
+        return rag_embeddings
+    except Exception as e:
+        print(f"❌ Embeddings error: {e}")
+        return None
+
+
+def get_embedding_cache_stats() -> dict:
+    """임베딩 캐시 통계 (hit rate, 저장된 벡터 수)"""
+    rag_embeddings = _peek_resource(get_rag_embeddings)
+    if rag_embeddings is not None and hasattr(rag_embeddings, "stats"):
+        return rag_embeddings.stats()
+    return {}
+
+
+def warm_up() -> None:
+    """모든 지연 자원을 즉시 생성 (상주 프로세스/벤치마크용)"""
+    for accessor in (get_llm, get_llm_mini, get_llm_json, get_llm_mini_json,
+                     get_tavily_client, get_web_search, get_rag_embeddings):
+        accessor()
+
+
+# 기존 코드 호환: `config.llm` 등 속성 접근 시 지연 생성
+_LEGACY_RESOURCES = {
+    "llm": get_llm,
+    "llm_mini": get_llm_mini,
+    "llm_json": get_llm_json,
+    "llm_mini_json": get_llm_mini_json,
+    "tavily_client": get_tavily_client,
+    "web_search": get_web_search,
+    "rag_embeddings": get_rag_embeddings,
+    "llm_response_cache": get_llm_response_cache,
+}
+
+
+def __getattr__(name: str):
+    if name in _LEGACY_RESOURCES:
+        return _LEGACY_RESOURCES[name]()
+    raise AttributeError(f"module 'config' has no attribute '{name}'")
 
 # VC Checklist
 VC_CHECKLIST = [
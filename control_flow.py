@@ -4,6 +4,8 @@
 from typing import Literal
 from graph_state import GraphState
 
+MAX_DECISIONS = 5  # '보류'/'부정적' 누적 시 루프 종료 기준
+
 def select_next_startup(state: GraphState) -> GraphState:
     """Selects the next startup from the ranking list to evaluate."""
     current_index = state["current_startup_index"] + 1
@@ -22,6 +24,17 @@ def select_next_startup(state: GraphState) -> GraphState:
     }
 
 
+def start_deep_dive(state: GraphState) -> dict:
+    """
+    Fan-out point for the per-startup deep dive.
+    
+    docstring: Agents 2, 3 and 4 branch out from here in parallel and join
+               again before Agent 5. Makes no state changes itself.
+    """
+    print(f"--- (CTRL) 심층 분석 시작 (Agent 2/3/4 병렬): {state['current_startup_data']['name']} ---")
+    return {}
+
+
 def should_loop_or_stop(state: GraphState) -> Literal["generate_report", "select_next"]:
     """
     Determines the next step based on the investment decision and loop count.
@@ -42,7 +55,7 @@ def should_loop_or_stop(state: GraphState) -> Literal["generate_report", "select
     hold_reject_count = len(decision_log)
     
     # 5회 누적 (실패) -> 보고서 생성 후 종료
-    if hold_reject_count >= 5:
+    if hold_reject_count >= MAX_DECISIONS:
         print(f"--- (COND) 결정: '{decision}'. 5회 누적({hold_reject_count}회)되어 종료합니다. ---")
         return "generate_report"
         
@@ -0,0 +1,133 @@
+# FILE: disk_cache.py
+# (공유 디스크 캐시: SQLite 기반 TTL + 크기 제한 캐시)
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Optional
+
+# 캐시 파일 기본 위치 (프로젝트 루트의 .cache/)
+CACHE_DIR = os.getenv("RWA_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+
+_MISSING = object()
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache with per-entry TTL and LRU-style eviction.
+
+    docstring: Values are stored as JSON. Expired entries are treated as misses
+               and removed lazily; when the table grows past `max_entries`,
+               the least recently accessed entries are evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, default_ttl: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " created_at REAL NOT NULL, expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed_at)")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """캐시 조회 (만료된 항목은 miss로 처리 후 삭제)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.misses += 1
+                return default
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = _MISSING) -> None:
+        """캐시 저장 (ttl=None이면 만료 없음)"""
+        if ttl is _MISSING:
+            ttl = self.default_ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now, expires_at, now),
+            )
+            self._evict_locked()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def purge(self, expired_only: bool = False) -> int:
+        """전체(또는 만료된 항목만) 삭제 후 삭제 건수 반환"""
+        with self._lock:
+            if expired_only:
+                cur = self._conn.execute(
+                    "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+                )
+            else:
+                cur = self._conn.execute("DELETE FROM cache")
+            return cur.rowcount
+
+    def items(self):
+        """만료되지 않은 (key, value) 쌍 전체 순회 (hit/miss 및 접근 시각에 반영하지 않음)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, value FROM cache WHERE expires_at IS NULL OR expires_at > ?", (time.time(),)
+            ).fetchall()
+        for key, value in rows:
+            yield key, json.loads(value)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def _evict_locked(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        # 만료 항목 먼저 정리, 그래도 넘치면 가장 오래 전에 접근된 항목부터 제거
+        self._conn.execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+        )
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                " SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
+            self.evictions += overflow
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self),
+        }
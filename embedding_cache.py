@@ -0,0 +1,164 @@
+# FILE: embedding_cache.py
+# (임베딩 캐시: (모델명, 텍스트 해시) → float32 벡터, memmap 기반)
+
+import os
+import re
+import json
+import hashlib
+import threading
+import contextlib
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+try:
+    import fcntl  # 프로세스 간 잠금 (데몬/배치/CLI가 CACHE_DIR 공유)
+except ImportError:  # Windows: 프로세스 내 잠금만 사용
+    fcntl = None
+
+_KEY_LINE_BYTES = 65  # sha256 hex(64) + 개행
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Content-addressed cache in front of any LangChain `Embeddings`.
+
+    docstring: Vectors live in one append-only float32 file per model that is
+               read through a memory map; `keys.txt` holds one text hash per
+               row in the same order. Batch lookups send only the misses to
+               the wrapped model. Appends and loads hold an inter-process
+               file lock; both first cut the two files back to the rows
+               they have in common (a crash between the vector and key
+               writes, or a torn row, leaves an unmatched tail), and new
+               rows start at that physical row, so key N always names row N.
+    """
+
+    def __init__(self, underlying: Embeddings, model_name: str, cache_dir: str):
+        self.underlying = underlying
+        self.model_name = model_name
+        self.dir = os.path.join(cache_dir, re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name))
+        self._vectors_path = os.path.join(self.dir, "vectors.f32")
+        self._keys_path = os.path.join(self.dir, "keys.txt")
+        self._meta_path = os.path.join(self.dir, "meta.json")
+        self._lock_path = os.path.join(self.dir, "lock")
+        self._lock = threading.Lock()
+        self._index: dict = {}
+        self._rows = 0
+        self._dim = None
+        self._mmap = None
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.dir, exist_ok=True)
+        self._load()
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        """같은 캐시 디렉토리를 쓰는 다른 프로세스와의 배타 잠금"""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _reconcile(self) -> int:
+        """벡터/키 파일을 공통 행 수로 잘라내고 행 수 반환 (파일 잠금 안에서 호출)"""
+        row_bytes = 4 * self._dim
+        vector_size = os.path.getsize(self._vectors_path) if os.path.exists(self._vectors_path) else 0
+        key_size = os.path.getsize(self._keys_path) if os.path.exists(self._keys_path) else 0
+        rows = min(vector_size // row_bytes, key_size // _KEY_LINE_BYTES)
+        if vector_size > rows * row_bytes:
+            os.truncate(self._vectors_path, rows * row_bytes)
+        if key_size > rows * _KEY_LINE_BYTES:
+            os.truncate(self._keys_path, rows * _KEY_LINE_BYTES)
+        return rows
+
+    def _load(self) -> None:
+        if not os.path.exists(self._meta_path):
+            return
+        with open(self._meta_path, "r", encoding="utf-8") as f:
+            self._dim = json.load(f)["dim"]
+        with self._file_lock():
+            rows = self._reconcile()
+            keys = []
+            if rows:
+                with open(self._keys_path, "r", encoding="utf-8") as f:
+                    keys = [f.readline().strip() for _ in range(rows)]
+        self._index = {key: row for row, key in enumerate(keys)}
+        self._rows = rows
+
+    def _key(self, text: str, kind: str) -> str:
+        return hashlib.sha256(f"{kind}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _read_rows(self, rows: List[int]) -> np.ndarray:
+        count = self._rows
+        if self._mmap is None or self._mmap.shape[0] < count:
+            self._mmap = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(count, self._dim))
+        return np.asarray(self._mmap[rows])
+
+    def _append(self, keys: List[str], vectors: np.ndarray) -> None:
+        with self._file_lock():
+            if self._dim is None:
+                if os.path.exists(self._meta_path):  # 다른 프로세스가 먼저 생성
+                    with open(self._meta_path, "r", encoding="utf-8") as f:
+                        self._dim = json.load(f)["dim"]
+                else:
+                    self._dim = int(vectors.shape[1])
+                    with open(self._meta_path, "w", encoding="utf-8") as f:
+                        json.dump({"model": self.model_name, "dim": self._dim}, f)
+            # 새 행은 파일상의 실제 위치에서 시작 (다른 프로세스가 추가한 행 뒤)
+            start = self._reconcile()
+            with open(self._vectors_path, "ab") as f:
+                f.write(vectors.astype(np.float32).tobytes())
+            with open(self._keys_path, "ab") as f:  # 바이너리: 줄 길이 고정 (_KEY_LINE_BYTES)
+                f.write("".join(f"{k}\n" for k in keys).encode("ascii"))
+        for offset, key in enumerate(keys):
+            self._index[key] = start + offset
+        self._rows = start + len(keys)
+
+    def _embed(self, texts: List[str], kind: str) -> List[List[float]]:
+        keys = [self._key(t, kind) for t in texts]
+        with self._lock:
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key not in self._index and key not in missing:
+                    missing[key] = text
+            self.misses += len(missing)
+            self.hits += len(keys) - len(missing)
+
+        if missing:
+            miss_texts = list(missing.values())
+            if kind == "query":
+                computed = [self.underlying.embed_query(t) for t in miss_texts]
+            else:
+                computed = self.underlying.embed_documents(miss_texts)
+            with self._lock:
+                new = [(k, v) for k, v in zip(missing, computed) if k not in self._index]
+                if new:
+                    self._append([k for k, _ in new], np.asarray([v for _, v in new], dtype=np.float32))
+
+        with self._lock:
+            vectors = self._read_rows([self._index[k] for k in keys])
+        return vectors.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        return self._embed(list(texts), "doc")
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text], "query")[0]
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "model": self.model_name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "vectors_stored": len(self._index),
+        }
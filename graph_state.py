@@ -1,27 +1,76 @@
 # FILE: graph_state.py
 # (공유 GraphState 정의)
 
-from typing import TypedDict, List, Dict, Any, Optional
+from typing import TypedDict, List, Dict, Any, Optional, Annotated
+
+
+def merge_agent_output(left: Optional[Dict], right: Optional[Dict]) -> Optional[Dict]:
+    """
+    Reducer for agent output channels written by parallel branches.
+
+    docstring: Lets Agents 2-4 update the state in the same step; a branch
+               that did not produce a new value (None) keeps the old one.
+    """
+    return right if right is not None else left
+
+
+class ResearchDocument(TypedDict):
+    """One deduplicated search result in a research bundle."""
+    title: str
+    url: str
+    content: str
+    snippet: str
+    content_hash: str
+    topics: List[str]    # 이 문서를 반환한 쿼리의 주제 ('tech', 'market', ...)
+
+
+class ResearchBundle(TypedDict):
+    """
+    Shared evidence for one startup, fetched once before the deep dive.
+    
+    docstring: `queries` maps each topic to the queries run for it;
+               `documents` are deduplicated by URL and content hash.
+    """
+    startup: str
+    sector: str
+    queries: Dict[str, List[str]]
+    documents: List[ResearchDocument]
+    fetched_at: str
+
 
 class GraphState(TypedDict):
     """
     Represents the global state of the investment evaluation graph.
     
     Attributes:
+        persona_answers (Optional[List[int]]): Preset answers to Agent 0's questions (headless runs).
+        persona_weights (Optional[Dict[str, float]]): Custom criterion weights overriding the persona's for Agent 1 ranking.
+        startups_path (Optional[str]): Startup list for Agent 1 (default 'startups.json').
+        report_path (Optional[str]): Output path for Agent 6 (default 'Final_Investment_Report.md').
         investor_persona (str): The persona type ('aggressive' or 'conservative').
         persona_rationale (str): The reasoning for the persona selection.
-        evaluation_results (List[Dict]): The full, ranked list of startups from Agent 1.
+        evaluation_results (List[Dict]): The top-K ranked startups from Agent 1 (K = AGENT1_TOP_K).
         current_startup_index (int): The index of the startup currently being evaluated.
         current_startup_data (Dict): The full data blob for the current startup.
+        prefilter_report (Optional[Dict]): Agent 1 embedding pre-filter summary (N, audit sample, recall), None if disabled.
+        research_bundle (Optional[ResearchBundle]): Shared search evidence for the current startup (Agents 2/3/4/6).
         
-        tech_summary_output (Optional[Dict]): Output from Agent 2.
-        market_assessment_output (Optional[Dict]): Output from Agent 3.
-        competitor_analysis_output (Optional[Dict]): Output from Agent 4.
+        tech_summary_output (Optional[Dict]): Output from Agent 2 (parallel branch).
+        market_assessment_output (Optional[Dict]): Output from Agent 3 (parallel branch).
+        competitor_analysis_output (Optional[Dict]): Output from Agent 4 (parallel branch).
         investment_decision_output (Optional[Dict]): Output from Agent 5.
         
         decision_log (List[str]): A log of decisions made (e.g., ["보류", "부정적"]).
-        final_report (Optional[str]): The final Markdown report.
+        report_extractions (Optional[Dict]): Agent 6's LLM extractions ('financial', 'team') for the success report.
+        report_generated_at (Optional[str]): Report timestamp (kept when re-rendering a saved snapshot).
+        final_report (Optional[str]): Path of the written final report (streamed to disk, not kept in memory).
     """
+    # Run Inputs (optional, for headless runs)
+    persona_answers: Optional[List[int]]
+    persona_weights: Optional[Dict[str, float]]
+    startups_path: Optional[str]
+    report_path: Optional[str]
+    
     # From Agent 0
     investor_persona: str
     persona_rationale: str
@@ -30,15 +79,21 @@ class GraphState(TypedDict):
     evaluation_results: List[Dict] 
     current_startup_index: int
     current_startup_data: Dict
+    prefilter_report: Optional[Dict]
+    
+    # Shared Research (per startup)
+    research_bundle: Optional[ResearchBundle]
     
     # Agent Outputs
-    tech_summary_output: Optional[Dict]
-    market_assessment_output: Optional[Dict]
-    competitor_analysis_output: Optional[Dict]
+    tech_summary_output: Annotated[Optional[Dict], merge_agent_output]
+    market_assessment_output: Annotated[Optional[Dict], merge_agent_output]
+    competitor_analysis_output: Annotated[Optional[Dict], merge_agent_output]
     investment_decision_output: Optional[Dict]
     
     # Control Flow
     decision_log: List[str]
     
     # Final Output
+    report_extractions: Optional[Dict]
+    report_generated_at: Optional[str]
     final_report: Optional[str]
\ No newline at end of file
@@ -0,0 +1,82 @@
+# FILE: jobs.py
+# (헤드리스 평가 작업: 작업 정의 → 초기 상태 → 그래프 실행 → 결과 레코드)
+
+import os
+import time
+import uuid
+from typing import Any, Dict
+
+from RWA_Investment_Agent2.agent0_persona import PERSONA_WEIGHTS, classify_persona
+from config import search_run_scope
+from score_store import weight_vector
+from speculative import speculation_scope
+from state_snapshot import snapshot_path
+
+DEFAULT_STARTUPS_PATH = "startups.json"
+JOB_REPORT_DIR = os.getenv("JOB_REPORT_DIR", "reports")
+
+
+def build_initial_state(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts a job description into the graph's initial state.
+
+    docstring: A job needs either `persona` ('aggressive'/'conservative') or
+               `persona_answers` (five 1-5 integers), and may set
+               `weights` (custom criterion weights), `startups_path`
+               and `report_path`. Without an explicit
+               report_path each job writes to reports/<job_id>.md so
+               concurrent jobs never share an output file.
+    """
+    state: Dict[str, Any] = {}
+    if job.get("persona"):
+        if job["persona"] not in PERSONA_WEIGHTS:
+            raise ValueError(f"Unknown persona: {job['persona']!r} (expected one of {list(PERSONA_WEIGHTS)})")
+        state["investor_persona"] = job["persona"]
+    elif job.get("persona_answers"):
+        classify_persona(list(job["persona_answers"]))  # 입력 검증
+        state["persona_answers"] = list(job["persona_answers"])
+    else:
+        raise ValueError("job requires 'persona' or 'persona_answers'")
+
+    if job.get("weights"):
+        weight_vector(job["weights"])  # 입력 검증 (4개 기준 모두 필요)
+        state["persona_weights"] = {k: float(v) for k, v in job["weights"].items()}
+
+    state["startups_path"] = job.get("startups_path") or DEFAULT_STARTUPS_PATH
+    state["report_path"] = job.get("report_path") or os.path.join(JOB_REPORT_DIR, f"{job['job_id']}.md")
+    return state
+
+
+def run_job(app, job: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 1건 실행 후 결과 레코드 반환 (실패해도 예외 대신 status='error' 레코드)"""
+    job = {**job, "job_id": str(job.get("job_id") or uuid.uuid4().hex[:12])}
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"job_id": job["job_id"]}
+    try:
+        initial_state = build_initial_state(job)
+        report_dir = os.path.dirname(initial_state["report_path"])
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+
+        # 작업별 검색 메모/카운터와 선행 분석 (같은 그래프를 공유하는 동시 작업과 분리)
+        with search_run_scope() as search_run, speculation_scope():
+            final_state = app.invoke(initial_state, {"recursion_limit": int(job.get("recursion_limit", 50))})
+
+        decision_output = final_state.get("investment_decision_output") or {}
+        record.update({
+            "status": "ok",
+            "persona": final_state.get("investor_persona"),
+            "decision": decision_output.get("decision"),
+            "checklist_score": decision_output.get("total_score"),
+            "startup": (final_state.get("current_startup_data") or {}).get("name"),
+            "decision_log": final_state.get("decision_log", []),
+            "ranking": [s.get("name") for s in final_state.get("evaluation_results", [])],
+            "prefilter": final_state.get("prefilter_report"),
+            "report_path": initial_state["report_path"],
+            "state_path": snapshot_path(initial_state["report_path"]),
+            "search": dict(search_run.stats),  # 이 작업의 검색 요청/메모/병합 건수
+        })
+    except Exception as e:
+        record.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    record["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    return record
@@ -0,0 +1,52 @@
+# FILE: llm_cache.py
+# (LLM 응답 디스크 캐시 - ChatOpenAI의 cache 훅에 연결)
+
+import hashlib
+from typing import Any, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+from disk_cache import DiskCache
+from metrics import note_llm_cache_hit
+
+
+class LLMResponseCache(BaseCache):
+    """
+    LangChain cache backed by the shared SQLite DiskCache.
+
+    docstring: LangChain passes every chat call through `lookup`/`update`
+               with `llm_string` (model name, temperature and any bound
+               kwargs such as `response_format`) and the serialized messages,
+               so the key is a hash of both. Generations are stored with
+               langchain's own serializer so cached AIMessages round-trip.
+    """
+
+    def __init__(self, path: str, max_entries: int = 20000, ttl: Optional[float] = None):
+        self._store = DiskCache(path, max_entries=max_entries, default_ttl=ttl)
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        cached = self._store.get(self._key(prompt, llm_string))
+        if cached is None:
+            return None
+        try:
+            generations = [loads(g) for g in cached]
+        except Exception:
+            # 직렬화 포맷이 바뀐 항목은 miss로 처리
+            return None
+        note_llm_cache_hit()
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        self._store.set(self._key(prompt, llm_string), [dumps(g) for g in return_val])
+
+    def clear(self, **kwargs: Any) -> None:
+        self._store.purge()
+
+    def stats(self) -> dict:
+        return self._store.stats()
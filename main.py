@@ -6,7 +6,7 @@ from langgraph.graph import StateGraph, END
 
 # --- 모든 구성요소 Import ---
 from graph_state import GraphState
-from config import llm, llm_mini, web_search # (필요시)
+from config import search_run_scope, get_search_run_stats, get_llm_cache_stats, get_embedding_cache_stats
 from RWA_Investment_Agent2.agent0_persona import run_agent_0_persona
 from RWA_Investment_Agent2.agent1_search import run_agent_1_search
 from RWA_Investment_Agent2.agent2_tech_summary import build_agent2_graph # Agent 2는 그래프 빌더를 import
@@ -14,7 +14,14 @@ from RWA_Investment_Agent2.agent3_marketeval import run_agent_3_market_rag
 from RWA_Investment_Agent2.agent4_CompetitorAnalysis import run_agent_4_competitor_analysis
 from RWA_Investment_Agent2.agent5_Decision import run_agent_5_decision
 from RWA_Investment_Agent2.agent6_ReportGen import run_agent_6_report_generator
-from control_flow import select_next_startup, should_loop_or_stop, check_remaining_startups
+from control_flow import select_next_startup, should_loop_or_stop, check_remaining_startups, start_deep_dive, MAX_DECISIONS
+from speculative import SpeculationPlan, speculation_scope
+from research import run_research, research_results
+from metrics import instrument_node, run_metrics, RUN_METRICS_PATH
+from cassette import save_cassette
+
+# 선행 분석 깊이 (0이면 비활성화): 현재 스타트업 분석 중 다음 K개 순위의 Agent 2/3/4를 미리 실행
+SPECULATIVE_DEPTH = int(os.getenv("SPECULATIVE_DEPTH", 0))
 
 # --- Agent 2 서브그래프 미리 컴파일 ---
 agent2_app = build_agent2_graph()
@@ -22,7 +29,7 @@ print("✅ Agent 2 (TechSummary) 서브그래프가 컴파일되었습니다.")
 
 # --- Agent 2 래퍼(Wrapper) 노드 ---
 # 메인 그래프는 Agent 2의 서브그래프를 호출할 래퍼 노드가 필요합니다.
-def run_agent_2_tech_summary_wrapper(state: GraphState) -> GraphState:
+def run_agent_2_tech_summary_wrapper(state: GraphState) -> dict:
     """
     Wrapper node to execute the compiled Agent 2 sub-graph.
     
@@ -46,18 +53,34 @@ def run_agent_2_tech_summary_wrapper(state: GraphState) -> GraphState:
         "reason": f"Selected by Agent 1 (Rank {state['current_startup_index'] + 1})"
     }
     
-    # 컴파일된 Agent 2 그래프 실행
+    # 컴파일된 Agent 2 그래프 실행 (공유 리서치 번들이 있으면 함께 전달)
+    agent2_state = {"startup_json": agent2_input}
+    tech_results = research_results(state, "tech")
+    if tech_results is not None:
+        agent2_state["research_results"] = tech_results
     agent2_result_state = agent2_app.invoke(
-        {"startup_json": agent2_input}, 
+        agent2_state, 
         {"recursion_limit": 10} # Agent 2 내부 루프 방지
     )
     
+    # 병렬 브랜치이므로 자신의 출력 키만 반환
     return {
-        **state,
         "tech_summary_output": agent2_result_state.get("output_payload", {})
     }
 
 
+# --- 선행 분석(speculative) 래퍼 노드 ---
+def _with_speculation(plan: SpeculationPlan, branch: str, node_fn):
+    """Branch node that reuses the job's prefetched result for the current startup when available."""
+    def node(state: GraphState) -> dict:
+        prefetched = plan.current().take(branch, state)
+        if prefetched is not None:
+            print(f"--- (SPEC) {branch}: 선행 분석 결과 사용 ({state['current_startup_data']['name']}) ---")
+            return prefetched
+        return node_fn(state)
+    return node
+
+
 # --- 메인 그래프 빌드 ---
 def build_main_graph():
     """
@@ -68,27 +91,56 @@ def build_main_graph():
     """
     workflow = StateGraph(GraphState)
 
+    # 심층 분석 브랜치 (선행 분석 시에도 동일한 함수 사용)
+    branches = {
+        "agent_2_tech": run_agent_2_tech_summary_wrapper, # 래퍼 노드 사용
+        "agent_3_market": run_agent_3_market_rag,
+        "agent_4_competitor": run_agent_4_competitor_analysis,
+    }
+    # 선행 분석 시에도 리서치를 먼저 실행하고 브랜치들은 그 번들을 공유 (계측 시 별도 행으로 집계)
+    # 설정만 그래프에 두고 prefetcher는 작업(speculation_scope)마다 따로 생성
+    plan = SpeculationPlan(
+        {name: instrument_node(f"{name} (speculative)", fn) for name, fn in branches.items()},
+        SPECULATIVE_DEPTH, MAX_DECISIONS,
+        prepare=("research", instrument_node("research (speculative)", run_research)),
+    )
+
+    def add_node(name, fn):
+        workflow.add_node(name, instrument_node(name, fn))  # 노드별 계측 (metrics.py)
+
+    def start_deep_dive_node(state: GraphState) -> dict:
+        plan.current().schedule(state) # 다음 순위 스타트업 선행 분석 예약
+        return start_deep_dive(state)
+
+    def report_node(state: GraphState) -> GraphState:
+        plan.current().discard() # 루프 종료: 남은 선행 분석 폐기
+        return run_agent_6_report_generator(state)
+
     # 1. 에이전트 노드 추가
-    workflow.add_node("agent_0_persona", run_agent_0_persona)
-    workflow.add_node("agent_1_search", run_agent_1_search)
-    workflow.add_node("agent_2_tech", run_agent_2_tech_summary_wrapper) # 래퍼 노드 사용
-    workflow.add_node("agent_3_market", run_agent_3_market_rag)
-    workflow.add_node("agent_4_competitor", run_agent_4_competitor_analysis)
-    workflow.add_node("agent_5_decision", run_agent_5_decision)
-    workflow.add_node("agent_6_report", run_agent_6_report_generator)
+    add_node("agent_0_persona", run_agent_0_persona)
+    add_node("agent_1_search", run_agent_1_search)
+    for name, fn in branches.items():
+        add_node(name, _with_speculation(plan, name, fn))
+    add_node("agent_5_decision", run_agent_5_decision)
+    add_node("agent_6_report", report_node)
     
     # 2. 루프 제어 노드 추가
-    workflow.add_node("select_next_startup", select_next_startup)
+    add_node("select_next_startup", select_next_startup)
+    add_node("start_deep_dive", start_deep_dive_node)
+    add_node("research", _with_speculation(plan, "research", run_research)) # 공유 검색 → Agent 2/3/4 병렬 분기점
 
     # 3. 엣지 연결
     workflow.set_entry_point("agent_0_persona")
     workflow.add_edge("agent_0_persona", "agent_1_search")
-    workflow.add_edge("agent_1_search", "agent_2_tech") # 1순위 스타트업으로 분석 시작
+    workflow.add_edge("agent_1_search", "start_deep_dive") # 1순위 스타트업으로 분석 시작
     
-    # 심층 분석 파이프라인 (2 -> 3 -> 4 -> 5)
-    workflow.add_edge("agent_2_tech", "agent_3_market")
-    workflow.add_edge("agent_3_market", "agent_4_competitor")
-    workflow.add_edge("agent_4_competitor", "agent_5_decision")
+    # 심층 분석 파이프라인 (리서치 1회 -> 2 | 3 | 4 병렬 -> 5)
+    # Agent 2/3/4는 같은 리서치 번들을 읽으므로 서로 독립적으로 실행
+    workflow.add_edge("start_deep_dive", "research")
+    workflow.add_edge("research", "agent_2_tech")
+    workflow.add_edge("research", "agent_3_market")
+    workflow.add_edge("research", "agent_4_competitor")
+    workflow.add_edge(["agent_2_tech", "agent_3_market", "agent_4_competitor"], "agent_5_decision")
 
     # 4. 조건부 분기 (핵심 로직)
     workflow.add_conditional_edges(
@@ -106,7 +158,7 @@ def build_main_graph():
         check_remaining_startups,
         {
             "generate_report": "agent_6_report", # (스타트업 소진 시)
-            "loop_to_agent_2": "agent_2_tech"   # (Agent 2부터 다시 시작)
+            "loop_to_agent_2": "start_deep_dive"   # (Agent 2/3/4부터 다시 시작)
         }
     )
 
@@ -130,12 +182,33 @@ if __name__ == "__main__":
         print("Agent 0 (페르소나 진단)이 사용자 입력을 기다립니다.")
         
         initial_state = {} # 초기 상태는 비워둡니다.
+        run_metrics.reset()
         
-        # 스트리밍 실행
-        for event in app.stream(initial_state, {"recursion_limit": 50}):
-            (node, state) = event.popitem()
-            print(f"--- Finished Node: {node} ---")
-            if "final_report" in state and state["final_report"]:
-                print("🏁 워크플로우가 완료되었습니다. Final_Investment_Report.md를 확인하세요.")
+        # 스트리밍 실행 (실행 단위 검색 메모/카운터와 선행 분석 범위)
+        with search_run_scope() as search_run, speculation_scope():
+            for event in app.stream(initial_state, {"recursion_limit": 50}):
+                (node, state) = event.popitem()
+                print(f"--- Finished Node: {node} ---")
+                if "final_report" in state and state["final_report"]:
+                    print("🏁 워크플로우가 완료되었습니다. Final_Investment_Report.md를 확인하세요.")
+
+        search_stats = get_search_run_stats(search_run)
+        print(f"🔎 검색 통계: 요청 {search_stats['queries']}건, "
+              f"중복 제거 {search_stats['deduplicated']}건 "
+              f"(메모 {search_stats['memo_hits']} / 병합 {search_stats['coalesced']}), "
+              f"캐시 hit {search_stats['cache']['hits']} / miss {search_stats['cache']['misses']}")
+        llm_stats = get_llm_cache_stats()
+        print(f"🧠 LLM 캐시: hit {llm_stats['hits']} / miss {llm_stats['misses']} "
+              f"(hit rate {llm_stats['hit_rate']:.0%}, {llm_stats['entries']}개 저장)")
+        emb_stats = get_embedding_cache_stats()
+        if emb_stats:
+            print(f"🧮 임베딩 캐시: hit rate {emb_stats['hit_rate']:.0%}, 벡터 {emb_stats['vectors_stored']}개 저장")
+
+        print("\n📈 노드별 실행 지표 (wall time은 하위 노드 포함)")
+        print(run_metrics.summary_table())
+        print(f"📈 지표 저장: {run_metrics.write_json(RUN_METRICS_PATH)}")
+        cassette_path = save_cassette()
+        if cassette_path:
+            print(f"📼 카세트 저장: {cassette_path}")
 
         print("\n✅ Main graph execution complete.")
\ No newline at end of file
@@ -0,0 +1,234 @@
+# FILE: metrics.py
+# (실행 계측: 노드별 소요 시간, LLM 호출/토큰/비용, 검색 호출/캐시 hit)
+
+"""
+Run metrics.
+
+Every main-graph node and Agent 2 sub-graph node is wrapped with
+`instrument_node`, which sets the current node in a ContextVar. LLM calls
+(via the callback handler attached in config.get_llm/get_llm_mini) and
+searches (recorded in config) are attributed to the innermost running
+node. Wall time of a node includes nodes nested inside it (Agent 2's
+sub-graph inside agent_2_tech); LLM/search counts are never double-counted.
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+import contextvars
+from typing import Callable, Dict
+
+RUN_METRICS_PATH = os.getenv("RUN_METRICS_PATH", "run_metrics.json")
+
+# 모델별 가격 (USD / 1M tokens: 입력, 출력)
+MODEL_PRICES = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+
+_OUTSIDE = "(outside nodes)"
+_current_node: contextvars.ContextVar = contextvars.ContextVar("rwa_current_node", default=_OUTSIDE)
+_llm_cache_hit = threading.local()  # LLMResponseCache.lookup hit → 같은 스레드의 on_llm_end에서 확인
+
+_SEARCH_KINDS = ("memo", "coalesced", "cache", "network", "cassette")
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """토큰 수 → 예상 비용 (USD). 가격표에 없는 모델은 0"""
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):  # 'gpt-4o-mini'가 'gpt-4o'보다 먼저 매칭
+        if model and model.startswith(name):
+            price_in, price_out = MODEL_PRICES[name]
+            return (prompt_tokens * price_in + completion_tokens * price_out) / 1_000_000
+    return 0.0
+
+
+def _empty_row() -> dict:
+    row = {
+        "calls": 0, "errors": 0, "wall_seconds": 0.0,
+        "llm_calls": 0, "llm_cache_hits": 0, "llm_seconds": 0.0,
+        "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+        "search_calls": 0,
+    }
+    row.update({f"search_{kind}": 0 for kind in _SEARCH_KINDS})
+    return row
+
+
+class RunMetrics:
+    """Thread-safe per-node counters for one run (process-wide)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rows: Dict[str, dict] = {}
+            self._models: Dict[str, dict] = {}
+            self.started_at = time.time()
+
+    def _row(self, node: str) -> dict:
+        row = self._rows.get(node)
+        if row is None:
+            row = self._rows[node] = _empty_row()
+        return row
+
+    def record_node(self, node: str, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            row = self._row(node)
+            row["calls"] += 1
+            row["wall_seconds"] += seconds
+            if error:
+                row["errors"] += 1
+
+    def record_llm(self, model: str, seconds: float, prompt_tokens: int, completion_tokens: int,
+                   cached: bool) -> None:
+        cost = 0.0 if cached else estimate_cost(model, prompt_tokens, completion_tokens)
+        with self._lock:
+            for row in (self._row(_current_node.get()), self._models.setdefault(model or "unknown", _empty_row())):
+                row["llm_calls"] += 1
+                row["llm_seconds"] += seconds
+                if cached:
+                    row["llm_cache_hits"] += 1
+                else:
+                    row["prompt_tokens"] += prompt_tokens
+                    row["completion_tokens"] += completion_tokens
+                    row["cost_usd"] += cost
+
+    def record_search(self, kind: str) -> None:
+        """kind: memo | coalesced | cache | network | cassette"""
+        with self._lock:
+            row = self._row(_current_node.get())
+            row["search_calls"] += 1
+            row[f"search_{kind}"] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            nodes = {name: dict(row) for name, row in self._rows.items()}
+            models = {name: dict(row) for name, row in self._models.items()}
+        totals = _empty_row()
+        for row in nodes.values():
+            for key, value in row.items():
+                if key not in ("calls", "errors", "wall_seconds"):
+                    totals[key] += value
+        totals["run_seconds"] = round(time.time() - self.started_at, 3)
+        return {"nodes": nodes, "models": models, "totals": totals}
+
+    def summary_table(self) -> str:
+        snap = self.snapshot()
+        header = (f"{'node':34s} {'calls':>5s} {'wall(s)':>8s} {'llm':>4s} {'hit':>4s} {'llm(s)':>7s} "
+                  f"{'tok_in':>8s} {'tok_out':>7s} {'cost($)':>8s} {'search':>6s} {'net':>4s}")
+        lines = [header, "-" * len(header)]
+        rows = sorted(snap["nodes"].items(), key=lambda kv: kv[1]["wall_seconds"], reverse=True)
+        for name, r in rows + [("TOTAL", {**snap["totals"], "calls": 0, "wall_seconds": snap["totals"]["run_seconds"]})]:
+            lines.append(
+                f"{name[:34]:34s} {r['calls']:5d} {r['wall_seconds']:8.2f} {r['llm_calls']:4d} "
+                f"{r['llm_cache_hits']:4d} {r['llm_seconds']:7.2f} {r['prompt_tokens']:8d} "
+                f"{r['completion_tokens']:7d} {r['cost_usd']:8.4f} {r['search_calls']:6d} {r['search_network']:4d}"
+            )
+        return "\n".join(lines)
+
+    def write_json(self, path: str = RUN_METRICS_PATH) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2, ensure_ascii=False)
+        return path
+
+
+run_metrics = RunMetrics()
+
+
+def instrument_node(name: str, fn: Callable) -> Callable:
+    """그래프 노드 래퍼: 실행 중 현재 노드를 설정하고 소요 시간/오류를 기록"""
+    @functools.wraps(fn)
+    def node(*args, **kwargs):
+        token = _current_node.set(name)
+        started = time.perf_counter()
+        error = False
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            run_metrics.record_node(name, time.perf_counter() - started, error)
+            _current_node.reset(token)
+    return node
+
+
+def bind_context(fn: Callable) -> Callable:
+    """작업 스레드(ThreadPoolExecutor)에서도 호출한 노드로 집계되도록 현재 컨텍스트를 전달"""
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        return ctx.copy().run(fn, *args, **kwargs)
+    return run
+
+
+def note_llm_cache_hit() -> None:
+    """LLM 응답 캐시 hit 표시 (같은 스레드의 다음 on_llm_end가 캐시 응답으로 집계)"""
+    _llm_cache_hit.value = True
+
+
+_handler = None
+_handler_lock = threading.Lock()
+
+
+def llm_metrics_handler():
+    """LLM 호출 계측용 LangChain 콜백 핸들러 (프로세스 공유, 최초 호출 시 생성)"""
+    global _handler
+    with _handler_lock:
+        if _handler is None:
+            _handler = _make_handler()
+        return _handler
+
+
+def _make_handler():
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class LLMMetricsHandler(BaseCallbackHandler):
+        """Records call count, latency, token usage and cost per LLM call."""
+
+        def __init__(self):
+            self._starts: Dict[object, tuple] = {}
+            self._lock = threading.Lock()
+
+        def _start(self, run_id, serialized, kwargs) -> None:
+            params = kwargs.get("invocation_params") or {}
+            model = params.get("model_name") or params.get("model") or \
+                ((serialized or {}).get("kwargs") or {}).get("model_name", "")
+            with self._lock:
+                self._starts[run_id] = (time.perf_counter(), model)
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+            self._start(run_id, serialized, kwargs)
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+            self._start(run_id, serialized, kwargs)
+
+        def on_llm_end(self, response, *, run_id, **kwargs):
+            with self._lock:
+                started, model = self._starts.pop(run_id, (time.perf_counter(), ""))
+            cached = getattr(_llm_cache_hit, "value", False)
+            _llm_cache_hit.value = False
+
+            usage = (response.llm_output or {}).get("token_usage") or {}
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+            if not usage:
+                for generations in response.generations:
+                    for gen in generations:
+                        meta = getattr(getattr(gen, "message", None), "usage_metadata", None) or {}
+                        prompt_tokens += meta.get("input_tokens", 0)
+                        completion_tokens += meta.get("output_tokens", 0)
+            model = (response.llm_output or {}).get("model_name") or model
+
+            run_metrics.record_llm(model, time.perf_counter() - started, prompt_tokens, completion_tokens, cached)
+
+        def on_llm_error(self, error, *, run_id, **kwargs):
+            with self._lock:
+                self._starts.pop(run_id, None)
+            _llm_cache_hit.value = False
+
+    return LLMMetricsHandler()
@@ -0,0 +1,106 @@
+# FILE: prefilter.py
+# (Agent 1 사전 필터: 로컬 임베딩 유사도로 검색+LLM 평가 대상 상위 N개 선별)
+
+import heapq
+import random
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from score_store import CRITERIA_ORDER, weight_vector
+from startup_sources import iter_batches
+
+
+def _normalize(vectors) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def startup_text(startup: dict) -> str:
+    return f"{startup['sector']}. {startup['strength']}"
+
+
+def prefilter_startups(
+    startups: Iterable[dict],
+    criteria: Dict[str, dict],
+    weights: Dict[str, float],
+    embeddings,
+    top_n: int,
+    batch_size: int = 64,
+    audit_sample: int = 0,
+    seed: int = 0,
+) -> Tuple[List[dict], List[dict], dict]:
+    """
+    Keeps the top-N startups by persona-weighted embedding similarity.
+
+    docstring: Each startup's sector/strength text is embedded and compared
+               (cosine) with every criterion description; the similarities
+               are combined with the persona weights, and only the best
+               `top_n` go on to search + LLM scoring. With `audit_sample` > 0
+               a seeded uniform sample of the dropped startups is also
+               returned, so the caller can score it on the full path and
+               measure recall with `audit_recall`. Returns (selected
+               startups in input order, dropped sample, report dict).
+    """
+    criteria_vectors = _normalize(embeddings.embed_documents(
+        [f"{criteria[c]['name']}: {criteria[c]['description']}" for c in CRITERIA_ORDER]
+    ))
+    w = weight_vector(weights)
+    rng = random.Random(seed)  # 고정 시드: 같은 입력이면 같은 표본 (저장된 점수 재사용)
+
+    selected_heap = []   # (유사도 점수, -입력순서, 스타트업)
+    dropped_sample = []  # 탈락 스타트업 저수지 표본 (힙에서 밀려난 항목은 다시 선별되지 않음)
+    dropped = 0
+    seen = 0
+
+    def _drop(entry) -> None:
+        nonlocal dropped
+        dropped += 1
+        if len(dropped_sample) < audit_sample:
+            dropped_sample.append(entry[2])
+        elif audit_sample > 0:
+            j = rng.randrange(dropped)
+            if j < audit_sample:
+                dropped_sample[j] = entry[2]
+
+    for batch in iter_batches(startups, batch_size):
+        startup_vectors = _normalize(embeddings.embed_documents([startup_text(s) for s in batch]))
+        prefilter_scores = (startup_vectors @ criteria_vectors.T) @ w
+
+        for i, (startup, score) in enumerate(zip(batch, prefilter_scores), 1):
+            entry = (float(score), -(seen + i), startup)
+            if len(selected_heap) < top_n:
+                heapq.heappush(selected_heap, entry)
+            else:
+                _drop(heapq.heappushpop(selected_heap, entry))
+        seen += len(batch)
+
+    selected = [startup for _, _, startup in sorted(selected_heap, key=lambda e: -e[1])]
+    report = {
+        "seen": seen,
+        "top_n": top_n,
+        "selected": len(selected),
+        "audit_sample": len(dropped_sample),
+        "recall_at_k": None,  # 감사 표본의 전체 경로 평가 후 audit_recall로 채움
+        "recall_k": 0,
+    }
+    return selected, dropped_sample, report
+
+
+def audit_recall(selected_scores: Sequence[float], sample_scores: Sequence[float],
+                 top_k: int) -> Tuple[Optional[float], int]:
+    """
+    Recall of the filter against the full path, estimated on an audit sample.
+
+    docstring: Both inputs are full-path total scores: every selected
+               startup and the audited sample of dropped ones. Returns the
+               share of the combined top-`top_k` that the filter selected
+               and the size of that top-k; (None, 0) without audit scores,
+               since the selected set alone cannot show a miss.
+    """
+    if not sample_scores:
+        return None, 0
+    combined = [(score, True) for score in selected_scores] + [(score, False) for score in sample_scores]
+    reference = sorted(combined, key=lambda e: -e[0])[:top_k]
+    return sum(1 for _, was_selected in reference if was_selected) / len(reference), len(reference)
@@ -0,0 +1,47 @@
+# FILE: rate_limiter.py
+# (공유 토큰 버킷 레이트 리미터 - 스레드/이벤트 루프 공용)
+
+import time
+import asyncio
+import threading
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by sync and async callers.
+
+    docstring: Each acquire reserves one token up front (the balance may go
+               negative) and returns how long the caller must wait, so callers
+               on different threads or event loops are served in arrival order
+               at `rate` tokens/sec with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약 후 대기 시간(초) 반환 (rate <= 0 이면 무제한)"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,48 @@
+# FILE: render_report.py
+# (저장된 최종 상태 스냅샷에서 보고서 재생성 - 에이전트/LLM 재실행 없음)
+
+"""
+Re-renders the final report from a saved GraphState snapshot.
+
+Agent 6 saves <report>.state.json next to every report, including its
+financial/team extractions, so layout changes can be checked in seconds:
+
+    python render_report.py Final_Investment_Report.state.json
+    python render_report.py reports/job-1.state.json --format html json
+    python render_report.py reports/job-1.state.json --format json --output job-1.json
+"""
+
+import sys
+import argparse
+
+from state_snapshot import load_state_snapshot
+from report_writer import REPORT_FORMATS
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Re-render the final report from a saved state snapshot")
+    parser.add_argument("snapshot", help="state snapshot written by Agent 6 (<report>.state.json)")
+    parser.add_argument("--format", nargs="+", choices=REPORT_FORMATS, default=["md"])
+    parser.add_argument("--output", help="output path for a single format (default: the snapshot's report_path "
+                                         "with the format's extension)")
+    args = parser.parse_args(argv)
+    if args.output and len(args.format) > 1:
+        parser.error("--output can only be used with a single --format")
+
+    from RWA_Investment_Agent2.agent6_ReportGen import report_meta, report_title, iter_report_sections, \
+        write_report_files
+    from report_writer import write_report
+
+    state = load_state_snapshot(args.snapshot)
+    if args.output:
+        paths = [write_report(args.output, iter_report_sections(state), args.format[0],
+                              title=report_title(state), meta=report_meta(state))]
+    else:
+        paths = write_report_files(state, state.get("report_path") or "Final_Investment_Report.md", args.format)
+    for path in paths:
+        print(f"✅ 보고서 재생성: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+# FILE: report_writer.py
+# (스트리밍 보고서 작성기: 섹션 단위로 Markdown/JSON/HTML 파일에 바로 기록, 임시 파일 → rename으로 원자적 교체)
+
+"""
+Streaming report writer.
+
+A report is a sequence of `Section`s produced lazily (Agent 6 yields them
+one by one). Each section carries its Markdown as an iterable of chunks
+(large tables are generators of rows) and optional structured `data` for
+the JSON output. The writer formats every section as it arrives and
+flushes it to <path>.partial, so partial output is visible while a long
+report is written and memory stays bounded by the largest chunk; the
+finished file replaces <path> atomically.
+
+    with ReportWriter("report.html", "html", title="...") as writer:
+        for section in sections:
+            writer.write_section(section)
+"""
+
+import os
+import re
+import html
+import json
+from string import Template
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+REPORT_FORMATS = ("md", "json", "html")
+REPORT_JSON_FORMAT = "rwa-report/1"
+
+# 미리 컴파일된 문서 틀 (HTML/JSON; Markdown은 섹션 내용을 그대로 기록)
+_HTML_HEAD = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<style>
+body { font-family: -apple-system, "Segoe UI", "Noto Sans KR", sans-serif; max-width: 960px; margin: 2em auto; padding: 0 1em; line-height: 1.55; }
+table { border-collapse: collapse; margin: 1em 0; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: left; }
+pre { background: #f6f8fa; padding: 1em; overflow-x: auto; }
+</style>
+</head>
+<body>
+""")
+_HTML_SECTION_OPEN = Template('<section id="$key">\n')
+_HTML_SECTION_CLOSE = "</section>\n"
+_HTML_FOOT = "</body>\n</html>\n"
+
+_JSON_HEAD = Template('{"format": "$format", "title": $title, "meta": $meta, "sections": [\n')
+_JSON_SECTION_OPEN = Template('$sep{"key": $key, "title": $title, "markdown": "')
+_JSON_FOOT = "\n]}\n"
+
+_json_encoder = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+class Section(NamedTuple):
+    """
+    One report section.
+
+    docstring: `chunks` is the section's Markdown (a string or any iterable
+               of strings, consumed once). `data` is what the JSON output
+               stores next to it: a JSON value, or a zero-argument callable
+               returning an iterable that is streamed as a JSON array.
+    """
+    key: str
+    title: str
+    chunks: Union[str, Iterable[str]]
+    data: Union[None, Any, Callable[[], Iterable[Any]]] = None
+
+
+def iter_chunks(section: Section) -> Iterator[str]:
+    return iter((section.chunks,)) if isinstance(section.chunks, str) else iter(section.chunks)
+
+
+def iter_json_block(value: Any) -> Iterator[str]:
+    """값을 Markdown JSON 코드 블록으로 (json.dumps 문자열 없이 인코더 조각 단위로 생성)"""
+    yield "```json\n"
+    yield from json.JSONEncoder(indent=2, ensure_ascii=False, default=str).iterencode(value)
+    yield "\n```"
+
+
+def render_markdown(sections: Iterable[Section]) -> str:
+    """섹션들을 하나의 Markdown 문자열로 (작은 보고서/미리보기용)"""
+    return "".join(chunk for section in sections for chunk in iter_chunks(section))
+
+
+class _MarkdownToHtml:
+    """
+    Line-based Markdown → HTML converter for the subset the reports use.
+
+    docstring: Headings, horizontal rules, pipe tables, (nested) bullet and
+               numbered lists, task-list items, fenced code blocks,
+               paragraphs, **bold** and `code`. Text is fed in arbitrary
+               chunks; only complete lines are converted, so it streams.
+    """
+
+    _LIST_ITEM = re.compile(r"^(\s*)(?:[-*]|\d+\.)\s+(.*)$")
+    _TASK = re.compile(r"^\[( |x|X)\]\s+")
+
+    def __init__(self, write: Callable[[str], None]):
+        self._write = write
+        self._buffer = ""
+        self._in_code = False
+        self._table_rows = 0
+        self._lists: list = []       # (indent, tag) 스택
+        self._paragraph = False
+
+    def feed(self, text: str) -> None:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._line(line)
+
+    def close(self) -> None:
+        if self._buffer:
+            self._line(self._buffer)
+            self._buffer = ""
+        if self._in_code:
+            self._write("</code></pre>\n")
+            self._in_code = False
+        self._close_blocks()
+
+    @staticmethod
+    def _inline(text: str) -> str:
+        text = html.escape(text, quote=False)
+        text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+        return re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
+
+    def _close_lists(self, indent: int = -1) -> None:
+        while self._lists and self._lists[-1][0] > indent:
+            self._write(f"</li>\n</{self._lists.pop()[1]}>\n")
+
+    def _close_blocks(self) -> None:
+        if self._paragraph:
+            self._write("</p>\n")
+            self._paragraph = False
+        if self._table_rows:
+            self._write("</table>\n")
+            self._table_rows = 0
+        self._close_lists()
+
+    def _line(self, line: str) -> None:
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            if self._in_code:
+                self._write("</code></pre>\n")
+            else:
+                self._close_blocks()
+                self._write("<pre><code>")
+            self._in_code = not self._in_code
+            return
+        if self._in_code:
+            self._write(html.escape(line, quote=False) + "\n")
+            return
+        if not stripped:
+            self._close_blocks()
+            return
+
+        if stripped.startswith("|"):
+            cells = [c.strip() for c in stripped.strip("|").split("|")]
+            if all(set(c) <= set("-: ") for c in cells):
+                return  # 헤더 구분선
+            if not self._table_rows:
+                self._close_blocks()
+                self._write("<table>\n")
+            tag = "th" if self._table_rows == 0 else "td"
+            self._write("<tr>" + "".join(f"<{tag}>{self._inline(c)}</{tag}>" for c in cells) + "</tr>\n")
+            self._table_rows += 1
+            return
+        if self._table_rows:
+            self._close_blocks()
+
+        heading = re.match(r"^(#{1,6})\s+(.*)$", stripped)
+        if heading:
+            self._close_blocks()
+            level = len(heading.group(1))
+            self._write(f"<h{level}>{self._inline(heading.group(2))}</h{level}>\n")
+            return
+        if re.fullmatch(r"-{3,}", stripped):
+            self._close_blocks()
+            self._write("<hr>\n")
+            return
+
+        item = self._LIST_ITEM.match(line)
+        if item:
+            if self._paragraph:
+                self._write("</p>\n")
+                self._paragraph = False
+            indent = len(item.group(1))
+            tag = "ol" if stripped[0].isdigit() else "ul"
+            self._close_lists(indent)
+            if self._lists and self._lists[-1][0] == indent:
+                self._write("</li>\n")
+            else:
+                self._lists.append((indent, tag))  # 하위 목록은 열려 있는 <li> 안에 중첩
+                self._write(f"<{tag}>\n")
+            text = self._TASK.sub(lambda m: "☑ " if m.group(1).strip() else "☐ ", item.group(2))
+            self._write(f"<li>{self._inline(text)}")
+            return
+
+        if self._lists:
+            self._close_lists()
+        if self._paragraph:
+            self._write("<br>\n" + self._inline(stripped))
+        else:
+            self._write("<p>" + self._inline(stripped))
+            self._paragraph = True
+
+
+class ReportWriter:
+    """
+    Writes sections to `path` in one of REPORT_FORMATS as they are produced.
+
+    docstring: Output goes to <path>.partial and is flushed after every
+               section; on a clean exit the file is renamed over `path`
+               (os.replace), on an exception it is removed and `path` is
+               left untouched.
+    """
+
+    def __init__(self, path: str, fmt: str = "md", title: str = "", meta: Optional[dict] = None):
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format: {fmt!r} (expected one of {REPORT_FORMATS})")
+        self.path = path
+        self.fmt = fmt
+        self.title = title
+        self.meta = meta or {}
+        self.partial_path = f"{path}.partial"
+        self._file = None
+        self._sections = 0
+
+    def __enter__(self) -> "ReportWriter":
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.partial_path, "w", encoding="utf-8")
+        if self.fmt == "html":
+            self._file.write(_HTML_HEAD.substitute(title=html.escape(self.title)))
+        elif self.fmt == "json":
+            self._file.write(_JSON_HEAD.substitute(
+                format=REPORT_JSON_FORMAT, title=_json_encoder.encode(self.title),
+                meta=_json_encoder.encode(self.meta)))
+        return self
+
+    def write_section(self, section: Section) -> None:
+        write = self._file.write
+        if self.fmt == "md":
+            for chunk in iter_chunks(section):
+                write(chunk)
+        elif self.fmt == "html":
+            write(_HTML_SECTION_OPEN.substitute(key=html.escape(section.key)))
+            converter = _MarkdownToHtml(write)
+            for chunk in iter_chunks(section):
+                converter.feed(chunk)
+            converter.close()
+            write(_HTML_SECTION_CLOSE)
+        else:
+            write(_JSON_SECTION_OPEN.substitute(
+                sep=",\n" if self._sections else "",
+                key=_json_encoder.encode(section.key), title=_json_encoder.encode(section.title)))
+            for chunk in iter_chunks(section):
+                write(_json_encoder.encode(chunk)[1:-1])  # 문자열 내용만 이어 쓰기 (JSON 문자열 스트리밍)
+            write('"')
+            if section.data is not None:
+                write(', "data": ')
+                self._write_json_data(section.data)
+            write("}")
+        self._sections += 1
+        self._file.flush()
+
+    def _write_json_data(self, data) -> None:
+        if not callable(data):
+            for piece in _json_encoder.iterencode(data):
+                self._file.write(piece)
+            return
+        self._file.write("[")
+        for i, item in enumerate(data()):
+            self._file.write((", " if i else "") + _json_encoder.encode(item))
+        self._file.write("]")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            if self.fmt == "html":
+                self._file.write(_HTML_FOOT)
+            elif self.fmt == "json":
+                self._file.write(_JSON_FOOT)
+        self._file.close()
+        if exc_type is None:
+            os.replace(self.partial_path, self.path)
+        else:
+            try:
+                os.remove(self.partial_path)
+            except OSError:
+                pass
+
+
+def format_path(report_path: str, fmt: str) -> str:
+    """보고서 경로의 확장자를 형식에 맞게 (Final_Investment_Report.md → .html / .json)"""
+    return f"{os.path.splitext(report_path)[0]}.{fmt}"
+
+
+def write_report(path: str, sections: Iterable[Section], fmt: str = "md", title: str = "",
+                 meta: Optional[dict] = None) -> str:
+    """섹션 스트림을 한 파일로 기록하고 경로 반환"""
+    with ReportWriter(path, fmt, title=title, meta=meta) as writer:
+        for section in sections:
+            writer.write_section(section)
+    return path
@@ -0,0 +1,102 @@
+# FILE: research.py
+# (공유 리서치 단계: 스타트업별 검색을 한 번에 수행해 Agent 2/3/4/6이 같은 근거를 사용)
+
+import os
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from graph_state import GraphState, ResearchBundle, ResearchDocument
+from config import search_many
+
+RESEARCH_MAX_RESULTS = int(os.getenv("RESEARCH_MAX_RESULTS", 5))  # 쿼리당 검색 결과 수
+
+
+def research_queries(startup: dict) -> Dict[str, List[str]]:
+    """주제별 검색 쿼리 (각 에이전트가 개별로 실행하던 쿼리의 합집합 + Agent 6용 재무/팀)"""
+    name = startup.get("name", "")
+    segment = startup.get("sector", "")
+    return {
+        "tech": [f"{name} {segment}", f"{name} tokenization KYC AML licensing"],
+        "market": [f"{name} {segment} market size TAM SAM SOM CAGR"],
+        "competitors": [f"main competitors for {name} in {segment}"],
+        "financial": [f"{name} funding round investors valuation revenue"],
+        "team": [f"{name} founders CEO leadership team"],
+    }
+
+
+def _content_hash(text: str) -> str:
+    normalized = " ".join(text.split()).lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def build_research_bundle(startup: dict) -> ResearchBundle:
+    """
+    Runs every topic's queries as one concurrent batch and deduplicates.
+
+    docstring: Results are merged by URL and by normalized content hash;
+               a document returned for several topics is kept once and
+               tagged with all of them.
+    """
+    queries = research_queries(startup)
+    flat = [(topic, q) for topic, qs in queries.items() for q in qs]
+    results = search_many([q for _, q in flat], max_results=RESEARCH_MAX_RESULTS)
+
+    documents: List[ResearchDocument] = []
+    index_by_key: Dict[str, int] = {}
+    for (topic, _), items in zip(flat, results):
+        for item in items or []:
+            content = item.get("content") or item.get("snippet") or ""
+            url = item.get("url", "")
+            content_hash = _content_hash(content)
+            keys = [f"url:{url}"] if url else []
+            if content:
+                keys.append(f"hash:{content_hash}")
+            existing = next((index_by_key[k] for k in keys if k in index_by_key), None)
+            if existing is not None:
+                if topic not in documents[existing]["topics"]:
+                    documents[existing]["topics"].append(topic)
+            else:
+                existing = len(documents)
+                documents.append({
+                    "title": item.get("title", ""),
+                    "url": url,
+                    "content": content,
+                    "snippet": item.get("snippet", content),
+                    "content_hash": content_hash,
+                    "topics": [topic],
+                })
+            for k in keys:
+                index_by_key.setdefault(k, existing)
+
+    return {
+        "startup": startup.get("name", ""),
+        "sector": startup.get("sector", ""),
+        "queries": queries,
+        "documents": documents,
+        "fetched_at": datetime.utcnow().isoformat(timespec="seconds"),
+    }
+
+
+def research_results(state: GraphState, topic: str) -> Optional[List[dict]]:
+    """
+    Returns the bundle's documents for a topic in search-result shape.
+
+    docstring: None when there is no bundle for the current startup, so the
+               caller can fall back to its own search.
+    """
+    bundle = state.get("research_bundle")
+    startup = state.get("current_startup_data") or {}
+    if not bundle or bundle.get("startup") != startup.get("name") or bundle.get("sector") != startup.get("sector"):
+        return None
+    return [doc for doc in bundle["documents"] if topic in doc["topics"]]
+
+
+def run_research(state: GraphState) -> dict:
+    """Research node: fetches the shared evidence bundle for the current startup."""
+    startup = state["current_startup_data"]
+    print(f"--- (R) RESEARCH: {startup['name']} 공유 검색 실행 ---")
+    bundle = build_research_bundle(startup)
+    query_count = sum(len(qs) for qs in bundle["queries"].values())
+    print(f"    ✓ 쿼리 {query_count}건 → 문서 {len(bundle['documents'])}건 (URL/내용 중복 제거)")
+    return {"research_bundle": bundle}
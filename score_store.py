@@ -0,0 +1,213 @@
+# FILE: score_store.py
+# (Agent 1 원점수 저장소 + NumPy 벡터화 재랭킹)
+
+"""
+Persona-independent score store.
+
+The LLM's per-criterion scores don't depend on the persona, so Agent 1
+stores them once per startup and ranks with a single matrix product:
+totals = X @ w, where X is (startups x criteria) and w a weight vector.
+
+Entries are keyed by a fingerprint of the startup record (name, sector,
+strength) plus the evaluation version (prompts + model), so only new or
+changed startups are re-evaluated, and expire after SCORE_STORE_MAX_AGE_DAYS.
+
+Usage: python score_store.py --persona conservative [--top 20]
+       python score_store.py --weights 0.25,0.25,0.25,0.25
+"""
+
+import os
+import sys
+import time
+import hashlib
+import argparse
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from disk_cache import DiskCache, CACHE_DIR
+
+# 행렬 열 순서 (PERSONA_WEIGHTS / EVALUATION_CRITERIA 키와 동일)
+CRITERIA_ORDER = ("seed_early", "regional_esg", "growth_partnership", "regulation_monetization")
+
+SCORE_STORE_DISABLED = os.getenv("SCORE_STORE_DISABLED", "").lower() in ("1", "true", "yes")
+SCORE_STORE_MAX_AGE_DAYS = float(os.getenv("SCORE_STORE_MAX_AGE_DAYS", 30))  # 0이면 만료 없음
+
+# 페르소나에 따라 달라지는 필드 (저장하지 않고 랭킹 시 계산)
+_WEIGHTED_FIELDS = ("total_score", "domain_fit", "credibility_score", "final_score")
+
+
+class ScoreStore:
+    """
+    Persists Agent 1's raw evaluation per startup fingerprint.
+
+    docstring: A record holds name, sector, strength, the extracted info
+               (website/region/funding_stage) and the raw `scores` dict;
+               weighted fields are stripped before storing. `version`
+               identifies the prompts/model that produced the scores, so
+               changing either invalidates every stored entry. Each entry
+               is {"record": ..., "version": ..., "evaluated_at": ...}, so
+               `get` returns exactly the record that was put and
+               `records` can skip entries from other versions.
+    """
+
+    def __init__(self, path: str, max_age_days: float = 30, max_entries: int = 100000):
+        ttl = max_age_days * 24 * 3600 if max_age_days > 0 else None
+        self._cache = DiskCache(path, max_entries=max_entries, default_ttl=ttl)
+
+    @staticmethod
+    def fingerprint(startup: dict, version: str = "") -> str:
+        """스타트업 레코드(name, sector, strength) + 평가 버전의 sha256"""
+        parts = [str(startup.get(field, "")) for field in ("name", "sector", "strength")] + [version]
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _is_entry(entry) -> bool:
+        return isinstance(entry, dict) and "record" in entry  # 이전 형식(레코드만 저장)은 미스로 처리 → 재평가
+
+    def get(self, startup: dict, version: str = "") -> Optional[dict]:
+        entry = self._cache.get(self.fingerprint(startup, version))
+        return entry["record"] if self._is_entry(entry) else None
+
+    def put(self, startup: dict, record: dict, version: str = "") -> None:
+        raw = {k: v for k, v in record.items() if k not in _WEIGHTED_FIELDS}
+        self._cache.set(self.fingerprint(startup, version),
+                        {"record": raw, "version": version, "evaluated_at": time.time()})
+
+    def records(self, version: str = "") -> List[dict]:
+        """해당 평가 버전의 만료되지 않은 레코드 (같은 이름의 이전 평가가 남아 있으면 최신 것만)"""
+        latest: Dict[str, dict] = {}
+        for _, entry in self._cache.items():
+            if not self._is_entry(entry) or entry.get("version") != version:
+                continue
+            name = entry["record"]["name"]
+            current = latest.get(name)
+            if current is None or entry["evaluated_at"] > current["evaluated_at"]:
+                latest[name] = entry
+        return [entry["record"] for entry in latest.values()]
+
+    def purge(self, expired_only: bool = False) -> int:
+        return self._cache.purge(expired_only=expired_only)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+_score_store: Optional[ScoreStore] = None
+
+
+def get_score_store() -> Optional[ScoreStore]:
+    """공유 원점수 저장소 (SCORE_STORE_DISABLED=1이면 None)"""
+    global _score_store
+    if SCORE_STORE_DISABLED:
+        return None
+    if _score_store is None:
+        _score_store = ScoreStore(os.path.join(CACHE_DIR, "score_store.sqlite"), max_age_days=SCORE_STORE_MAX_AGE_DAYS)
+    return _score_store
+
+
+def weight_vector(weights: Dict[str, float]) -> np.ndarray:
+    """가중치 dict → CRITERIA_ORDER 순서의 벡터 (누락된 기준은 오류)"""
+    missing = [c for c in CRITERIA_ORDER if c not in weights]
+    if missing:
+        raise ValueError(f"weights missing criteria: {missing}")
+    return np.array([float(weights[c]) for c in CRITERIA_ORDER], dtype=np.float64)
+
+
+def build_score_matrix(records: Sequence[dict]) -> np.ndarray:
+    """원점수 레코드 목록 → (스타트업 수 x 기준 수) 행렬"""
+    matrix = np.empty((len(records), len(CRITERIA_ORDER)), dtype=np.float64)
+    for i, record in enumerate(records):
+        scores = record["scores"]
+        matrix[i] = [float(scores[c]["score"]) for c in CRITERIA_ORDER]
+    return matrix
+
+
+def _weighted_columns(records: Sequence[dict], weights: Dict[str, float], matrix: Optional[np.ndarray]):
+    X = build_score_matrix(records) if matrix is None else matrix
+    totals = X @ weight_vector(weights)
+    domain_fit = (X[:, 0] + X[:, 2]) / 200        # seed_early + growth_partnership
+    credibility = (X[:, 3] + X[:, 1]) / 200       # regulation_monetization + regional_esg
+    return totals, domain_fit, credibility
+
+
+def _weighted_record(record: dict, total: float, domain_fit: float, credibility: float) -> dict:
+    return {
+        **record,
+        "total_score": round(float(total), 2),
+        "domain_fit": round(float(domain_fit), 2),
+        "credibility_score": round(float(credibility), 2),
+        "final_score": round(float(total) / 100, 2),
+    }
+
+
+def score_records(records: Sequence[dict], weights: Dict[str, float],
+                  matrix: Optional[np.ndarray] = None) -> List[dict]:
+    """원점수 레코드에 가중 점수 필드를 채워 입력 순서 그대로 반환"""
+    if not records:
+        return []
+    totals, domain_fit, credibility = _weighted_columns(records, weights, matrix)
+    return [_weighted_record(records[i], totals[i], domain_fit[i], credibility[i]) for i in range(len(records))]
+
+
+def rank_records(records: Sequence[dict], weights: Dict[str, float],
+                 matrix: Optional[np.ndarray] = None, limit: Optional[int] = None) -> List[dict]:
+    """
+    Ranks raw records for a weight vector in one matrix product.
+
+    docstring: Returns new dicts with total_score, domain_fit,
+               credibility_score and final_score filled in, sorted by
+               total_score (descending, stable for ties). Pass a prebuilt
+               `matrix` to re-rank the same records for many personas;
+               `limit` materializes only the top-N records.
+    """
+    if not records:
+        return []
+    totals, domain_fit, credibility = _weighted_columns(records, weights, matrix)
+    order = np.argsort(-totals, kind="stable")
+    if limit is not None:
+        order = order[:limit]
+    return [_weighted_record(records[i], totals[i], domain_fit[i], credibility[i]) for i in order]
+
+
+def _parse_weights(text: str) -> Dict[str, float]:
+    values = [float(v) for v in text.split(",")]
+    if len(values) != len(CRITERIA_ORDER):
+        raise ValueError(f"expected {len(CRITERIA_ORDER)} weights ({', '.join(CRITERIA_ORDER)})")
+    return dict(zip(CRITERIA_ORDER, values))
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-rank stored Agent 1 scores without new LLM/search calls")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--persona", choices=["aggressive", "conservative"])
+    group.add_argument("--weights", help="comma-separated weights in order: " + ", ".join(CRITERIA_ORDER))
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.persona:
+        from RWA_Investment_Agent2.agent0_persona import PERSONA_WEIGHTS
+        weights = PERSONA_WEIGHTS[args.persona]
+    else:
+        weights = _parse_weights(args.weights)
+
+    from RWA_Investment_Agent2.agent1_search import EVAL_VERSION  # 현재 프롬프트/모델로 평가된 점수만
+
+    store = get_score_store()
+    records = store.records(EVAL_VERSION) if store else []
+    if not records:
+        print("⚠️ 현재 평가 버전으로 저장된 점수가 없습니다. Agent 1을 먼저 실행하세요.")
+        return 1
+
+    started = time.perf_counter()
+    ranked = rank_records(records, weights, limit=args.top)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print(f"📋 {len(records)}개 스타트업 재랭킹 ({elapsed_ms:.1f}ms)")
+    for i, res in enumerate(ranked, 1):
+        print(f"  {i:2d}. {res['name']:20s} {res['total_score']:6.2f} pts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# FILE: search_providers.py
+# (검색 공급자 레이어: 서킷 브레이커 + 헤지드 요청)
+
+import time
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+# 공급자 호출 전용 스레드 풀 (asyncio.run 종료 시 헤지에서 진 요청을 기다리지 않도록 기본 executor와 분리)
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="search-provider")
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker with half-open probing.
+
+    docstring: After `failure_threshold` consecutive failures the breaker
+               opens and the provider is skipped. Once `reset_timeout`
+               seconds have passed a single probe request is let through
+               (half-open); success closes the breaker, failure re-opens it.
+               A probe that is cancelled before it runs must call
+               `release_probe`, otherwise no further probe is allowed.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """요청 허용 여부 (half-open 상태에서는 탐색 요청 1건만 허용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """실행되지 않고 취소된 탐색 요청의 half-open 슬롯 반환 (성공/실패 기록 없음)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+class SearchProvider:
+    """A named search backend with health (breaker) and latency tracking."""
+
+    def __init__(self, name: str, fetch: Optional[Callable[[str, int], list]],
+                 breaker: Optional[CircuitBreaker] = None, latency_window: int = 100):
+        self.name = name
+        self.fetch = fetch
+        self.breaker = breaker or CircuitBreaker()
+        self.latencies = deque(maxlen=latency_window)
+        self.calls = 0
+        self.failures = 0
+        self._lock = threading.Lock()  # 공급자 스레드 풀에서 동시에 갱신
+
+    @property
+    def available(self) -> bool:
+        return self.fetch is not None
+
+    def latency_percentile(self, pct: float, min_samples: int = 5) -> Optional[float]:
+        """최근 성공 요청 지연시간의 백분위수 (표본 부족 시 None)"""
+        with self._lock:
+            samples = sorted(self.latencies)
+        if len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(pct * len(samples)))]
+
+    def _timed_fetch(self, query: str, max_results: int) -> list:
+        # 스레드 안에서 기록하므로 헤지로 취소된 요청도 상태/지연시간이 반영됨
+        with self._lock:
+            self.calls += 1
+        start = time.monotonic()
+        try:
+            results = self.fetch(query, max_results)
+        except Exception:
+            with self._lock:
+                self.failures += 1
+            self.breaker.record_failure()
+            raise
+        with self._lock:
+            self.latencies.append(time.monotonic() - start)
+        self.breaker.record_success()
+        return results
+
+    async def asearch(self, query: str, max_results: int) -> list:
+        future = _FETCH_EXECUTOR.submit(self._timed_fetch, query, max_results)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 시작 전에 취소되면(헤지에서 진 백업 등) 성공/실패가 기록되지 않으므로 탐색 슬롯 반환
+            if future.cancel():
+                self.breaker.release_probe()
+            raise
+
+    def stats(self) -> dict:
+        p50, p90 = self.latency_percentile(0.5, 1), self.latency_percentile(0.9, 1)
+        with self._lock:
+            calls, failures = self.calls, self.failures
+        return {
+            "state": self.breaker.state,
+            "calls": calls,
+            "failures": failures,
+            "p50_latency": round(p50, 3) if p50 is not None else None,
+            "p90_latency": round(p90, 3) if p90 is not None else None,
+        }
+
+
+class AllProvidersFailed(Exception):
+    """사용 가능한 모든 검색 공급자가 실패했거나 차단됨"""
+
+
+class ProviderPool:
+    """
+    Ordered list of providers with failover and optional hedging.
+
+    docstring: Providers whose breaker is open are skipped. With hedging on,
+               a backup request is fired when the primary has not answered
+               within its `hedge_percentile` latency, and whichever returns
+               successfully first wins.
+    """
+
+    def __init__(self, providers: List[SearchProvider], hedge: bool = False,
+                 hedge_percentile: float = 0.9, hedge_default_delay: float = 1.5):
+        self.providers = providers
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_default_delay = hedge_default_delay
+        self.hedges_fired = 0
+        self.hedge_wins = 0
+
+    def _next_allowed(self, skip: set) -> Optional[SearchProvider]:
+        for p in self.providers:
+            if p.name in skip or not p.available:
+                continue
+            skip.add(p.name)
+            if p.breaker.allow():
+                return p
+        return None
+
+    async def asearch(self, query: str, max_results: int) -> Tuple[list, str]:
+        """(결과, 응답한 공급자 이름) 반환. 모두 실패 시 AllProvidersFailed"""
+        tried: set = set()
+        errors = []
+        primary = self._next_allowed(tried)
+        while primary is not None:
+            if not self.hedge:
+                try:
+                    return await primary.asearch(query, max_results), primary.name
+                except Exception as e:
+                    errors.append(f"{primary.name}: {e}")
+                    primary = self._next_allowed(tried)
+                    continue
+
+            task = asyncio.ensure_future(primary.asearch(query, max_results))
+            delay = primary.latency_percentile(self.hedge_percentile) or self.hedge_default_delay
+            done, _ = await asyncio.wait({task}, timeout=delay)
+            if done:
+                try:
+                    return task.result(), primary.name
+                except Exception as e:
+                    errors.append(f"{primary.name}: {e}")
+                    primary = self._next_allowed(tried)
+                    continue
+
+            backup = self._next_allowed(tried)
+            if backup is None:
+                try:
+                    return await task, primary.name
+                except Exception as e:
+                    errors.append(f"{primary.name}: {e}")
+                    break
+
+            # 헤지: 백업 공급자 동시 호출, 먼저 성공한 결과 채택
+            self.hedges_fired += 1
+            owners = {task: primary, asyncio.ensure_future(backup.asearch(query, max_results)): backup}
+            pending = set(owners)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    if t.exception() is None:
+                        for other in pending:
+                            other.cancel()
+                        if owners[t] is backup:
+                            self.hedge_wins += 1
+                        return t.result(), owners[t].name
+                    errors.append(f"{owners[t].name}: {t.exception()}")
+            primary = self._next_allowed(tried)
+
+        raise AllProvidersFailed("; ".join(errors) or "no search provider available")
+
+    def stats(self) -> dict:
+        return {
+            "hedges_fired": self.hedges_fired,
+            "hedge_wins": self.hedge_wins,
+            "providers": {p.name: p.stats() for p in self.providers if p.available},
+        }
@@ -0,0 +1,67 @@
+# FILE: singleflight.py
+# (동시 진행 중인 동일 요청 병합 - single-flight)
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    docstring: The first caller for a key (the leader) runs the work; callers
+               arriving while it is in flight wait for the leader's result
+               instead of starting their own. Works across threads and event
+               loops because the shared handle is a concurrent.futures.Future.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+        self.shared = 0
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        with self._lock:
+            fut = self._calls.get(key)
+            if fut is not None:
+                self.shared += 1
+                return fut, False
+            fut = Future()
+            self._calls[key] = fut
+            return fut, True
+
+    def _finish(self, key: Hashable, fut: Future, result: Any = None, exc: BaseException = None) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """동기 실행. (결과, 다른 호출의 결과를 공유했는지 여부) 반환"""
+        fut, leader = self._join(key)
+        if not leader:
+            return fut.result(), True
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, fut, exc=e)
+            raise
+        self._finish(key, fut, result=result)
+        return result, False
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """비동기 실행. (결과, 다른 호출의 결과를 공유했는지 여부) 반환"""
+        fut, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(fut), True
+        try:
+            result = await fn()
+        except BaseException as e:
+            self._finish(key, fut, exc=e)
+            raise
+        self._finish(key, fut, result=result)
+        return result, False
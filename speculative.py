@@ -0,0 +1,168 @@
+# FILE: speculative.py
+# (다음 순위 스타트업 선행 분석 - Agent 2/3/4 결과를 미리 계산)
+
+import threading
+import contextlib
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Dict, Optional, Tuple
+
+from graph_state import GraphState
+from metrics import bind_context
+
+
+class SpeculativePrefetcher:
+    """
+    Runs the deep-dive branches for upcoming ranked startups in the background.
+
+    docstring: While rank N is analysed and decided, the branches for ranks
+               N+1..N+depth are computed on a worker pool. When the loop
+               reaches one of those ranks the branch nodes take the finished
+               (or still running) result instead of starting over. The loop
+               and its stop condition are untouched, so the decision order is
+               identical; unused work is discarded when the report starts.
+               An optional `prepare` step (name, fn) runs once per startup
+               before its branches, which see its state update; it can be
+               taken by name like a branch.
+    """
+
+    def __init__(self, branches: Dict[str, Callable[[GraphState], dict]], depth: int,
+                 max_decisions: int, prepare: Optional[Tuple[str, Callable[[GraphState], dict]]] = None):
+        self.branches = branches
+        self.depth = depth
+        self.max_decisions = max_decisions
+        self.prepare = prepare
+        self._futures: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        tasks_per_startup = len(branches) + (1 if prepare else 0)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, depth * tasks_per_startup), thread_name_prefix="speculative"
+        ) if depth > 0 else None
+        self.used = 0
+        self.discarded = 0
+
+    @staticmethod
+    def _key(branch: str, index: int, startup: dict) -> tuple:
+        return branch, index, startup.get("name"), startup.get("sector")
+
+    def schedule(self, state: GraphState) -> None:
+        """현재 순위 이후 depth개 스타트업의 분석을 백그라운드로 예약"""
+        if self._executor is None:
+            return
+        ranking = state.get("evaluation_results", [])
+        current = state["current_startup_index"]
+        # 루프가 실제로 도달할 수 있는 순위까지만 (현재 건 포함 결정 횟수 제한)
+        remaining = self.max_decisions - len(state.get("decision_log", [])) - 1
+        last = min(len(ranking) - 1, current + min(self.depth, remaining))
+        with self._lock:
+            for index in range(current + 1, last + 1):
+                startup = ranking[index]
+                spec_state = {**state, "current_startup_index": index, "current_startup_data": startup}
+                prepared = None
+                if self.prepare is not None:
+                    # 준비 단계를 브랜치보다 먼저 제출 (FIFO이므로 브랜치가 대기해도 교착 없음)
+                    name, fn = self.prepare
+                    key = self._key(name, index, startup)
+                    prepared = self._futures.get(key)
+                    if prepared is None:
+                        prepared = self._futures[key] = self._executor.submit(bind_context(fn), spec_state)
+                for branch, fn in self.branches.items():
+                    key = self._key(branch, index, startup)
+                    if key not in self._futures:
+                        self._futures[key] = self._executor.submit(
+                            bind_context(self._run_branch), fn, spec_state, prepared)
+
+    @staticmethod
+    def _run_branch(fn: Callable[[GraphState], dict], state: GraphState, prepared: Optional[Future]) -> dict:
+        if prepared is not None:
+            try:
+                state = {**state, **prepared.result()}
+            except Exception:
+                pass  # 준비 단계 실패 시 브랜치는 기존 방식(개별 검색)으로 실행
+        return fn(state)
+
+    def take(self, branch: str, state: GraphState) -> Optional[dict]:
+        """선행 분석 결과가 있으면 (완료까지 대기 후) 반환, 없거나 실패했으면 None"""
+        key = self._key(branch, state["current_startup_index"], state["current_startup_data"])
+        with self._lock:
+            fut = self._futures.pop(key, None)
+        if fut is None or fut.cancelled():
+            return None
+        try:
+            result = fut.result()
+        except Exception as e:
+            print(f"--- (SPEC) 선행 분석 실패, 다시 실행합니다 ({branch}): {e} ---")
+            return None
+        self.used += 1
+        return result
+
+    def discard(self) -> None:
+        """남은 선행 분석 작업 폐기 (루프 종료 시)"""
+        with self._lock:
+            futures, self._futures = self._futures, {}
+        for fut in futures.values():
+            fut.cancel()
+        self.discarded += len(futures)
+        if futures:
+            print(f"--- (SPEC) 사용되지 않은 선행 분석 {len(futures)}건 폐기 ---")
+
+    def close(self) -> None:
+        """작업 종료: 남은 작업 폐기 후 작업 스레드 반환"""
+        self.discard()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+# 작업(job) 단위 선행 분석 범위: {SpeculationPlan: SpeculativePrefetcher}
+_current_scope: contextvars.ContextVar = contextvars.ContextVar("rwa_speculation_scope", default=None)
+_scope_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def speculation_scope():
+    """
+    작업 1건 동안 사용할 선행 분석 범위.
+
+    docstring: Each SpeculationPlan used inside the block gets its own
+               prefetcher, so concurrent jobs running the same compiled
+               graph never take or discard each other's prefetched work.
+               On exit the job's prefetchers are closed.
+    """
+    scope: dict = {}
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        for prefetcher in scope.values():
+            prefetcher.close()
+
+
+class SpeculationPlan:
+    """
+    Prefetcher settings shared by a compiled graph; the prefetcher itself is per job.
+
+    docstring: `current()` returns the prefetcher of the enclosing
+               speculation_scope(), creating it on first use. Outside any
+               scope speculation is disabled (a depth-0 prefetcher), so an
+               unscoped invoke never shares state with another run.
+    """
+
+    def __init__(self, branches: Dict[str, Callable[[GraphState], dict]], depth: int,
+                 max_decisions: int, prepare: Optional[Tuple[str, Callable[[GraphState], dict]]] = None):
+        self.branches = branches
+        self.depth = depth
+        self.max_decisions = max_decisions
+        self.prepare = prepare
+        self._disabled = SpeculativePrefetcher(branches, 0, max_decisions, prepare=prepare)
+
+    def current(self) -> SpeculativePrefetcher:
+        scope = _current_scope.get()
+        if scope is None or self.depth <= 0:
+            return self._disabled
+        with _scope_lock:  # 병렬 브랜치 노드가 같은 범위를 공유
+            prefetcher = scope.get(self)
+            if prefetcher is None:
+                prefetcher = scope[self] = SpeculativePrefetcher(
+                    self.branches, self.depth, self.max_decisions, prepare=self.prepare)
+            return prefetcher
@@ -0,0 +1,67 @@
+# FILE: startup_sources.py
+# (스타트업 목록 소스: JSON / JSONL / CSV 지연 로딩)
+
+import os
+import csv
+import json
+from itertools import islice
+from typing import Dict, Iterator, List
+
+REQUIRED_FIELDS = ("name", "sector", "strength")
+
+
+def _iter_json(path: str) -> Iterator[Dict]:
+    # 기존 startups.json 형식 (배열 하나) - 전체 로드가 불가피하므로 대용량은 JSONL/CSV 권장
+    with open(path, "r", encoding="utf-8") as f:
+        yield from json.load(f)
+
+
+def _iter_jsonl(path: str) -> Iterator[Dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"    ⚠️ {path}:{line_no} 건너뜀 (JSON 오류: {e})")
+
+
+def _iter_csv(path: str) -> Iterator[Dict]:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+_READERS = {".json": _iter_json, ".jsonl": _iter_jsonl, ".ndjson": _iter_jsonl, ".csv": _iter_csv}
+
+
+def iter_startups(path: str) -> Iterator[Dict]:
+    """
+    Lazily yields startup records from a .json, .jsonl/.ndjson or .csv file.
+
+    docstring: JSONL and CSV are read one row at a time, so memory stays
+               flat regardless of list size. Records missing name, sector
+               or strength are skipped with a warning.
+    """
+    reader = _READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"지원하지 않는 스타트업 목록 형식: {path} (.json, .jsonl, .csv)")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} 파일이 없습니다. 프로젝트 루트에 생성해주세요.")
+
+    for record in reader(path):
+        if not isinstance(record, dict) or not all(record.get(k) for k in REQUIRED_FIELDS):
+            print(f"    ⚠️ 필수 필드({', '.join(REQUIRED_FIELDS)}) 누락 항목 건너뜀: {str(record)[:80]}")
+            continue
+        yield record
+
+
+def iter_batches(records: Iterator[Dict], size: int) -> Iterator[List[Dict]]:
+    """이터레이터를 최대 size개씩 묶어 반환"""
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
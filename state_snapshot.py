@@ -0,0 +1,48 @@
+# FILE: state_snapshot.py
+# (최종 GraphState 스냅샷 저장/로드: 에이전트 재실행 없이 보고서 재생성용)
+
+import os
+import json
+from typing import Any, Dict, Optional
+
+STATE_SNAPSHOT_DISABLED = os.getenv("STATE_SNAPSHOT_DISABLED", "").lower() in {"1", "true", "yes"}
+STATE_SNAPSHOT_VERSION = 1
+
+# 보고서 본문은 스냅샷에서 다시 렌더링하므로 저장하지 않음
+_EXCLUDED_KEYS = {"final_report"}
+
+
+def snapshot_path(report_path: str) -> str:
+    """보고서 경로 → 스냅샷 경로 (Final_Investment_Report.md → Final_Investment_Report.state.json)"""
+    return f"{os.path.splitext(report_path)[0]}.state.json"
+
+
+def save_state_snapshot(state: Dict[str, Any], path: str) -> Optional[str]:
+    """
+    Writes the final state as JSON (temp file + rename, so readers never see a partial file).
+
+    docstring: Values that are not JSON-serializable are stored as their
+               string form; everything Agent 6 reads is plain data.
+    """
+    if STATE_SNAPSHOT_DISABLED:
+        return None
+    snapshot = {
+        "snapshot_version": STATE_SNAPSHOT_VERSION,
+        "state": {k: v for k, v in state.items() if k not in _EXCLUDED_KEYS},
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=2, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_state_snapshot(path: str) -> Dict[str, Any]:
+    """스냅샷 → GraphState dict"""
+    with open(path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    if snapshot.get("snapshot_version") != STATE_SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported state snapshot version: {snapshot.get('snapshot_version')!r} ({path})")
+    return snapshot["state"]
@@ -0,0 +1,188 @@
+# FILE: worker_daemon.py
+# (상주 워커 데몬: 컴파일된 그래프/LLM/임베딩/캐시를 메모리에 유지하고 localhost HTTP로 작업 수신)
+
+"""
+Warm worker daemon.
+
+Usage:
+    python worker_daemon.py serve [--host 127.0.0.1] [--port 8765] [--workers 2]
+    python worker_daemon.py submit --persona aggressive [--startups startups.json] [--report out.md]
+    python worker_daemon.py submit --answers 5,4,2,1,5
+    python worker_daemon.py status
+
+Endpoints:
+    GET  /health   liveness + job counters
+    GET  /stats    search / LLM / embedding cache statistics
+    POST /jobs     run one job (JSON body, same fields as jobs.build_initial_state)
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from metrics import run_metrics
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class WarmWorker:
+    """Holds the compiled main graph and warmed shared resources for the process lifetime."""
+
+    def __init__(self, workers: int):
+        started = time.perf_counter()
+        import config
+        from main import build_main_graph
+
+        config.warm_up() # LLM 클라이언트, Tavily, 임베딩 모델 미리 로드
+        self.config = config
+        self.app = build_main_graph()
+        self.slots = threading.BoundedSemaphore(max(1, workers))
+        self.started_at = time.time()
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self._lock = threading.Lock()
+        print(f"✅ Warm worker ready in {time.perf_counter() - started:.1f}s")
+
+    def run(self, job: dict) -> dict:
+        from jobs import run_job
+
+        with self.slots:
+            record = run_job(self.app, job)
+        with self._lock:
+            if record["status"] == "ok":
+                self.jobs_completed += 1
+            else:
+                self.jobs_failed += 1
+        return record
+
+    def health(self) -> dict:
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+        }
+
+    def stats(self) -> dict:
+        return {
+            "search": self.config.get_search_cache_stats(),  # 작업별 메모/중복 제거 건수는 작업 결과의 "search"
+            "llm_cache": self.config.get_llm_cache_stats(),
+            "embedding_cache": self.config.get_embedding_cache_stats(),
+            "metrics": run_metrics.snapshot(),
+        }
+
+
+def _make_handler(worker: WarmWorker):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, code: int, payload: dict) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, worker.health())
+            elif self.path == "/stats":
+                self._send(200, worker.stats())
+            else:
+                self._send(404, {"error": f"unknown path {self.path}"})
+
+        def do_POST(self):
+            if self.path != "/jobs":
+                self._send(404, {"error": f"unknown path {self.path}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                job = json.loads(self.rfile.read(length) or b"{}")
+            except (ValueError, json.JSONDecodeError) as e:
+                self._send(400, {"error": f"invalid JSON body: {e}"})
+                return
+            record = worker.run(job)
+            self._send(200 if record["status"] == "ok" else 422, record)
+
+        def log_message(self, fmt, *args):
+            print(f"--- (DAEMON) {self.address_string()} {fmt % args} ---")
+
+    return Handler
+
+
+def serve(host: str, port: int, workers: int) -> None:
+    worker = WarmWorker(workers)
+    server = ThreadingHTTPServer((host, port), _make_handler(worker))
+    print(f"🚀 Worker daemon listening on http://{host}:{port} (workers={workers})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def _request(url: str, payload: dict = None, timeout: float = 3600) -> dict:
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return json.loads(e.read())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="RWA investment agent warm worker daemon")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_serve = sub.add_parser("serve", help="start the daemon")
+    p_serve.add_argument("--host", default=DEFAULT_HOST)
+    p_serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    p_serve.add_argument("--workers", type=int, default=2, help="max concurrent jobs")
+
+    p_submit = sub.add_parser("submit", help="submit one job and wait for the result")
+    p_submit.add_argument("--host", default=DEFAULT_HOST)
+    p_submit.add_argument("--port", type=int, default=DEFAULT_PORT)
+    group = p_submit.add_mutually_exclusive_group(required=True)
+    group.add_argument("--persona", choices=["aggressive", "conservative"])
+    group.add_argument("--answers", help="five comma-separated answers (1-5) to Agent 0's questions")
+    p_submit.add_argument("--startups", dest="startups_path")
+    p_submit.add_argument("--report", dest="report_path")
+    p_submit.add_argument("--job-id")
+
+    p_status = sub.add_parser("status", help="show daemon health and cache stats")
+    p_status.add_argument("--host", default=DEFAULT_HOST)
+    p_status.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.host, args.port, args.workers)
+        return 0
+
+    base = f"http://{args.host}:{args.port}"
+    if args.command == "status":
+        print(json.dumps({"health": _request(f"{base}/health"), "stats": _request(f"{base}/stats")},
+                         indent=2, ensure_ascii=False))
+        return 0
+
+    job = {
+        "job_id": args.job_id,
+        "persona": args.persona,
+        "persona_answers": [int(a) for a in args.answers.split(",")] if args.answers else None,
+        "startups_path": args.startups_path,
+        "report_path": args.report_path,
+    }
+    record = _request(f"{base}/jobs", {k: v for k, v in job.items() if v is not None})
+    print(json.dumps(record, indent=2, ensure_ascii=False))
+    return 0 if record.get("status") == "ok" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())